@@ -0,0 +1,89 @@
+"""`from hginstaller import HgInstaller` 의 import 시간 검사
+
+새 인터프리터에서 `python -X importtime` 으로 여러 번 import 해서 hginstaller 의 누적 import 시간
+(최소값) 을 재고, 예산을 넘거나 무거운 모듈(setuptools 등) 을 불러오면 exit code 1 로 끝난다.
+CI 에서 import 비용 회귀를 잡는 용도로 쓴다.
+
+    python benchmarks/bench_import.py --budget-ms 50
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# HgInstaller import 만으로는 불러오면 안 되는 모듈
+FORBIDDEN_MODULES = ("setuptools", "Cython", "platformdirs", "PyInstaller")
+# 기본 누적 import 시간 예산 (ms)
+BUDGET_MS = 50.0
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def measure(statement: str) -> tuple[int, set]:
+    """새 인터프리터에서 statement 를 실행하고 (hginstaller 누적 import 시간 us, import 된 모듈 이름들)."""
+    env = dict(os.environ, PYTHONPATH=str(ROOT) + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    cumulative = 0
+    modules = set()
+    for line in completed.stderr.splitlines():
+        match = _LINE.match(line)
+        if not match:
+            continue
+        name = match.group(4)
+        modules.add(name)
+        if name == "hginstaller":
+            cumulative = int(match.group(2))
+    return cumulative, modules
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--budget-ms", type=float, default=BUDGET_MS, help="허용하는 누적 import 시간 (ms)"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수 (최소값 사용)")
+    parser.add_argument(
+        "--statement",
+        default="from hginstaller import HgInstaller",
+        help="측정할 import 문",
+    )
+    args = parser.parse_args()
+
+    best = None
+    modules: set = set()
+    for _ in range(args.repeat):
+        cumulative, modules = measure(args.statement)
+        best = cumulative if best is None else min(best, cumulative)
+
+    loaded = sorted(m for m in FORBIDDEN_MODULES if m in modules)
+    best_ms = (best or 0) / 1000
+    print(f"{args.statement!r} : {best_ms:.1f} ms (budget {args.budget_ms:.1f} ms)")
+
+    ok = True
+    if best_ms > args.budget_ms:
+        print("❌ import 시간이 예산을 넘었습니다")
+        ok = False
+    if loaded:
+        print(f"❌ import 시점에 불러오면 안 되는 모듈: {', '.join(loaded)}")
+        ok = False
+    if ok:
+        print("✅ OK")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
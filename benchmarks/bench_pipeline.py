@@ -0,0 +1,154 @@
+"""빌드 파이프라인 벤치마크 (Linux 기준)
+
+합성 프로젝트와 외부 도구 대역을 임시 폴더에 만들고 다음을 측정해서 JSON 으로 저장한다.
+- find_pyd_target (manifest 없음 / 있음)
+- py2pyd 전체 빌드(cold), 변경 없음(no-op), 모듈 하나 변경
+- LocalSettings save/load 왕복
+- HgInstaller.run 첫 실행 / 변경 없는 재실행 (pyinstaller, pyi-makespec, ISCC 는 대역)
+
+버전 간 비교:
+    python benchmarks/bench_pipeline.py --modules 200 --output before.json
+    (코드 변경 후)
+    python benchmarks/bench_pipeline.py --modules 200 --output after.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from synthetic import make_project, make_stub_tools  # noqa: E402
+
+
+def _measure(results: dict, name: str, func, repeat: int = 1, quiet: bool = True) -> float:
+    """func 를 repeat 번 실행해서 가장 빠른 시간을 results[name] 에 기록한다."""
+    best = None
+    for _ in range(repeat):
+        buffer = StringIO()
+        start = time.perf_counter()
+        if quiet:
+            with redirect_stdout(buffer):
+                func()
+        else:
+            func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    results[name] = round(best, 4)
+    print(f"{name:<36} {best:9.3f}s")
+    return best
+
+
+def run_benchmarks(args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        # GlobalSettings / 컴파일 캐시가 실제 사용자 설정을 건드리지 않도록 격리
+        os.environ["XDG_CONFIG_HOME"] = str(tmp / "config")
+        tools = make_stub_tools(tmp / "bin")
+        os.environ["PATH"] = str(tools["bin_dir"]) + os.pathsep + os.environ.get("PATH", "")
+
+        from hginstaller import HgInstaller, LocalSettings
+        from hginstaller.py2pyd import find_pyd_target, py2pyd
+
+        project = make_project(
+            tmp / "project",
+            modules=args.modules,
+            depth=args.depth,
+            module_lines=args.module_lines,
+            ui_files=args.ui_files,
+        )
+        src = project / "src"
+        pyd = project / "build_src" / "src_pyd"
+        results: dict = {}
+
+        def _scan():
+            return find_pyd_target(src, pyd)
+
+        def _build():
+            return py2pyd(src, pyd, workers=args.workers)
+
+        _measure(results, "find_pyd_target.no_manifest", _scan)
+        _measure(results, "py2pyd.cold", _build)
+        _measure(results, "find_pyd_target.manifest", _scan, repeat=args.repeat)
+        _measure(results, "py2pyd.noop", _build, repeat=args.repeat)
+
+        changed = next(src.rglob("mod0.py"))
+        changed.write_text(changed.read_text(encoding="utf-8") + "\n# changed\n", encoding="utf-8")
+        _measure(results, "py2pyd.one_changed", _build)
+
+        LocalSettings.set_project_path(tmp / "settings")
+
+        def _settings_roundtrip():
+            for i in range(args.settings_ops):
+                LocalSettings.save(f"section{i % 5}", {"value": i, "items": list(range(20))})
+                LocalSettings.load(f"section{i % 5}")
+
+        _measure(
+            results,
+            f"settings.roundtrip_x{args.settings_ops}",
+            _settings_roundtrip,
+            repeat=args.repeat,
+        )
+
+        with redirect_stdout(StringIO()):
+            HgInstaller.set_iss_path(str(tools["iscc"]))
+            installer = HgInstaller("Synthetic", str(project), "init")
+
+        def _run():
+            return installer.run(ui_build=args.ui_files > 0)
+
+        _measure(results, "hginstaller.run.first", _run)
+        _measure(results, "hginstaller.run.noop", _run, repeat=args.repeat)
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--modules", type=int, default=100, help="합성 모듈 수")
+    parser.add_argument("--depth", type=int, default=2, help="패키지 중첩 깊이")
+    parser.add_argument("--module-lines", type=int, default=20, help="모듈 하나의 줄 수")
+    parser.add_argument("--ui-files", type=int, default=0, help=".ui 파일 수")
+    parser.add_argument("--workers", type=int, default=None, help="py2pyd workers")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수 (최소값 기록)")
+    parser.add_argument("--settings-ops", type=int, default=200, help="settings save/load 횟수")
+    parser.add_argument("--output", default="bench_results.json", help="결과 JSON 경로")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+
+    try:
+        import Cython
+        cython_version = Cython.__version__
+    except ImportError:
+        cython_version = None
+    from hginstaller import __version__
+
+    report = {
+        "meta": {
+            "hginstaller": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cython": cython_version,
+            "cpu_count": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "params": {k: v for k, v in vars(args).items() if k != "output"},
+        "results": results,
+    }
+    Path(args.output).write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+    print(f"results -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
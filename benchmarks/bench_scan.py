@@ -0,0 +1,85 @@
+"""find_pyd_target 스캔 시간 벤치마크
+
+합성 프로젝트(기본 10,000 모듈)를 임시 폴더에 만들고
+- manifest 가 없을 때 (첫 스캔, 모든 소스 해시 계산)
+- manifest 가 있을 때 (stat 만으로 판단하는 일반적인 재빌드 상황)
+의 find_pyd_target 소요 시간을 측정한다.
+
+사용법:
+    python benchmarks/bench_scan.py --modules 10000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import sysconfig
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from hginstaller.py2pyd import find_pyd_target, py2pyd  # noqa: E402
+
+
+def make_tree(root: Path, modules: int, per_package: int = 50) -> tuple[Path, Path]:
+    """src/ 아래 modules 개의 .py 와 out/ 아래 대응 확장 모듈(빈 파일)을 만든다."""
+    src = root / "src"
+    out = root / "out"
+    ext_suffix = sysconfig.get_config_var("EXT_SUFFIX")
+    for i in range(modules):
+        pkg = Path(f"pkg{i // per_package // 20}") / f"sub{i // per_package}"
+        (src / pkg).mkdir(parents=True, exist_ok=True)
+        (out / pkg).mkdir(parents=True, exist_ok=True)
+        (src / pkg / f"mod{i}.py").write_text(f"def f{i}(x):\n    return x + {i}\n")
+        (out / pkg / f"mod{i}{ext_suffix}").write_bytes(b"")
+    return src, out
+
+
+def legacy_scan(src: Path, out: Path) -> list:
+    """이전 구현 방식 (모듈마다 glob + stat) 의 파일시스템 접근 패턴 재현."""
+    results = []
+    for py_path in src.rglob("*.py"):
+        rel = py_path.relative_to(src)
+        suffix = sysconfig.get_config_var("EXT_SUFFIX")[-4:]
+        candidates = list((out / rel.parent).glob(f"{py_path.stem}.*{suffix}"))
+        if not candidates:
+            results.append(py_path)
+            continue
+        latest = max(candidates, key=lambda p: p.stat().st_mtime)
+        if py_path.stat().st_mtime > latest.stat().st_mtime:
+            results.append(py_path)
+    return results
+
+
+def timed(label: str, func) -> float:
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed:8.3f}s  (targets={len(result)})")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--modules", type=int, default=10_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src, out = make_tree(Path(tmp), args.modules)
+        print(f"synthetic tree: {args.modules} modules")
+
+        timed("legacy glob scan (비교용)", lambda: legacy_scan(src, out))
+        timed("find_pyd_target (manifest 없음)", lambda: find_pyd_target(src, out))
+
+        # 빌드 대상이 없으므로 컴파일 없이 manifest(stat/해시 캐시)만 기록된다
+        py2pyd(src, out)
+        # 두 번째 스캔부터는 manifest 의 stat 캐시로 해시를 재사용
+        timed("find_pyd_target (manifest, 1회차)", lambda: find_pyd_target(src, out))
+        timed("find_pyd_target (manifest, 2회차)", lambda: find_pyd_target(src, out))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""벤치마크용 합성 프로젝트 / 외부 도구 대역(stub) 생성기
+
+- make_project: N 개 모듈, 패키지 깊이, 모듈 크기, .ui 파일 수를 지정해서 프로젝트를 만든다.
+- make_stub_tools: pyinstaller / pyi-makespec / pyside6-uic / ISCC 대역 실행 파일을 만든다.
+  (실제 도구 대신 결과물 파일만 흉내 내므로, 파이프라인 자체의 오버헤드만 측정된다)
+"""
+from __future__ import annotations
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+_UI_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<ui version="4.0">
+ <class>Form{index}</class>
+ <widget class="QWidget" name="Form{index}"/>
+</ui>
+"""
+
+
+def _module_source(index: int, lines: int) -> str:
+    body = [
+        f"def func_{index}_{i}(x):\n    return x * {i} + {index}\n"
+        for i in range(max(1, lines // 2))
+    ]
+    return "".join(body)
+
+
+def make_project(
+    root: str | Path,
+    modules: int = 100,
+    depth: int = 2,
+    module_lines: int = 20,
+    ui_files: int = 0,
+    per_package: int = 20,
+) -> Path:
+    """root 아래에 src/ 패키지 트리와 main.py, pyproject.toml 을 가진 프로젝트를 만든다.
+
+    - modules: .py 모듈 수 (__init__.py 제외)
+    - depth: 패키지 중첩 깊이 (src/p0/p0_1/... 형태)
+    - module_lines: 모듈 하나의 대략적인 줄 수
+    - ui_files: src/ui 아래 만들 .ui 파일 수
+    - per_package: 패키지 하나에 들어갈 모듈 수
+    """
+    root = Path(root)
+    src = root / "src"
+    src.mkdir(parents=True, exist_ok=True)
+
+    for i in range(modules):
+        package_index = i // per_package
+        parts = [f"p{package_index}"] + [f"p{package_index}_{level}" for level in range(1, depth)]
+        package_dir = src.joinpath(*parts)
+        if not package_dir.exists():
+            package_dir.mkdir(parents=True)
+            # 각 단계마다 __init__.py
+            for level in range(1, len(parts) + 1):
+                init = src.joinpath(*parts[:level]) / "__init__.py"
+                if not init.exists():
+                    init.write_text("", encoding="utf-8")
+        (package_dir / f"mod{i}.py").write_text(_module_source(i, module_lines), encoding="utf-8")
+
+    if ui_files:
+        ui_dir = src / "ui"
+        ui_dir.mkdir(exist_ok=True)
+        for i in range(ui_files):
+            (ui_dir / f"form{i}.ui").write_text(_UI_TEMPLATE.format(index=i), encoding="utf-8")
+
+    (root / "main.py").write_text("print('hello')\n", encoding="utf-8")
+    (root / "pyproject.toml").write_text(
+        '[project]\nname = "synthetic"\nversion = "0.1.0"\ndependencies = []\n',
+        encoding="utf-8",
+    )
+    return root
+
+
+_PYINSTALLER_STUB = '''
+import pathlib, sys
+argv = sys.argv[1:]
+name = pathlib.Path(argv[-1]).stem
+def _option(flag, default):
+    return pathlib.Path(argv[argv.index(flag) + 1]) if flag in argv else pathlib.Path(default)
+dist = _option("--distpath", "dist") / name
+(_option("--workpath", "build") / name).mkdir(parents=True, exist_ok=True)
+dist.mkdir(parents=True, exist_ok=True)
+(dist / name).write_bytes(b"stub executable")
+(dist / (name + ".exe")).write_bytes(b"stub executable")
+'''
+
+_MAKESPEC_STUB = '''
+import pathlib, sys
+argv = sys.argv[1:]
+spec_dir = pathlib.Path(argv[argv.index("--specpath") + 1])
+name = argv[argv.index("--name") + 1]
+spec_dir.mkdir(parents=True, exist_ok=True)
+(spec_dir / (name + ".spec")).write_text("# stub spec\\n" + repr(argv) + "\\n")
+'''
+
+_UIC_STUB = '''
+import pathlib, sys
+argv = sys.argv[1:]
+out = pathlib.Path(argv[argv.index("-o") + 1])
+out.write_text("# generated from " + argv[0] + "\\n")
+'''
+
+_ISCC_STUB = '''
+import pathlib, re, sys
+text = pathlib.Path(sys.argv[1]).read_text(encoding="utf-8")
+values = dict(re.findall(r'#define (\\w+) "([^"]*)"', text))
+out = pathlib.Path(values["ProjectFolder"]) / "Output"
+out.mkdir(parents=True, exist_ok=True)
+setup_name = values["MyAppName"] + "_" + values["MyAppVersion"] + "_Setup.exe"
+(out / setup_name).write_bytes(b"stub installer")
+'''
+
+
+def _write_tool(bin_dir: Path, name: str, code: str) -> Path:
+    script = bin_dir / f"{name}_stub.py"
+    script.write_text(code.lstrip(), encoding="utf-8")
+    if os.name == "nt":
+        launcher = bin_dir / f"{name}.bat"
+        launcher.write_text(f'@"{sys.executable}" "{script}" %*\n', encoding="utf-8")
+    else:
+        launcher = bin_dir / name
+        launcher.write_text(
+            f'#!/bin/sh\nexec "{sys.executable}" "{script}" "$@"\n', encoding="utf-8"
+        )
+        launcher.chmod(launcher.stat().st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+    return launcher
+
+
+def make_stub_tools(bin_dir: str | Path) -> dict:
+    """외부 도구 대역을 bin_dir 에 만든다.
+
+    반환값: {"bin_dir": PATH 에 추가할 폴더, "iscc": ISCC 대역 스크립트 경로}
+    """
+    bin_dir = Path(bin_dir)
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    _write_tool(bin_dir, "pyinstaller", _PYINSTALLER_STUB)
+    _write_tool(bin_dir, "pyi-makespec", _MAKESPEC_STUB)
+    _write_tool(bin_dir, "pyside6-uic", _UIC_STUB)
+    # ISCC 는 GlobalSettings 의 경로로 호출되므로 .py 스크립트를 그대로 지정한다
+    iscc = bin_dir / "ISCC_stub.py"
+    iscc.write_text(_ISCC_STUB.lstrip(), encoding="utf-8")
+    return {"bin_dir": bin_dir, "iscc": iscc}
@@ -8,29 +8,75 @@ PyInstaller, Inno Setup, UI 변환, PYD 변환 등을 자동화하는 라이브
 
 __version__ = "0.1.1"
 
-# 메인 클래스
-from .hg_installer import HgInstaller
+import sys
+import types
+from typing import TYPE_CHECKING
 
-# 설정 관리
-from .hg_settings import LocalSettings, GlobalSettings
+# 공개 이름 -> 정의된 하위 모듈
+# (import 할 때 setuptools / platformdirs 등을 모두 불러오지 않도록, 처음 접근할 때 해당 모듈만 import 한다)
+_LAZY_ATTRS = {
+    # 메인 클래스
+    "HgInstaller": ".hg_installer",
+    # 설정 관리
+    "LocalSettings": ".hg_settings",
+    "GlobalSettings": ".hg_settings",
+    # PyInstaller 빌드 유틸리티
+    "pyi_maker": ".pyi_builder",
+    # PYD 변환
+    "py2pyd": ".py2pyd",
+    "Py2PydBuilder": ".py2pyd",
+    # Inno Setup 빌드 유틸리티
+    "init_iss": ".inno_builder",
+    "run_inno": ".inno_builder",
+    # UI 변환
+    "convert_ui_to_py": ".ui2py",
+    "convert_all_ui_files_in_directory": ".ui2py",
+    # pyproject.toml 유틸리티
+    "get_dependencies_from_pyproject": ".pyproject_utils",
+    "get_optional_dependencies_from_pyproject": ".pyproject_utils",
+}
+
+if TYPE_CHECKING:
+    # 정적 분석기 / IDE 용 (실행 시에는 import 하지 않음)
+    from .hg_installer import HgInstaller
+    from .hg_settings import LocalSettings, GlobalSettings
+    from .pyi_builder import pyi_maker
+    from .py2pyd import py2pyd, Py2PydBuilder
+    from .inno_builder import init_iss, run_inno
+    from .ui2py import convert_ui_to_py, convert_all_ui_files_in_directory
+    from .pyproject_utils import (
+        get_dependencies_from_pyproject,
+        get_optional_dependencies_from_pyproject,
+    )
+
+
+def __getattr__(name):
+    """PEP 562: 공개 이름에 처음 접근할 때 하위 모듈을 import 한다."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    # 다음부터는 __getattr__ 를 거치지 않도록 캐시
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-# PyInstaller 빌드 유틸리티
-from .pyi_builder import pyi_maker
 
-# PYD 변환
-from .py2pyd import py2pyd
+class _LazyModule(types.ModuleType):
+    def __setattr__(self, name, value):
+        # 하위 모듈 hginstaller.py2pyd 가 import 되면서 같은 이름의 공개 함수 py2pyd 를 가리지 않도록 한다
+        if isinstance(value, types.ModuleType) and _LAZY_ATTRS.get(name) == "." + name:
+            return
+        super().__setattr__(name, value)
 
-# Inno Setup 빌드 유틸리티
-from .inno_builder import init_iss, run_inno
 
-# UI 변환
-from .ui2py import convert_ui_to_py, convert_all_ui_files_in_directory
+sys.modules[__name__].__class__ = _LazyModule
 
-# pyproject.toml 유틸리티
-from .pyproject_utils import (
-    get_dependencies_from_pyproject,
-    get_optional_dependencies_from_pyproject,
-)
 
 __all__ = [
     # 버전
@@ -44,6 +90,7 @@ __all__ = [
     "pyi_maker",
     # PYD 변환
     "py2pyd",
+    "Py2PydBuilder",
     # Inno Setup
     "init_iss",
     "run_inno",
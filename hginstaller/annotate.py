@@ -0,0 +1,125 @@
+"""Cython annotate HTML 을 모듈/함수별 "노란 줄" 통계로 모은다.
+
+- 노란 줄: Python C-API 를 거치는 줄 (annotate HTML 의 score > 0)
+- score: Cython 이 매기는 줄별 Python 상호작용 점수 (클수록 진한 노란색)
+- py2pyd(annotate=True) 가 모든 모듈의 HTML 을 만든 뒤 summarize_annotations 로 요약한다.
+"""
+from __future__ import annotations
+
+import ast
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# <pre class="cython line score-15" ...>+<span class="">2</span>: ...
+_LINE = re.compile(r'<pre class="cython line score-(\d+)"[^>]*>.*?<span class="">(\d+)</span>:')
+
+MODULE_SCOPE = "<module>"
+
+
+def parse_annotation_html(html_path: str | Path) -> Dict[int, int]:
+    """annotate HTML 에서 {소스 줄 번호: score} 를 읽는다."""
+    text = Path(html_path).read_text(encoding="utf-8", errors="replace")
+    return {int(lineno): int(score) for score, lineno in _LINE.findall(text)}
+
+
+def _scopes(py_path: Path) -> List[Tuple[str, int, int]]:
+    """소스의 함수/클래스 범위 [(qualname, 시작 줄, 끝 줄)] (바깥 → 안쪽 순)."""
+    try:
+        tree = ast.parse(py_path.read_text(encoding="utf-8"), filename=str(py_path))
+    except (SyntaxError, UnicodeDecodeError, OSError):
+        return []
+
+    scopes: List[Tuple[str, int, int]] = []
+
+    def _visit(node, prefix: str) -> None:
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                name = f"{prefix}{child.name}"
+                # 데코레이터 줄도 함수에 포함
+                start = min([child.lineno] + [d.lineno for d in child.decorator_list])
+                scopes.append((name, start, getattr(child, "end_lineno", child.lineno)))
+                _visit(child, name + ".")
+            else:
+                _visit(child, prefix)
+
+    _visit(tree, "")
+    return scopes
+
+
+def _scope_of(line: int, scopes: List[Tuple[str, int, int]]) -> Tuple[str, int]:
+    """line 을 포함하는 가장 안쪽 함수/클래스 (없으면 모듈)."""
+    best = (MODULE_SCOPE, 0)
+    for name, start, end in scopes:
+        if start <= line <= end and start >= best[1]:
+            best = (name, start)
+    return best
+
+
+def summarize_module(module: str, py_path: str | Path, html_path: str | Path) -> dict:
+    """모듈 하나의 노란 줄 수 / score 합계와 함수별 통계."""
+    py_path = Path(py_path)
+    scores = parse_annotation_html(html_path)
+    scopes = _scopes(py_path)
+
+    functions: Dict[str, dict] = {}
+    for line, score in scores.items():
+        if score <= 0:
+            continue
+        name, start = _scope_of(line, scopes)
+        entry = functions.setdefault(
+            name, {"name": name, "lineno": start, "yellow_lines": 0, "score": 0}
+        )
+        entry["yellow_lines"] += 1
+        entry["score"] += score
+
+    ranked = sorted(functions.values(), key=lambda f: (-f["score"], f["name"]))
+    return {
+        "module": module,
+        "source": str(py_path),
+        "html": str(html_path),
+        "yellow_lines": sum(f["yellow_lines"] for f in ranked),
+        "score": sum(f["score"] for f in ranked),
+        "functions": ranked,
+    }
+
+
+def summarize_annotations(modules: List[Tuple[str, Path, Path]], output_path: str | Path) -> dict:
+    """[(모듈명, .py 경로, .html 경로)] 를 요약해서 output_path(JSON) 에 저장한다.
+
+    - modules: score 합계가 큰 순
+    - functions: 전체 모듈의 함수를 score 가 큰 순으로 (타입 지정 작업 우선순위)
+    """
+    entries = [
+        summarize_module(module, py_path, html_path)
+        for module, py_path, html_path in modules
+        if Path(html_path).is_file()
+    ]
+    entries.sort(key=lambda m: (-m["score"], m["module"]))
+    functions = [
+        dict(function, module=entry["module"])
+        for entry in entries
+        for function in entry["functions"]
+    ]
+    functions.sort(key=lambda f: (-f["score"], f["module"], f["name"]))
+    summary = {
+        "total_yellow_lines": sum(m["yellow_lines"] for m in entries),
+        "total_score": sum(m["score"] for m in entries),
+        "modules": entries,
+        "functions": functions,
+    }
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(summary, indent=2, ensure_ascii=False), encoding="utf-8")
+    return summary
+
+
+def print_annotation_summary(summary: dict, top: int = 10) -> None:
+    print("=" * 30)
+    print(f"annotate : 노란 줄 {summary['total_yellow_lines']} 개, score 합계 {summary['total_score']}")
+    print(f"{'score':>7} {'lines':>6}  function")
+    for function in summary["functions"][:top]:
+        where = f"{function['module']}:{function['name']} (line {function['lineno']})"
+        print(f"{function['score']:>7} {function['yellow_lines']:>6}  {where}")
+    print("=" * 30)
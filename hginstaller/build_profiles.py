@@ -0,0 +1,115 @@
+"""py2pyd 최적화 프로필 (컴파일러/링커 플래그 + Cython 컴파일러 지시어)
+
+- debug   : 최적화 없음 + 디버그 정보, Cython 검사 모두 켬
+- release : Python 빌드 기본 최적화, Cython 기본 지시어 (동작은 순수 Python 과 동일)
+- max     : 최대 최적화 + LTO, 경계/음수 인덱스/0 나누기 검사 끔 (검증된 수치 모듈 전용)
+
+모듈별로 다르게 하려면 src 기준 상대경로 glob 으로 덮어쓴다.
+    add_config(build_profile="release", profile_overrides={"core/hot_*.py": "max"})
+값에는 프로필 이름 대신 일부만 바꾸는 dict 도 쓸 수 있다.
+    {"core/fft.py": {"directives": {"cdivision": True}}}
+"""
+from __future__ import annotations
+
+import copy
+import sys
+from fnmatch import fnmatchcase
+from typing import Dict, Optional, Union
+
+# 컴파일러 종류별 플래그는 "msvc" / "unix" 로 나눈다
+PROFILES: Dict[str, dict] = {
+    "debug": {
+        "msvc": {"extra_compile_args": ["/Od", "/Zi"], "extra_link_args": ["/DEBUG"]},
+        "unix": {"extra_compile_args": ["-O0", "-g"], "extra_link_args": ["-g"]},
+        "directives": {
+            "boundscheck": True,
+            "wraparound": True,
+            "initializedcheck": True,
+            "nonecheck": True,
+        },
+    },
+    "release": {
+        # Python 빌드 기본값(sysconfig CFLAGS, MSVC /Ox) 을 그대로 쓴다
+        "msvc": {"extra_compile_args": [], "extra_link_args": []},
+        "unix": {"extra_compile_args": [], "extra_link_args": []},
+        "directives": {},
+    },
+    "max": {
+        "msvc": {"extra_compile_args": ["/O2", "/GL"], "extra_link_args": ["/LTCG"]},
+        "unix": {"extra_compile_args": ["-O3", "-flto"], "extra_link_args": ["-O3", "-flto"]},
+        "directives": {
+            "boundscheck": False,
+            "wraparound": False,
+            "initializedcheck": False,
+            "cdivision": True,
+        },
+    },
+}
+
+ProfileSpec = Union[str, dict]
+
+
+def _compiler_kind() -> str:
+    return "msvc" if sys.platform == "win32" else "unix"
+
+
+def _merge(base: dict, override: dict) -> dict:
+    """프로필 dict 에 일부 덮어쓰기 (directives 는 키 단위로 합친다)."""
+    result = copy.deepcopy(base)
+    for key, value in override.items():
+        if key == "directives":
+            result.setdefault("directives", {}).update(value)
+        elif key in ("msvc", "unix"):
+            result.setdefault(key, {}).update(value)
+        else:
+            raise ValueError(f"알 수 없는 프로필 항목: {key}")
+    return result
+
+
+def _lookup(spec: ProfileSpec, base: Optional[dict]) -> dict:
+    if isinstance(spec, str):
+        if spec not in PROFILES:
+            raise ValueError(f"알 수 없는 빌드 프로필: {spec} (사용 가능: {', '.join(PROFILES)})")
+        return copy.deepcopy(PROFILES[spec])
+    if isinstance(spec, dict):
+        return _merge(base or PROFILES["release"], spec)
+    raise ValueError(f"빌드 프로필은 이름 또는 dict 여야 합니다: {spec!r}")
+
+
+class BuildProfiles:
+    """기본 프로필 + 모듈별 glob 덮어쓰기를 모듈마다 Extension 옵션으로 풀어 준다."""
+
+    def __init__(
+        self,
+        profile: Optional[ProfileSpec] = None,
+        overrides: Optional[Dict[str, ProfileSpec]] = None,
+    ):
+        self.profile = profile
+        self.overrides = dict(overrides or {})
+        self._base = _lookup(profile, None) if profile is not None else None
+        # 잘못된 설정은 빌드 전에 알 수 있도록 미리 확인
+        for spec in self.overrides.values():
+            _lookup(spec, self._base)
+
+    def resolve(self, module_key: str) -> Optional[dict]:
+        """module_key(src 기준 posix 상대경로) 에 적용할 프로필. 설정이 없으면 None."""
+        resolved = self._base
+        for pattern, spec in self.overrides.items():
+            if fnmatchcase(module_key, pattern):
+                resolved = _lookup(spec, resolved)
+        return resolved
+
+    def options_for(self, module_key: str) -> dict:
+        """Extension 에 넘길 옵션 {"extra_compile_args", "extra_link_args", "cython_directives"}.
+
+        - 프로필이 없으면 빈 dict (기존과 같은 기본 빌드).
+        """
+        resolved = self.resolve(module_key)
+        if resolved is None:
+            return {}
+        flags = resolved.get(_compiler_kind(), {})
+        return {
+            "extra_compile_args": list(flags.get("extra_compile_args", [])),
+            "extra_link_args": list(flags.get("extra_link_args", [])),
+            "cython_directives": dict(resolved.get("directives", {})),
+        }
@@ -0,0 +1,222 @@
+"""PyInstaller 결과물(dist) 의 크기 분석과 빌드 간 비교
+
+- dist 를 한 번만 돌면서 파일 크기를 배포판 / 최상위 패키지 / 종류(확장 모듈, 바이너리, Python, 데이터) 별로 나눈다.
+- 같은 크기의 바이너리끼리만 해시를 계산해서 내용이 같은 중복 파일을 찾는다.
+- 빌드마다 요약(snapshot) 을 build_src/SNAPSHOT_NAME 에 쌓고, 이전 빌드와의 차이를 보여 준다.
+- onedir 기준이다. onefile 은 실행 파일 하나로만 집계된다.
+"""
+from __future__ import annotations
+
+import os
+import time
+from importlib.machinery import EXTENSION_SUFFIXES
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from .fingerprint import hash_file, load_state, save_state
+
+# build_src 에 쌓는 빌드별 크기 기록
+SNAPSHOT_NAME = "bundle_sizes.json"
+# 보관하는 snapshot 개수
+MAX_SNAPSHOTS = 20
+# snapshot 에 파일 단위로 남기는 최소 크기 (작은 파일은 패키지 합계로만 기록)
+FILE_THRESHOLD = 256 * 1024
+
+# PyInstaller 가 모듈 대신 결과물 최상위에 두는 항목 이름
+ROOT_PACKAGE = "<root>"
+_BINARY_SUFFIXES = (".dll", ".dylib", ".so")
+_PYTHON_SUFFIXES = (".py", ".pyc", ".pyz", ".zip")
+# 태그가 붙은 확장 모듈 접미사 (.cpython-311-x86_64-linux-gnu.so 등). 태그 없는 .so 는 제외
+_EXTENSION_SUFFIXES = tuple(suffix for suffix in EXTENSION_SUFFIXES if suffix != ".so") + (".pyd",)
+
+
+class DuplicateGroup(NamedTuple):
+    size: int                   # 파일 하나의 크기
+    paths: List[str]            # dist 기준 상대경로 (2개 이상)
+
+    @property
+    def wasted(self) -> int:
+        return self.size * (len(self.paths) - 1)
+
+
+def _content_root(dist_dir: Path) -> Path:
+    """모듈이 풀리는 기준 폴더 (PyInstaller 6 은 _internal)."""
+    internal = dist_dir / "_internal"
+    return internal if internal.is_dir() else dist_dir
+
+
+def _category(name: str, is_executable: bool) -> str:
+    if is_executable:
+        return "executable"
+    # 태그 없는 .so 는 libfoo.so 같은 일반 공유 라이브러리가 대부분이므로 바이너리로 본다
+    if name.endswith(_EXTENSION_SUFFIXES):
+        return "extension"
+    if name.endswith(_BINARY_SUFFIXES) or ".so." in name:
+        return "binary"
+    if name.endswith(_PYTHON_SUFFIXES):
+        return "python"
+    return "data"
+
+
+def _package_of(rel_parts: tuple) -> str:
+    """최상위 폴더 이름 (numpy.libs / PySide6 등). 최상위 파일은 ROOT_PACKAGE."""
+    if len(rel_parts) == 1:
+        return ROOT_PACKAGE
+    top = rel_parts[0]
+    for suffix in (".libs", ".dist-info", ".egg-info", ".data"):
+        if top.endswith(suffix):
+            return top[: -len(suffix)].split("-")[0]
+    return top
+
+
+def find_dist(build_config: dict) -> Path:
+    """PyInstaller 결과물 (onedir: dist/<이름> 폴더, onefile: dist/<이름> 실행 파일)."""
+    from .pyi_builder import dist_root
+
+    name = build_config["program_name"]
+    root = dist_root(build_config)
+    for candidate in (root / name, root / f"{name}.exe"):
+        if candidate.exists():
+            return candidate
+    raise FileNotFoundError(f"dist 결과물이 없습니다. 먼저 run() 으로 빌드하세요: {root / name}")
+
+
+def analyze_bundle(dist_path: str | Path, top_level: Optional[Dict[str, List[str]]] = None) -> dict:
+    """dist 결과물(onedir 폴더 또는 onefile 실행 파일) 의 크기 요약.
+
+    - top_level: {최상위 모듈: [배포판]} (기본: import_analysis.top_level_distributions)
+    - 반환값: snapshot dict {"created", "total", "files", "by_category", "by_package",
+      "by_distribution", "large_files", "duplicates"}
+    """
+    if top_level is None:
+        from .import_analysis import top_level_distributions
+
+        top_level = top_level_distributions()
+
+    dist_path = Path(dist_path)
+    by_category: Dict[str, int] = {}
+    by_package: Dict[str, int] = {}
+    by_distribution: Dict[str, int] = {}
+    large_files: Dict[str, int] = {}
+    same_size: Dict[int, List[Path]] = {}
+    total = 0
+    count = 0
+
+    if dist_path.is_file():
+        entries = [(dist_path, (dist_path.name,), dist_path.stat().st_size, True)]
+        base = dist_path.parent
+    else:
+        base = dist_path
+        content_root = _content_root(dist_path)
+        entries = []
+        for root, dirs, files in os.walk(dist_path):
+            for name in files:
+                path = Path(root) / name
+                size = path.stat().st_size
+                is_executable = Path(root) == dist_path and path.stem == dist_path.name
+                in_content = content_root in path.parents
+                rel = path.relative_to(content_root if in_content else dist_path)
+                entries.append((path, rel.parts, size, is_executable))
+
+    for path, rel_parts, size, is_executable in entries:
+        total += size
+        count += 1
+        category = _category(path.name, is_executable)
+        package = _package_of(rel_parts)
+        dists = top_level.get(package) or [package]
+        distribution = dists[0] if package != ROOT_PACKAGE else ROOT_PACKAGE
+        by_category[category] = by_category.get(category, 0) + size
+        by_package[package] = by_package.get(package, 0) + size
+        by_distribution[distribution] = by_distribution.get(distribution, 0) + size
+        rel = path.relative_to(base).as_posix()
+        if size >= FILE_THRESHOLD:
+            large_files[rel] = size
+        if category in ("extension", "binary") and size > 0:
+            same_size.setdefault(size, []).append(path)
+
+    # 크기가 같은 바이너리만 해시를 계산한다
+    duplicates: List[DuplicateGroup] = []
+    for size, paths in same_size.items():
+        if len(paths) < 2:
+            continue
+        by_hash: Dict[str, List[str]] = {}
+        for path in paths:
+            by_hash.setdefault(hash_file(path), []).append(path.relative_to(base).as_posix())
+        duplicates.extend(
+            DuplicateGroup(size, sorted(group)) for group in by_hash.values() if len(group) > 1
+        )
+    duplicates.sort(key=lambda d: -d.wasted)
+
+    return {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "dist": str(dist_path),
+        "total": total,
+        "files": count,
+        "by_category": by_category,
+        "by_package": by_package,
+        "by_distribution": by_distribution,
+        "large_files": large_files,
+        "duplicates": [{"size": d.size, "wasted": d.wasted, "paths": d.paths} for d in duplicates],
+    }
+
+
+def record_snapshot(build_src_path: str | Path, snapshot: dict) -> Optional[dict]:
+    """snapshot 을 기록에 추가하고 바로 이전 snapshot 을 돌려준다 (처음이면 None)."""
+    path = Path(build_src_path) / SNAPSHOT_NAME
+    history = load_state(path).get("snapshots", [])
+    previous = history[-1] if history else None
+    history = (history + [snapshot])[-MAX_SNAPSHOTS:]
+    save_state(path, {"snapshots": history})
+    return previous
+
+
+def load_snapshots(build_src_path: str | Path) -> List[dict]:
+    return load_state(Path(build_src_path) / SNAPSHOT_NAME).get("snapshots", [])
+
+
+def size_deltas(previous: dict, current: dict, key: str = "by_distribution") -> List[tuple]:
+    """[(이름, 이전 크기, 현재 크기, 차이)] 차이의 절대값이 큰 순."""
+    before = previous.get(key, {})
+    after = current.get(key, {})
+    rows = [
+        (name, before.get(name, 0), after.get(name, 0), after.get(name, 0) - before.get(name, 0))
+        for name in set(before) | set(after)
+    ]
+    return sorted((row for row in rows if row[3]), key=lambda row: (-abs(row[3]), row[0]))
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def print_bundle_report(current: dict, previous: Optional[dict] = None, top: int = 10) -> None:
+    print("=" * 30)
+    print(f"dist : {_mb(current['total'])} ({current['files']} 파일)")
+    if previous is not None:
+        delta = current["total"] - previous["total"]
+        print(f"이전 빌드({previous['created']}) 대비 : {'+' if delta >= 0 else ''}{_mb(delta)}")
+    categories = sorted(current["by_category"].items(), key=lambda i: -i[1])
+    print("  " + ", ".join(f"{name} {_mb(size)}" for name, size in categories))
+    print("-" * 30)
+    if previous is None:
+        print("배포판별 크기")
+        for name, size in sorted(current["by_distribution"].items(), key=lambda i: -i[1])[:top]:
+            print(f"{_mb(size):>10}  {name}")
+    else:
+        for key, label in (("by_distribution", "배포판"), ("large_files", "파일")):
+            rows = size_deltas(previous, current, key)[:top]
+            if not rows:
+                continue
+            print(f"{label}별 변화")
+            for name, before, after, delta in rows:
+                sign = "+" if delta > 0 else "-"
+                print(f"{sign}{_mb(abs(delta)):>10}  {name} ({_mb(before)} → {_mb(after)})")
+    duplicates = current.get("duplicates", [])
+    if duplicates:
+        print("-" * 30)
+        wasted = sum(d["wasted"] for d in duplicates)
+        print(f"중복 바이너리 {len(duplicates)} 그룹, {_mb(wasted)} 낭비")
+        for group in duplicates[:top]:
+            more = " ..." if len(group["paths"]) > 3 else ""
+            print(f"{_mb(group['wasted']):>10}  {', '.join(group['paths'][:3])}{more}")
+    print("=" * 30)
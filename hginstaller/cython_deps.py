@@ -0,0 +1,254 @@
+"""Cython 모듈 간 의존성(cimport / include / .pxd) 그래프 유틸리티
+
+py2pyd 의 증분 빌드에서 공용 .pxd / .pxi 가 바뀌었을 때
+그것을 (전이적으로) 참조하는 모듈만 다시 빌드하기 위해 사용한다.
+"""
+from __future__ import annotations
+
+import os
+import re
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+# 의존성을 가질 수 있는 Cython 관련 소스 확장자
+SOURCE_SUFFIXES = (".py", ".pyx", ".pxd", ".pxi")
+
+# cimport a.b / cimport a.b as c, d
+_CIMPORT_RE = re.compile(r"^\s*cimport\s+(.+)$")
+# from a.b cimport x, y / from . cimport x
+_FROM_CIMPORT_RE = re.compile(r"^\s*from\s+(\.*[\w.]*)\s+cimport\s+(.+)$")
+# include "a.pxi"
+_INCLUDE_RE = re.compile(r"""^\s*include\s+['"]([^'"]+)['"]""")
+
+DependencyGraph = Dict[Path, Set[Path]]
+
+
+def _strip_comment(line: str) -> str:
+    return line.split("#", 1)[0].rstrip()
+
+
+def _split_names(names: str) -> List[str]:
+    """"a, b as c, (d)" -> ["a", "b", "d"]"""
+    result = []
+    for part in names.replace("(", "").replace(")", "").split(","):
+        name = part.strip().split(" as ")[0].strip()
+        if name:
+            result.append(name)
+    return result
+
+
+def _resolve_module(
+    dotted: str,
+    current: Path,
+    input_root: Path,
+) -> Optional[Path]:
+    """cimport 대상 모듈 이름을 input_root 안의 .pxd 파일로 변환한다.
+
+    - 상대 이름(.x, ..x)은 현재 파일 위치 기준
+    - 절대 이름은 input_root 기준, 없으면 현재 파일 폴더 기준
+    - input_root 밖(cython, libc 등)은 None
+    """
+    if dotted.startswith("."):
+        level = len(dotted) - len(dotted.lstrip("."))
+        base = current.parent
+        for _ in range(level - 1):
+            base = base.parent
+        parts = [p for p in dotted.lstrip(".").split(".") if p]
+        candidates = [base.joinpath(*parts)] if parts else []
+    else:
+        parts = dotted.split(".")
+        candidates = [input_root.joinpath(*parts), current.parent.joinpath(*parts)]
+
+    for candidate in candidates:
+        pxd = candidate.with_suffix(".pxd")
+        if pxd.is_file():
+            return pxd
+        init_pxd = candidate / "__init__.pxd"
+        if init_pxd.is_file():
+            return init_pxd
+    return None
+
+
+def _resolve_include(name: str, current: Path, input_root: Path) -> Optional[Path]:
+    for base in (current.parent, input_root):
+        candidate = base / name
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _resolve(kind: str, name: str, current: Path, input_root: Path) -> Optional[Path]:
+    if kind == "include":
+        return _resolve_include(name, current, input_root)
+    return _resolve_module(name, current, input_root)
+
+
+def _scan_source(source: Path, input_root: Path) -> Tuple[Set[Path], List[List[str]]]:
+    """파일 하나의 (직접 의존성, 찾지 못한 [종류, 이름] 목록).
+
+    찾지 못한 cimport / include 는 나중에 .pxd 가 생기면 의존성이 되므로 따로 돌려준다.
+    """
+    deps: Set[Path] = set()
+    unresolved: List[List[str]] = []
+
+    # a.py / a.pyx 옆의 a.pxd 는 선언 파일로 자동 적용된다
+    if source.suffix in (".py", ".pyx"):
+        sibling = source.with_suffix(".pxd")
+        if sibling.is_file():
+            deps.add(sibling)
+
+    try:
+        text = source.read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return deps, unresolved
+
+    def _add(kind: str, name: str) -> None:
+        resolved = _resolve(kind, name, source, input_root)
+        if resolved is not None:
+            deps.add(resolved)
+        elif [kind, name] not in unresolved:
+            unresolved.append([kind, name])
+
+    for raw in text.splitlines():
+        line = _strip_comment(raw)
+        if not line:
+            continue
+
+        match = _FROM_CIMPORT_RE.match(line)
+        if match:
+            package, names = match.groups()
+            if package.strip("."):
+                _add("cimport", package)
+            # from pkg cimport mod 처럼 서브모듈을 가져오는 경우
+            prefix = package if package.endswith(".") else package + "."
+            for name in _split_names(names):
+                _add("cimport", prefix + name)
+            continue
+
+        match = _CIMPORT_RE.match(line)
+        if match:
+            for name in _split_names(match.group(1)):
+                _add("cimport", name)
+            continue
+
+        match = _INCLUDE_RE.match(line)
+        if match:
+            _add("include", match.group(1))
+
+    deps.discard(source)
+    return deps, unresolved
+
+
+def scan_dependencies(source: Path, input_root: Path) -> Set[Path]:
+    """파일 하나의 직접 의존성(input_root 안의 파일) 집합을 구한다."""
+    return _scan_source(source, input_root)[0]
+
+
+def relative_key(path: Path, root: Path) -> str:
+    """root 기준 posix 상대경로. 대량 스캔에서 Path.relative_to 비용을 피하기 위해 문자열로 처리한다."""
+    path_str = str(path)
+    root_str = str(root)
+    if path_str.startswith(root_str) and path_str[len(root_str):len(root_str) + 1] in ("/", os.sep):
+        rel = path_str[len(root_str) + 1:]
+        return rel.replace(os.sep, "/") if os.sep != "/" else rel
+    return path.relative_to(root).as_posix()
+
+
+def _stat_matches(entry: dict, st: os.stat_result) -> bool:
+    return entry.get("size") == st.st_size and entry.get("mtime_ns") == st.st_mtime_ns
+
+
+def build_dependency_graph(
+    input_root: str | Path,
+    files: Optional[Dict[Path, os.stat_result]] = None,
+    file_cache: Optional[Dict[str, dict]] = None,
+) -> DependencyGraph:
+    """input_root 아래 모든 Cython 관련 소스의 직접 의존성 그래프를 만든다.
+
+    - files: 이미 스캔한 {파일: stat} 이 있으면 다시 디렉토리를 돌지 않는다.
+    - file_cache: {posix 상대경로: {"size", "mtime_ns", "deps", "unresolved"}} 형태의 이전 스캔 결과.
+      크기/수정시간이 같으면 파일을 다시 읽지 않고, 새로 읽은 결과는 여기에 갱신한다.
+      찾지 못했던 cimport / include ("unresolved") 는 매번 다시 찾아서 새로 생긴 .pxd 를 반영한다.
+
+    반환값: {파일: {직접 의존하는 파일, ...}}
+    """
+    input_root = Path(input_root)
+    if files is None:
+        files = {
+            path: path.stat()
+            for path in input_root.rglob("*")
+            if path.suffix in SOURCE_SUFFIXES and path.is_file()
+        }
+
+    graph: DependencyGraph = {}
+    for path, st in files.items():
+        if path.suffix not in SOURCE_SUFFIXES:
+            continue
+        if file_cache is None:
+            graph[path] = scan_dependencies(path, input_root)
+            continue
+
+        key = relative_key(path, input_root)
+        entry = file_cache.get(key)
+        if entry is not None and "unresolved" in entry and _stat_matches(entry, st):
+            deps = {input_root / dep for dep in entry["deps"]}
+            # 의존 파일이 사라졌으면 다시 스캔, 새로 생긴 .pxd 선언 파일은 바로 반영
+            if all(dep in files for dep in deps):
+                sibling = path.with_suffix(".pxd")
+                if path.suffix in (".py", ".pyx") and sibling in files:
+                    deps.add(sibling)
+                for kind, name in entry["unresolved"]:
+                    resolved = _resolve(kind, name, path, input_root)
+                    if resolved is not None:
+                        deps.add(resolved)
+                graph[path] = deps
+                continue
+
+        deps, unresolved = _scan_source(path, input_root)
+        graph[path] = deps
+        if entry is None or not _stat_matches(entry, st):
+            # 파일이 바뀌었으면 이전 해시 등도 무효
+            entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+            file_cache[key] = entry
+        entry["deps"] = sorted(relative_key(dep, input_root) for dep in deps)
+        entry["unresolved"] = unresolved
+    return graph
+
+
+def transitive_dependencies(graph: DependencyGraph, source: Path) -> Dict[Path, List[Path]]:
+    """source 가 전이적으로 의존하는 모든 파일과, 거기까지의 경로를 구한다.
+
+    반환값: {의존 파일: [source, 중간 파일..., 의존 파일]}
+    """
+    chains: Dict[Path, List[Path]] = {}
+    queue = deque([(source, [source])])
+    seen = {source}
+    while queue:
+        node, chain = queue.popleft()
+        for dep in sorted(graph.get(node, ())):
+            if dep in seen:
+                continue
+            seen.add(dep)
+            dep_chain = chain + [dep]
+            chains[dep] = dep_chain
+            queue.append((dep, dep_chain))
+    return chains
+
+
+def dependents_of(graph: DependencyGraph, changed: Set[Path]) -> Set[Path]:
+    """changed 파일들에 (전이적으로) 의존하는 파일 집합을 구한다."""
+    reverse: DependencyGraph = {}
+    for node, deps in graph.items():
+        for dep in deps:
+            reverse.setdefault(dep, set()).add(node)
+
+    result: Set[Path] = set()
+    queue = deque(changed)
+    while queue:
+        node = queue.popleft()
+        for parent in reverse.get(node, ()):
+            if parent not in result:
+                result.add(parent)
+                queue.append(parent)
+    return result
@@ -0,0 +1,171 @@
+"""프로젝트 간 공유되는 컴파일 결과(.pyd) 캐시 (ccache 방식)
+
+- 키: 모듈명 + 소스 입력 키(.py/.pyx 와 cimport/include 의존 파일 해시, Cython 버전/지시어)
+  + 컴파일러 플래그 + Python ABI 태그 + 플랫폼
+  (생성된 C 에는 소스의 절대 경로가 들어가므로 C 해시로는 다른 checkout 과 공유되지 않는다)
+- 위치: GlobalSettings 의 사용자 설정 디렉토리 아래 ext_cache/
+- 크기 제한을 넘으면 가장 오래 사용하지 않은 항목부터 지운다 (LRU)
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import sys
+import sysconfig
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from .fingerprint import hash_file, hash_obj
+from .hg_settings import GlobalSettings
+
+# GlobalSettings 에 저장되는 섹션 이름
+SETTINGS_SECTION = "ext_cache"
+DEFAULT_MAX_SIZE_MB = 2048
+
+# 프로세스 전체의 hit / miss 카운터 (HgInstaller.run 마지막에 출력)
+_STATS = {"hit": 0, "miss": 0, "store": 0, "evict": 0}
+
+
+def get_cache_stats() -> dict:
+    return dict(_STATS)
+
+
+def reset_cache_stats() -> None:
+    for key in _STATS:
+        _STATS[key] = 0
+
+
+class ExtensionCache:
+    """컴파일된 확장 모듈을 내용 주소(content-addressed)로 저장하는 캐시."""
+
+    def __init__(self, root: str | Path, max_size_mb: int = DEFAULT_MAX_SIZE_MB):
+        self.root = Path(root)
+        self.max_bytes = int(max_size_mb) * 1024 * 1024
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_settings(cls, enabled: bool | None = None) -> Optional["ExtensionCache"]:
+        """GlobalSettings 의 ext_cache 설정을 읽어서 캐시를 만든다.
+
+        - enabled: None 이면 설정값을 따르고, True/False 면 설정보다 우선한다.
+        - 꺼져 있으면 None 을 반환한다.
+        """
+        config = GlobalSettings.load(SETTINGS_SECTION)
+        if enabled is None:
+            enabled = bool(config.get("enabled"))
+        if not enabled:
+            return None
+        root = config.get("path") or GlobalSettings.get_path().parent / "ext_cache"
+        return cls(root, config.get("max_size_mb", DEFAULT_MAX_SIZE_MB))
+
+    @staticmethod
+    def make_key(c_source: str | Path, ext, source_key: str | None = None) -> str:
+        """소스 입력과 빌드 플래그로 캐시 키를 만든다.
+
+        - source_key: 생성될 C 를 결정하는 입력의 해시 (py2pyd.c_source_key).
+          경로와 무관하므로 같은 모듈이면 다른 폴더/프로젝트에서도 같은 키가 된다.
+        - source_key 가 없으면 생성된 C 소스 (unity 묶음처럼 여러 개면 나머지도) 의 해시를 쓴다.
+        """
+        flags = {
+            "extra_compile_args": list(ext.extra_compile_args or []),
+            "extra_link_args": list(ext.extra_link_args or []),
+            "define_macros": [list(m) for m in (ext.define_macros or [])],
+            "undef_macros": list(ext.undef_macros or []),
+            "include_dirs": list(ext.include_dirs or []),
+            "libraries": list(ext.libraries or []),
+            "cc": sysconfig.get_config_var("CC"),
+            "cflags": sysconfig.get_config_var("CFLAGS"),
+        }
+        key = {
+            "name": ext.name,
+            "flags": flags,
+            "abi": [sys.implementation.cache_tag, sysconfig.get_config_var("EXT_SUFFIX")],
+            "platform": sysconfig.get_platform(),
+        }
+        if source_key is not None:
+            key["source"] = source_key
+            return hash_obj(key)
+        key["c_source"] = hash_file(c_source)
+        extra_sources = list(getattr(ext, "sources", [])[1:])
+        if extra_sources:
+            key["extra_sources"] = [hash_file(source) for source in extra_sources]
+        return hash_obj(key)
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def fetch(self, key: str, dest: str | Path) -> bool:
+        """캐시에 있으면 dest 로 복사하고 True. 없으면 False."""
+        entry = self._entry_path(key)
+        dest = Path(dest)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            # 복사본의 mtime 은 현재 시각이 되도록 copyfile 사용
+            shutil.copyfile(entry, dest)
+            # LRU 판단을 위해 사용 시각 갱신 (atime 은 noatime 마운트에서 믿을 수 없음)
+            now = time.time()
+            os.utime(entry, (now, now))
+        except FileNotFoundError:
+            # 없거나, 다른 프로세스가 방금 evict 했음
+            _STATS["miss"] += 1
+            return False
+        _STATS["hit"] += 1
+        return True
+
+    def store(self, key: str, built: str | Path) -> None:
+        """빌드된 확장 모듈을 캐시에 넣는다.
+
+        - 여러 프로세스가 같은 키를 동시에 넣어도 되도록 고유한 임시 파일에 쓴 뒤 rename 한다.
+        - 크기 제한 정리(evict) 는 하지 않는다. 빌드가 끝난 뒤 한 번 호출한다.
+        """
+        entry = self._entry_path(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=entry.name, suffix=".tmp", dir=str(entry.parent))
+        os.close(fd)
+        try:
+            shutil.copy2(built, tmp_name)
+            os.replace(tmp_name, entry)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        now = time.time()
+        os.utime(entry, (now, now))
+        _STATS["store"] += 1
+
+    def evict(self) -> None:
+        """전체 크기가 max_bytes 이하가 될 때까지 오래된 항목부터 삭제한다.
+
+        - 다른 프로세스가 같은 항목을 먼저 지웠으면 건너뛴다.
+        """
+        entries = []
+        total = 0
+        for path in self.root.glob("*/*"):
+            if path.suffix == ".tmp":
+                continue
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            if not path.is_file():
+                continue
+            entries.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            else:
+                _STATS["evict"] += 1
+            total -= size
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+        self.root.mkdir(parents=True, exist_ok=True)
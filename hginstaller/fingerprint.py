@@ -0,0 +1,86 @@
+"""빌드 단계별 증분 판단에 쓰는 해시/상태 파일 유틸리티"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any
+
+# 파일을 읽을 때 사용할 버퍼 크기
+_CHUNK_SIZE = 1024 * 1024
+
+
+def hash_bytes(data: bytes) -> str:
+    """bytes 의 sha256 hex 문자열을 반환한다."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def hash_file(path: str | Path) -> str:
+    """파일 내용의 sha256 hex 문자열을 반환한다 (mtime 과 무관)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def hash_obj(obj: Any) -> str:
+    """JSON 으로 직렬화 가능한 객체의 안정적인 해시를 반환한다.
+
+    - dict 키 순서에 영향받지 않도록 sort_keys 로 직렬화한다.
+    - Path 등 직렬화 불가 값은 str 로 변환한다.
+    """
+    text = json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str)
+    return hash_bytes(text.encode("utf-8"))
+
+
+def load_state(path: str | Path) -> dict:
+    """JSON 상태 파일을 읽는다. 없거나 깨져 있으면 빈 dict."""
+    p = Path(path)
+    if not p.is_file():
+        return {}
+    try:
+        data = json.loads(p.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_state(path: str | Path, data: dict) -> None:
+    """JSON 상태 파일을 임시 파일 + rename 으로 원자적으로 저장한다."""
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    text = json.dumps(data, ensure_ascii=False, indent=2, sort_keys=True, default=str)
+    fd, tmp_name = tempfile.mkstemp(prefix=p.name, suffix=".tmp", dir=str(p.parent))
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_name, p)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+# build_src_path 아래에 stage 별 마지막 성공 빌드의 fingerprint 를 모아두는 파일
+STATE_FILENAME = ".hginstaller_state.json"
+# 동시에 실행되는 stage 들이 같은 상태 파일을 갱신하므로 읽기-수정-쓰기를 직렬화
+_STATE_LOCK = threading.Lock()
+
+
+def load_stage_state(build_src_path: str | Path, stage: str) -> dict:
+    """stage(pyi_spec, pyinstaller, inno 등) 의 마지막 성공 기록을 읽는다."""
+    value = load_state(Path(build_src_path) / STATE_FILENAME).get(stage, {})
+    return value if isinstance(value, dict) else {}
+
+
+def save_stage_state(build_src_path: str | Path, stage: str, data: dict) -> None:
+    """stage 하나의 기록만 갱신한다 (다른 stage 기록은 유지)."""
+    path = Path(build_src_path) / STATE_FILENAME
+    with _STATE_LOCK:
+        all_data = load_state(path)
+        all_data[stage] = data
+        save_state(path, all_data)
@@ -1,6 +1,6 @@
 import os
+from contextlib import contextmanager
 from pathlib import Path
-import subprocess
 
 from .hg_settings import GlobalSettings, LocalSettings
 
@@ -41,6 +41,11 @@ class HgInstaller:
         print("       hg.add_config(")
         print("           # build_config")
         print("           program_version='1.0.0',")
+        print("           build_profile='release',            # debug / release / max")
+        print("           profile_overrides={'core/hot_*.py': 'max'},")
+        print("           unity_build=True,                   # 패키지마다 .pyd 하나로 링크")
+        print("           prune_pyd='dry-run',                # 지워진 모듈 산출물 정리")
+        print("                                               # True / False / 'dry-run'")
         print("           # pyi_config")
         print("           icon='app.ico',")
         print("           output_type='onefile',")
@@ -52,13 +57,60 @@ class HgInstaller:
         print("       )")
         print()
         print("3) 빌드 실행")
-        print("   - Py2Pyd → spec 생성 → PyInstaller 순서로 실행")
+        print("   - (UI 변환 →) Py2Pyd 와 spec 생성을 동시에 → PyInstaller → Inno Setup 순서로 실행")
         print("   - 예시:")
         print("       hg = HgInstaller('프로그램이름', r'프로젝트_루트_경로')")
         print("       hg.run()")
+        print()
+        print("4) 개발 중 자동 빌드 (watch)")
+        print("   - src 의 .py / .ui 가 바뀔 때마다 바뀐 모듈/폼만 다시 빌드 (Ctrl+C 로 종료)")
+        print("   - 예시:")
+        print("       hg.watch()")
+        print()
+        print("5) hidden_imports 정리 (suggest_imports)")
+        print("   - src / main.py 의 import 를 분석해서 hidden_imports / exclude_module 을 제안")
+        print("   - 현재 설정과의 차이를 출력")
+        print("   - 예시:")
+        print("       hg.suggest_imports()            # 제안만 출력")
+        print("       hg.suggest_imports(apply=True)  # pyi_config 에 반영")
+        print()
+        print("6) 시작 시간 분석 (profile_startup)")
+        print("   - add_config(startup_profiling=True) 로 빌드한 실행 파일을 실행해서 import 비용을 보여 줌")
+        print("   - 예시:")
+        print("       hg.profile_startup(timeout=30)")
+        print()
+        print("7) dist 크기 분석 (bundle_report)")
+        print("   - 배포판/패키지별 크기, 중복 바이너리, 이전 빌드 대비 변화 (run() 후 자동 출력)")
+        print("   - 예시:")
+        print("       hg.bundle_report(record=False)")
+        print()
+        print("8) 여러 변형 동시 빌드 (run_variants)")
+        print("   - pyi_config 를 덮어쓰는 variant 들을 py2pyd 한 번으로 동시에 빌드 (dist/<variant>)")
+        print("   - 예시:")
+        print("       hg.add_config(variants={")
+        print("           'portable': {'output_type': 'onefile'},")
+        print("           'debug': {'console_mode': True},")
+        print("       })")
+        print("       hg.run_variants()")
         print("=" * 50)
 
-    def run(self,py2pyd = True, pyi_build = True, inno_build = True):
+    def run(
+        self,
+        py2pyd=True,
+        pyi_build=True,
+        inno_build=True,
+        ui_build=False,
+        parallel=True,
+        trace=False,
+    ):
+        """빌드 파이프라인을 stage DAG 로 실행한다.
+
+        - py2pyd / pyi_build / inno_build / ui_build : 실행할 stage 선택
+        - 서로 의존하지 않는 stage (예: py2pyd 와 spec 생성) 는 동시에 실행된다.
+        - parallel=False 면 한 번에 하나의 stage 만 실행한다.
+        - trace=True (또는 환경변수 HGINSTALLER_TRACE=1) 면 build_src_path 에
+          trace.json (Chrome/Perfetto) 과 trace_summary.txt 를 남긴다.
+        """
         build_config = LocalSettings.load("build_config")
         pyi_config = LocalSettings.load("pyi_config")
 
@@ -66,32 +118,456 @@ class HgInstaller:
 
         # choeck config
         src_path = build_config["src_path"]
-        pyd_path = build_config["pyd_path"]
-        if py2pyd:
+
+        from .stage_graph import Stage, print_summary, run_stages
+
+        def _ui_stage():
+            print(f"### UI Convert Start ###")
+            from .ui2py import convert_all_ui_files_in_directory
+            result = convert_all_ui_files_in_directory(
+                src_path, state_dir=build_config["build_src_path"]
+            )
+            print(
+                f"converted {len(result.converted)} / skipped {len(result.skipped)}"
+                f" / failed {len(result.failed)}"
+            )
+            for ui_file, error in result.failed.items():
+                print(f"❌ {ui_file}: {error}")
+            if result.failed:
+                raise RuntimeError(f"UI 변환 실패 {len(result.failed)}건")
+            print(f"~~~ UI Convert completed ~~~")
+
+        def _py2pyd_stage():
             print(f"### PY2PYD Start ###")
-            from .py2pyd import py2pyd
-            py2pyd(src_path, pyd_path)
+            self._build_pyd(build_config)
             print(f"~~~ PY2PYD completed ~~~")
 
-        if pyi_build:
+        def _spec_stage():
             print(f"### Pyinstaller Spec writer Start ###")
             from .pyi_builder import pyi_maker
-            pyi_maker(build_config, pyi_config)
+            if not pyi_maker(build_config, pyi_config):
+                raise RuntimeError("pyi-makespec 실행 실패")
             print(f"~~~ Pyinstaller Spec writer completed ~~~")
 
+        def _pyinstaller_stage():
             print(f"### Pyinstaller Run Start ###")
-            spec_path = os.path.join(build_config["build_src_path"],build_config["program_name"]+".spec")
-            subprocess.run(["pyinstaller", "--noconfirm",spec_path], check=True,cwd=build_config["project_path"])
+            from .pyi_builder import run_pyinstaller
+            if run_pyinstaller(build_config, pyi_config):
+                # 새로 빌드된 경우에만 크기를 기록하고 이전 빌드와 비교한다
+                # 크기 분석은 부가 정보이므로 실패해도 빌드 stage 는 성공으로 둔다
+                try:
+                    self.bundle_report()
+                except Exception as e:
+                    print(f"⚠ dist 크기 분석 실패 (빌드 결과에는 영향 없음): {e}")
             print(f"~~~ Pyinstaller Run completed ~~~")
 
-        if inno_build:
+        def _inno_stage():
             print(f"### Inno Setup Run Start ###")
             from .inno_builder import run_inno
             run_inno()
             print(f"~~~ Inno Setup Run completed ~~~")
+
+        # 입력/출력 산출물 이름으로 의존성이 결정된다
+        stages = []
+        if ui_build:
+            stages.append(Stage("ui", _ui_stage, inputs=["ui"], outputs=["ui_py"]))
+        if py2pyd:
+            from .ext_cache import reset_cache_stats
+            reset_cache_stats()
+            stages.append(Stage("py2pyd", _py2pyd_stage, inputs=["src", "ui_py"], outputs=["pyd"]))
+        if pyi_build:
+            stages.append(Stage(
+                "pyi_spec", _spec_stage, inputs=["build_config", "pyi_config"], outputs=["spec"],
+            ))
+            stages.append(Stage(
+                "pyinstaller", _pyinstaller_stage,
+                inputs=["spec", "pyd", "ui_py"], outputs=["dist"],
+            ))
+        if inno_build:
+            stages.append(Stage(
+                "inno", _inno_stage, inputs=["dist", "iss_config"], outputs=["installer"],
+            ))
+
+        with self._trace_session(build_config, trace):
+            by_name = run_stages(stages, max_workers=None if parallel else 1)
+            print_summary(by_name)
+
         print(f"☆ everything completed ☆")
         print(f"☆ output path : {build_config['output_path']}")
         print(f"☆ output file : {build_config['program_name']}.exe")
+        if py2pyd:
+            from .ext_cache import get_cache_stats
+            stats = get_cache_stats()
+            if stats["hit"] or stats["miss"]:
+                print(f"☆ ext cache : hit {stats['hit']} / miss {stats['miss']} "
+                      f"(store {stats['store']}, evict {stats['evict']})")
+
+    def run_variants(self, names=None, py2pyd=True, parallel=True, trace=False):
+        """build_config 의 variants (pyi_config 덮어쓰기) 를 한 번의 py2pyd 결과로 동시에 빌드한다.
+
+        - names: 빌드할 variant 이름 목록 (기본: 전부)
+        - variant 마다 spec / workpath 는 build_src/variants/<이름>, distpath 는 dist/<이름> 으로 따로 둔다.
+          spec 생성과 PyInstaller 의 증분 판단도 variant 마다 따로 한다.
+        - py2pyd 가 끝나면 variant 들의 PyInstaller 가 동시에 실행된다 (spec 생성은 py2pyd 와도 동시에).
+        - 끝나면 stage 시간표와 variant 별 상태 / 시간 / dist 크기(이전 빌드 대비) 를 출력한다.
+        - Inno Setup 은 실행하지 않는다.
+        - 반환값: [variants.VariantResult]
+        """
+        import time
+
+        from .stage_graph import Stage, print_summary, run_stages
+        from .variants import VariantResult, print_variant_report, variant_configs
+
+        build_config = LocalSettings.load("build_config")
+        pyi_config = LocalSettings.load("pyi_config")
+        variants = build_config.get("variants") or {}
+        if names is not None:
+            missing = [name for name in names if name not in variants]
+            if missing:
+                raise ValueError(
+                    f"알 수 없는 variant: {', '.join(missing)} / 등록된 variant: {', '.join(variants)}"
+                )
+            variants = {name: variants[name] for name in names}
+        if not variants:
+            raise ValueError("빌드할 variant 가 없습니다. add_config(variants={...}) 로 먼저 추가하세요.")
+
+        print(f"### Run HG Installer variants for {self.program_name}: {', '.join(variants)}")
+
+        configs = {
+            name: variant_configs(build_config, pyi_config, name, overlay)
+            for name, overlay in variants.items()
+        }
+        spec_done = set()
+        built = {}
+        sizes = {}
+
+        def _spec_stage(name, variant_build, variant_pyi):
+            def _stage():
+                from .pyi_builder import pyi_maker
+                Path(variant_build["build_src_path"]).mkdir(parents=True, exist_ok=True)
+                if not pyi_maker(variant_build, variant_pyi):
+                    raise RuntimeError(f"pyi-makespec 실행 실패 ({name})")
+                spec_done.add(name)
+            return _stage
+
+        def _pyinstaller_stage(name, variant_build, variant_pyi):
+            def _stage():
+                from .bundle_size import analyze_bundle, find_dist, record_snapshot
+                from .pyi_builder import run_pyinstaller
+                built[name] = run_pyinstaller(variant_build, variant_pyi)
+                try:
+                    snapshot = analyze_bundle(find_dist(variant_build))
+                    if built[name]:
+                        previous = record_snapshot(variant_build["build_src_path"], snapshot)
+                        delta = snapshot["total"] - previous["total"] if previous else None
+                    else:
+                        delta = None
+                except Exception as e:
+                    print(f"⚠ dist 크기 분석 실패 ({name}, 빌드 결과에는 영향 없음): {e}")
+                    snapshot, delta = {"total": None, "dist": ""}, None
+                sizes[name] = (snapshot["total"], delta, snapshot["dist"])
+            return _stage
+
+        stages = []
+        if py2pyd:
+            from .ext_cache import reset_cache_stats
+            reset_cache_stats()
+            stages.append(Stage(
+                "py2pyd", lambda: self._build_pyd(build_config), inputs=["src"], outputs=["pyd"],
+            ))
+        for name, (variant_build, variant_pyi) in configs.items():
+            stages.append(Stage(
+                f"spec:{name}", _spec_stage(name, variant_build, variant_pyi),
+                inputs=["build_config", "pyi_config"], outputs=[f"spec:{name}"],
+            ))
+            stages.append(Stage(
+                f"pyi:{name}", _pyinstaller_stage(name, variant_build, variant_pyi),
+                inputs=[f"spec:{name}", "pyd"], outputs=[f"dist:{name}"],
+            ))
+
+        by_name = {stage.name: stage for stage in stages}
+
+        with self._trace_session(build_config, trace):
+            error = None
+            start = time.perf_counter()
+            try:
+                run_stages(stages, max_workers=None if parallel else 1)
+            except BaseException as e:
+                # 실패한 variant 가 있어도 나머지 결과와 시간표는 보여 주고 다시 발생시킨다
+                error = e
+            wall = time.perf_counter() - start
+
+            results = []
+            for name, (variant_build, variant_pyi) in configs.items():
+                spec_stage = by_name[f"spec:{name}"]
+                pyi_stage = by_name[f"pyi:{name}"]
+                if name in sizes:
+                    status = "built" if built[name] else "up to date"
+                elif pyi_stage.start is not None or (
+                    spec_stage.start is not None and name not in spec_done
+                ):
+                    status = "failed"
+                else:
+                    status = "skipped"
+                size, delta, dist = sizes.get(name, (None, None, ""))
+                results.append(VariantResult(
+                    name,
+                    variant_pyi["output_type"],
+                    variant_pyi["console_mode"],
+                    dist,
+                    status,
+                    spec_stage.duration,
+                    pyi_stage.duration,
+                    size,
+                    delta,
+                ))
+
+            print_summary(by_name)
+            py2pyd_seconds = by_name["py2pyd"].duration if "py2pyd" in by_name else 0.0
+            print_variant_report(results, wall, py2pyd_seconds)
+
+        if error is not None:
+            raise error
+        return results
+
+    @contextmanager
+    def _trace_session(self, build_config: dict, trace: bool):
+        """with 블록의 빌드만 trace 로 기록하고, 끝나면 build_src_path 에 trace.json / trace_summary.txt 를 쓴다.
+
+        - trace=False 여도 HGINSTALLER_TRACE=1 로 켜져 있으면 기록한다.
+        - 끝나면 tracer 를 들어오기 전 상태로 되돌리므로 다음 run 에 이벤트가 섞이지 않는다.
+        """
+        from .trace import get_tracer
+
+        with get_tracer().session(trace) as tracer:
+            try:
+                yield
+            finally:
+                if tracer.enabled:
+                    build_src_path = Path(build_config["build_src_path"])
+                    trace_path = tracer.write_chrome_trace(build_src_path / "trace.json")
+                    tracer.write_summary(build_src_path / "trace_summary.txt")
+                    print(tracer.summary())
+                    print(f"☆ trace : {trace_path}")
+
+    def _build_pyd(self, build_config: dict):
+        from .py2pyd import py2pyd
+        # 지워진 모듈의 .pyd 가 add_data 로 같이 묶이지 않도록 정리까지 한다 (prune_pyd 로 끄거나 dry-run)
+        py2pyd(
+            build_config["src_path"],
+            build_config["pyd_path"],
+            prune=build_config.get("prune_pyd", True),
+            profile=build_config.get("build_profile"),
+            profile_overrides=build_config.get("profile_overrides"),
+            unity=build_config.get("unity_build"),
+        )
+
+    def _load_build_config(self, variant: str = None) -> dict:
+        """build_config. variant 를 주면 그 variant 의 spec / dist 경로로 바꾼 사본."""
+        build_config = LocalSettings.load("build_config")
+        if variant is None:
+            return build_config
+        overlay = (build_config.get("variants") or {}).get(variant)
+        if overlay is None:
+            raise ValueError(f"알 수 없는 variant: {variant!r}")
+        from .variants import variant_configs
+        return variant_configs(build_config, LocalSettings.load("pyi_config"), variant, overlay)[0]
+
+    def watch(
+        self,
+        py2pyd=True,
+        ui_build=True,
+        ui_paths=None,
+        debounce=0.3,
+        poll_interval=1.0,
+        use_inotify=None,
+        stop_event=None,
+    ):
+        """src_path (와 ui_paths) 를 감시하면서 바뀐 모듈/폼만 계속 다시 빌드한다.
+
+        - 한 프로세스 안에서 계속 실행되므로 인터프리터 / setuptools / Cython import 비용은 처음 한 번만 든다.
+          py2pyd 는 Py2PydBuilder 의 worker 풀을 계속 재사용한다.
+        - Linux 는 inotify, 그 외(또는 inotify 실패 시) 는 poll_interval 초 간격 polling 으로 감시한다.
+        - 변경이 몰려 들어오면 debounce 초 동안 조용해질 때까지 모았다가 한 번에 빌드한다.
+        - .ui 가 바뀌면 UI 변환 → py2pyd, 소스가 바뀌면 py2pyd 만 실행한다 (py2pyd 는 manifest 기준 바뀐 모듈만 빌드).
+        - Ctrl+C 또는 stop_event.set() 으로 종료한다.
+        """
+        import time
+
+        from .watcher import create_backend, wait_for_changes
+
+        build_config = LocalSettings.load("build_config")
+        src_path = Path(build_config["src_path"])
+        pyd_path = Path(build_config["pyd_path"])
+        ui_dirs = [src_path] + [Path(p) for p in ui_paths or []]
+        roots = [p for i, p in enumerate(ui_dirs) if p not in ui_dirs[:i]]
+
+        # 직접 만든 _ui.py 의 stat. 그 파일의 변경 이벤트는 다시 빌드하지 않는다.
+        generated = {}
+
+        def _stat(path):
+            try:
+                st = os.stat(path)
+            except OSError:
+                return None
+            return st.st_mtime_ns, st.st_size
+
+        def _build(changed):
+            """changed 가 None 이면 전체 확인 (처음 한 번)."""
+            converted = False
+            if ui_build and (changed is None or any(p.suffix == ".ui" for p in changed)):
+                from .ui2py import convert_all_ui_files_in_directory
+                for ui_dir in ui_dirs:
+                    result = convert_all_ui_files_in_directory(
+                        ui_dir, state_dir=build_config["build_src_path"]
+                    )
+                    for ui_file in result.converted:
+                        output_file = Path(os.path.splitext(ui_file)[0] + "_ui.py")
+                        generated[output_file] = _stat(output_file)
+                        print(f"✅ {ui_file} → {output_file.name}")
+                        converted = True
+                    for ui_file, error in result.failed.items():
+                        print(f"❌ {ui_file}: {error}")
+
+            source_changed = changed is None or converted or any(
+                p.suffix != ".ui" and src_path in p.parents for p in changed
+            )
+            if py2pyd and source_changed:
+                builder.build(
+                    src_path,
+                    pyd_path,
+                    prune=build_config.get("prune_pyd", True),
+                    profile=build_config.get("build_profile"),
+                    profile_overrides=build_config.get("profile_overrides"),
+                    unity=build_config.get("unity_build"),
+                )
+
+        def _run_build(changed):
+            start = time.perf_counter()
+            try:
+                _build(changed)
+            except (Exception, SystemExit) as e:
+                # setuptools 는 컴파일 실패 시 SystemExit 을 던진다. 감시는 계속한다.
+                print(f"❌ 빌드 실패: {e}")
+            else:
+                print(f"~~~ watch build completed ({time.perf_counter() - start:.2f}s) ~~~")
+
+        from .py2pyd import Py2PydBuilder
+
+        # worker 프로세스를 감시가 끝날 때까지 유지해서 빌드마다 setup / 컴파일러 탐지를 반복하지 않는다
+        builder = Py2PydBuilder()
+        backend = create_backend(roots, use_inotify, poll_interval)
+        print(f"### Watch {', '.join(str(p) for p in roots)} ({backend.name}) - Ctrl+C 로 종료")
+        try:
+            _run_build(None)
+            while stop_event is None or not stop_event.is_set():
+                changed = wait_for_changes(backend, debounce, timeout=1.0)
+                changed = {p for p in changed if p not in generated or generated[p] != _stat(p)}
+                generated.clear()
+                if not changed:
+                    continue
+                names = ", ".join(sorted(p.name for p in changed)[:5])
+                more = f" 외 {len(changed) - 5}개" if len(changed) > 5 else ""
+                print(f"### 변경 감지: {names}{more}")
+                _run_build(changed)
+        except KeyboardInterrupt:
+            print("### Watch 종료")
+        finally:
+            backend.close()
+            builder.close()
+
+    def suggest_imports(self, apply: bool = False):
+        """src_path / main_py 의 import 를 ast 로 분석해서 최소한의 hidden_imports / exclude_module 을 제안한다.
+
+        - pyproject 의 dependencies 를 통째로 hidden_imports 에 넣는 대신, src 에서 실제로 import 하는 모듈만 남긴다.
+        - 분석 결과는 파일 해시로 build_src 에 캐시되므로 두 번째부터는 바뀐 파일만 다시 파싱한다.
+        - apply: True 면 제안대로 pyi_config 의 hidden_imports 를 바꾸고 exclude_module 에 추가한다.
+        - 반환값: import_analysis.ImportProposal
+        """
+        from .import_analysis import IMPORT_CACHE_NAME, print_import_proposal, propose_imports
+
+        build_config = LocalSettings.load("build_config")
+        pyi_config = LocalSettings.load("pyi_config")
+        main_py = Path(pyi_config.get("main_py") or "main.py")
+        if not main_py.is_absolute():
+            main_py = self.project_path / main_py
+
+        proposal = propose_imports(
+            build_config["src_path"],
+            main_py,
+            dependencies=self._read_toml(),
+            current=pyi_config,
+            cache_path=Path(build_config["build_src_path"]) / IMPORT_CACHE_NAME,
+        )
+        print_import_proposal(proposal)
+
+        if apply:
+            removed = proposal.removed["exclude_module"]
+            exclude = [m for m in pyi_config.get("exclude_module") or [] if m not in removed]
+            pyi_config["hidden_imports"] = proposal.hidden_imports
+            pyi_config["exclude_module"] = exclude + [
+                m for m in proposal.exclude_module if m not in exclude
+            ]
+            LocalSettings.save("pyi_config", pyi_config)
+            print("✅ pyi_config 에 반영했습니다")
+        return proposal
+
+    def profile_startup(self, timeout: float = 30.0, top: int = 15, args=None, variant: str = None):
+        """빌드된 실행 파일(dist) 을 import 추적을 켜고 실행해서 시작 시 import 비용을 보여 준다.
+
+        - add_config(startup_profiling=True) 로 runtime hook 을 넣어 빌드해야 한다.
+        - 느린 모듈(self 시간), 패키지별 합계, 확장 모듈(.pyd/.so) 과 순수 Python 의 비율을 출력하고
+          build_src/startup_profile.json 에 저장한다.
+        - GUI 앱처럼 스스로 끝나지 않으면 timeout 초 뒤에 종료시키고 그때까지의 import 만 집계한다.
+        - variant: run_variants 로 빌드한 variant 의 실행 파일을 잰다 (결과는 그 variant 폴더에 저장).
+        - 반환값: startup_profile.StartupProfile
+        """
+        from .startup_profile import (
+            STARTUP_PROFILE_NAME,
+            find_executable,
+            print_startup_profile,
+            profile_executable,
+            save_startup_profile,
+        )
+
+        build_config = self._load_build_config(variant)
+        if not build_config.get("startup_profiling"):
+            print("⚠ startup_profiling 이 꺼져 있습니다. add_config(startup_profiling=True) 후 다시 빌드하세요.")
+        executable = find_executable(build_config)
+        profile = profile_executable(executable, timeout=timeout, args=args, top=max(top, 20))
+        print_startup_profile(profile, top)
+        output = Path(build_config["build_src_path"]) / STARTUP_PROFILE_NAME
+        save_startup_profile(profile, output)
+        print(f"☆ startup profile : {output}")
+        return profile
+
+    def bundle_report(self, record: bool = True, top: int = 10, variant: str = None):
+        """dist 결과물의 크기를 배포판/패키지/종류별로 나누고 중복 바이너리를 찾아서 출력한다.
+
+        - record: True 면 build_src 의 크기 기록(bundle_sizes.json) 에 추가하고 바로 이전 빌드와 비교한다.
+          False 면 기록하지 않고 마지막 기록과 비교만 한다.
+        - run() 에서는 PyInstaller 가 실제로 실행됐을 때 자동으로 호출된다.
+        - variant: run_variants 로 빌드한 variant 의 dist 를 분석한다 (기록도 variant 마다 따로).
+        - 반환값: 이번 snapshot dict
+        """
+        from .bundle_size import (
+            analyze_bundle,
+            find_dist,
+            load_snapshots,
+            print_bundle_report,
+            record_snapshot,
+        )
+
+        build_config = self._load_build_config(variant)
+        build_src_path = Path(build_config["build_src_path"])
+        snapshot = analyze_bundle(find_dist(build_config))
+        if record:
+            previous = record_snapshot(build_src_path, snapshot)
+        else:
+            history = load_snapshots(build_src_path)
+            previous = history[-1] if history else None
+        print_bundle_report(snapshot, previous, top)
+        return snapshot
 
     def _init_config(self):
         build_config = {}
@@ -106,6 +582,12 @@ class HgInstaller:
         build_config["pyd_path"] = build_config["build_src_path"]/"src_pyd"
         build_config["output_path"] = self.project_path /"output"
         build_config["program_version"] = "0.1.0"
+        build_config["build_profile"] = "release"
+        build_config["profile_overrides"] = {}
+        build_config["unity_build"] = False
+        build_config["prune_pyd"] = True
+        build_config["startup_profiling"] = False
+        build_config["variants"] = {}
 
         pyi_config = {}
         pyi_config["output_type"] = "onedir"
@@ -124,9 +606,10 @@ class HgInstaller:
         iss_config["app_publisher"] = "Publisher"
         iss_config["app_url"] = "url"
 
-        LocalSettings.save("build_config", build_config)
-        LocalSettings.save("pyi_config", pyi_config)
-        LocalSettings.save("iss_config", iss_config)
+        with LocalSettings.transaction():
+            LocalSettings.save("build_config", build_config)
+            LocalSettings.save("pyi_config", pyi_config)
+            LocalSettings.save("iss_config", iss_config)
 
 
 
@@ -145,6 +628,14 @@ class HgInstaller:
     def set_iss_path(cls,iss_path:str):
         GlobalSettings.save("iss", {"iss_path": iss_path})
 
+    @classmethod
+    def set_ext_cache(cls, enabled: bool = True, max_size_mb: int = 2048, cache_path: str = None):
+        """py2pyd 컴파일 결과 캐시(프로젝트 간 공유)를 켜거나 끈다."""
+        config = {"enabled": enabled, "max_size_mb": max_size_mb}
+        if cache_path is not None:
+            config["path"] = cache_path
+        GlobalSettings.save("ext_cache", config)
+
     @classmethod
     def check_iss_path(cls):
         iss_config = GlobalSettings.load("iss")
@@ -176,6 +667,12 @@ class HgInstaller:
         pyd_path=None,
         output_path=None,
         program_version=None,
+        build_profile=None,
+        profile_overrides=None,
+        unity_build=None,
+        prune_pyd=None,
+        startup_profiling=None,
+        variants=None,
         # pyi_config 필드들
         icon=None,
         output_type=None,
@@ -217,6 +714,42 @@ class HgInstaller:
             build_config["output_path"] = Path(output_path) if not isinstance(output_path, Path) else output_path
         if program_version is not None:
             build_config["program_version"] = program_version
+        if build_profile is not None or profile_overrides is not None:
+            # 잘못된 프로필 이름은 저장하기 전에 ValueError
+            from .build_profiles import BuildProfiles
+            BuildProfiles(build_profile, profile_overrides)
+        if build_profile is not None:
+            build_config["build_profile"] = build_profile
+        if profile_overrides is not None:
+            # glob 별 덮어쓰기는 기존 값에 누적
+            overrides = dict(build_config.get("profile_overrides") or {})
+            overrides.update(profile_overrides)
+            build_config["profile_overrides"] = overrides
+        if unity_build is not None:
+            # True(패키지마다) / False / {glob: 그룹 이름}. 잘못된 그룹 이름은 저장하기 전에 ValueError
+            from .unity import unity_groups
+            unity_groups([], unity_build)
+            build_config["unity_build"] = unity_build
+        if prune_pyd is not None:
+            # True(지움) / False(안 함) / "dry-run"(지울 목록만 출력)
+            if prune_pyd not in (True, False, "dry-run"):
+                raise ValueError(
+                    f"Invalid prune_pyd : {prune_pyd!r} / Allowed : True, False, 'dry-run'"
+                )
+            build_config["prune_pyd"] = prune_pyd
+        if startup_profiling is not None:
+            build_config["startup_profiling"] = bool(startup_profiling)
+        if variants is not None:
+            # {이름: pyi_config 덮어쓰기} 를 기존 값에 누적, 값이 None 이면 그 variant 삭제
+            from .variants import validate_variants
+            validate_variants(variants)
+            merged = dict(build_config.get("variants") or {})
+            for name, overlay in variants.items():
+                if overlay is None:
+                    merged.pop(name, None)
+                else:
+                    merged[name] = dict(overlay)
+            build_config["variants"] = merged
 
         # pyi_config 업데이트
         if icon is not None:
@@ -258,9 +791,10 @@ class HgInstaller:
         if app_url is not None:
             iss_config["app_url"] = app_url
 
-        LocalSettings.save("build_config", build_config)
-        LocalSettings.save("pyi_config", pyi_config)
-        LocalSettings.save("iss_config", iss_config)
+        with LocalSettings.transaction():
+            LocalSettings.save("build_config", build_config)
+            LocalSettings.save("pyi_config", pyi_config)
+            LocalSettings.save("iss_config", iss_config)
 
 if __name__ == "__main__":
     program_name = "NX_Logging"
@@ -1,9 +1,12 @@
+import copy
 import json
+import os
+import tempfile
+import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
 
-from platformdirs import user_config_dir
-
 
 class BaseSettings(ABC):
     """설정 파일을 저장/로드하는 베이스 클래스.
@@ -24,18 +27,60 @@ class BaseSettings(ABC):
         """설정 파일의 경로를 반환합니다. 하위 클래스에서 구현해야 합니다."""
         pass
     
+    # 프로세스 전체에서 공유하는 파일 캐시 {경로: (mtime_ns, size, data)}
+    _cache: dict = {}
+    # 스레드마다 따로 두는 진행 중인 transaction (_thread_transactions 참고)
+    _local = threading.local()
+    _lock = threading.RLock()
+
     @classmethod
-    def _load_all(cls) -> dict:
-        """전체 설정 파일(JSON)을 통째로 읽어서 dict 로 반환."""
-        p = cls.get_path()
-        if not p.is_file():
+    def _thread_transactions(cls) -> dict:
+        """현재 스레드의 진행 중인 transaction {경로: [깊이, 작업 중인 data, 시작 시점 data]}.
+
+        - 다른 스레드의 transaction 은 보이지 않으므로, 그 스레드의 load/save 는 묶이지 않고 바로 파일에 반영된다.
+        """
+        transactions = getattr(BaseSettings._local, "transactions", None)
+        if transactions is None:
+            transactions = BaseSettings._local.transactions = {}
+        return transactions
+
+    @classmethod
+    def _read_file(cls, p: Path) -> dict:
+        """설정 파일을 읽는다. 크기/수정시간이 캐시와 같으면 다시 파싱하지 않는다."""
+        try:
+            st = p.stat()
+        except FileNotFoundError:
             return {}
+        key = str(p)
+        cached = cls._cache.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
         try:
-            return json.loads(p.read_text(encoding="utf-8"))
+            data = json.loads(p.read_text(encoding="utf-8"))
         except json.JSONDecodeError:
             # 파일이 깨져 있으면 안전하게 초기화
-            return {}
-    
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        cls._cache[key] = (st.st_mtime_ns, st.st_size, data)
+        return data
+
+    @classmethod
+    def _load_all(cls) -> dict:
+        """전체 설정 파일(JSON)을 통째로 읽어서 dict 로 반환.
+
+        - 호출한 쪽에서 수정해도 캐시가 오염되지 않도록 복사본을 돌려준다.
+        - transaction 중이면 아직 저장되지 않은 내용을 돌려준다.
+        """
+        p = cls.get_path()
+        with cls._lock:
+            txn = cls._thread_transactions().get(str(p))
+            if txn is not None:
+                return copy.deepcopy(txn[1])
+            if not p.is_file():
+                return {}
+            return copy.deepcopy(cls._read_file(p))
+
     @classmethod
     def _convert_paths_to_str(cls, obj):
         """Path 객체를 문자열로 변환하는 재귀 함수."""
@@ -50,13 +95,85 @@ class BaseSettings(ABC):
     
     @classmethod
     def _save_all(cls, data: dict) -> None:
-        """전체 설정 dict 를 파일에 통째로 저장."""
+        """전체 설정 dict 를 파일에 통째로 저장.
+
+        - 임시 파일에 쓴 뒤 rename 해서, 중간에 실패해도 기존 파일이 깨지지 않게 한다.
+        - transaction 중이면 파일에 쓰지 않고 모아 두었다가 끝날 때 한 번만 쓴다.
+        """
         p = cls.get_path()
-        p.parent.mkdir(parents=True, exist_ok=True)
         # Path 객체를 문자열로 변환
         serializable_data = cls._convert_paths_to_str(data)
-        p.write_text(json.dumps(serializable_data, ensure_ascii=False, indent=2), encoding="utf-8")
-    
+        with cls._lock:
+            txn = cls._thread_transactions().get(str(p))
+            if txn is not None:
+                txn[1] = serializable_data
+                return
+            cls._write_file(p, serializable_data)
+
+    @classmethod
+    def _write_file(cls, p: Path, data: dict) -> None:
+        p.parent.mkdir(parents=True, exist_ok=True)
+        text = json.dumps(data, ensure_ascii=False, indent=2)
+        fd, tmp_name = tempfile.mkstemp(prefix=p.name, suffix=".tmp", dir=str(p.parent))
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_name, p)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        st = p.stat()
+        cls._cache[str(p)] = (st.st_mtime_ns, st.st_size, copy.deepcopy(data))
+
+    @classmethod
+    @contextmanager
+    def transaction(cls):
+        """여러 섹션의 load/save 를 묶어서 마지막에 한 번만 원자적으로 저장한다.
+
+        예)
+            with LocalSettings.transaction():
+                LocalSettings.save("build_config", {...})
+                LocalSettings.save("pyi_config", {...})
+
+        - 블록 안에서 예외가 나면 그 블록에서 바꾼 내용은 버려진다 (중첩된 안쪽 블록도 마찬가지).
+        - 중첩해서 써도 가장 바깥 블록이 끝날 때 한 번만 저장한다.
+        - transaction 은 연 스레드에서만 유효하다. 다른 스레드의 load/save 는 영향을 받지 않고,
+          저장할 때는 이 transaction 에서 바뀐 섹션만 그 시점의 파일 내용에 덮어쓴다.
+        """
+        p = cls.get_path()
+        key = str(p)
+        transactions = cls._thread_transactions()
+        with cls._lock:
+            txn = transactions.get(key)
+            if txn is None:
+                original = cls._read_file(p) if p.is_file() else {}
+                # [중첩 깊이, 작업 중인 data, 시작 시점 data]
+                txn = [0, copy.deepcopy(original), original]
+                transactions[key] = txn
+            txn[0] += 1
+            # 안쪽 블록에서 예외가 나면 되돌릴 시점
+            snapshot = copy.deepcopy(txn[1])
+        committed = False
+        try:
+            yield
+            committed = True
+        finally:
+            with cls._lock:
+                txn[0] -= 1
+                if not committed:
+                    txn[1] = snapshot
+                if txn[0] == 0:
+                    del transactions[key]
+                    # 내용이 그대로면 파일을 건드리지 않는다
+                    if committed and txn[1] != txn[2]:
+                        current = cls._read_file(p) if p.is_file() else {}
+                        merged = dict(current)
+                        for section, value in txn[1].items():
+                            if txn[2].get(section) != value:
+                                merged[section] = value
+                        cls._write_file(p, merged)
+
     @classmethod
     def load(cls, section: str) -> dict:
         """지정한 섹션(global, program_name 등) 하나만 로드.
@@ -120,6 +237,9 @@ class GlobalSettings(BaseSettings):
     @classmethod
     def get_path(cls) -> Path:
         """글로벌 설정 파일의 경로를 반환합니다."""
+        # 글로벌 설정을 쓰지 않는 경우 import 비용이 없도록 필요할 때 import
+        from platformdirs import user_config_dir
+
         cfg_dir = Path(user_config_dir(cls.APP_NAME, cls.APP_AUTHOR))
         cfg_dir.mkdir(parents=True, exist_ok=True)
         return cfg_dir / cls.FILENAME
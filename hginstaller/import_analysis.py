@@ -0,0 +1,319 @@
+"""src / main.py 의 import 문을 ast 로 분석해서 최소한의 hidden_imports / exclude_module 을 제안한다.
+
+- src 모듈은 .pyd 로 빌드되어 add_data 로 묶이므로 PyInstaller 가 그 안의 import 를 볼 수 없다.
+  그래서 src 가 쓰는 외부 모듈은 hidden_imports 에 있어야 하고, main.py 가 직접 import 하는 것은
+  PyInstaller 가 분석하므로 없어도 된다.
+- pyproject 의 dependencies 중 어디서도 import 하지 않고, 쓰는 배포판이 요구하지도 않는 것은
+  exclude_module 후보로 제안한다.
+- 파일별 import 목록은 파일 해시로 캐시한다 (build_src/IMPORT_CACHE_NAME).
+"""
+from __future__ import annotations
+
+import ast
+import os
+import re
+import sys
+from importlib.machinery import PathFinder
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+from .fingerprint import hash_file, load_state, save_state
+from .pyproject_utils import parse_package_name
+
+IMPORT_CACHE_NAME = ".import_cache.json"
+IMPORT_CACHE_VERSION = 1
+
+# 분석에서 빼는 폴더 (watcher.IGNORE_DIRS 와 같은 기준)
+_SKIP_DIRS = ("__pycache__", ".git")
+# 배포판 RECORD 에서 모듈이 아닌 메타데이터 폴더
+_METADATA_SUFFIXES = (".dist-info", ".egg-info", ".data")
+
+
+def _imports_of(tree: ast.AST) -> List[str]:
+    """모듈 하나가 import 하는 절대 모듈 이름 (a.b.c 형식).
+
+    - from a.b import c 는 a.b 와 a.b.c 를 모두 후보로 남긴다 (c 가 하위 모듈인지는 나중에 확인).
+    - importlib.import_module("x") / __import__("x") 처럼 상수 문자열로 부르는 동적 import 도 포함한다.
+    - 상대 import 는 src 안의 모듈이므로 뺀다.
+    """
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level or not node.module:
+                continue
+            names.add(node.module)
+            names.update(f"{node.module}.{alias.name}" for alias in node.names if alias.name != "*")
+        elif isinstance(node, ast.Call) and node.args:
+            func = node.func
+            func_name = func.attr if isinstance(func, ast.Attribute) else getattr(func, "id", None)
+            arg = node.args[0]
+            if (
+                func_name in ("import_module", "__import__")
+                and isinstance(arg, ast.Constant)
+                and isinstance(arg.value, str)
+                and not arg.value.startswith(".")
+            ):
+                names.add(arg.value)
+    return sorted(names)
+
+
+def _source_files(src_path: Path) -> List[Path]:
+    files = []
+    for root, dirs, filenames in os.walk(src_path):
+        dirs[:] = [d for d in dirs if d not in _SKIP_DIRS]
+        files.extend(Path(root) / name for name in filenames if name.endswith((".py", ".pyx")))
+    return sorted(files)
+
+
+def scan_imports(
+    files: Iterable[Path], base: Path, cache_path: Optional[Path] = None
+) -> Dict[str, List[str]]:
+    """파일별 import 목록 {base 기준 posix 상대경로: [모듈 이름]}.
+
+    - cache_path 의 기록과 크기/수정시간이 같으면 해시도 다시 계산하지 않고,
+      해시가 같으면 다시 파싱하지 않는다.
+    - 문법 오류가 있는 파일은 건너뛴다 (빈 목록).
+    """
+    cache = load_state(cache_path) if cache_path is not None else {}
+    if cache.get("version") != IMPORT_CACHE_VERSION:
+        cache = {"version": IMPORT_CACHE_VERSION, "files": {}}
+    old_entries = cache["files"]
+    entries: Dict[str, dict] = {}
+    result: Dict[str, List[str]] = {}
+
+    for path in files:
+        key = Path(os.path.relpath(path, base)).as_posix()
+        st = path.stat()
+        # 기록을 바로 고치면 아래에서 바뀐 것이 있는지 비교할 수 없으므로 복사해서 쓴다
+        entry = dict(old_entries[key]) if key in old_entries else None
+        stat_key = (st.st_size, st.st_mtime_ns)
+        if entry is not None and (entry.get("size"), entry.get("mtime_ns")) != stat_key:
+            digest = hash_file(path)
+            entry = entry if entry.get("hash") == digest else {"hash": digest}
+        elif entry is None:
+            entry = {"hash": hash_file(path)}
+        entry.update(size=st.st_size, mtime_ns=st.st_mtime_ns)
+        if "imports" not in entry:
+            try:
+                tree = ast.parse(path.read_bytes(), filename=str(path))
+            except (SyntaxError, ValueError):
+                tree = ast.Module(body=[], type_ignores=[])
+            entry["imports"] = _imports_of(tree)
+        entries[key] = entry
+        result[key] = entry["imports"]
+
+    if cache_path is not None and entries != old_entries:
+        save_state(cache_path, {"version": IMPORT_CACHE_VERSION, "files": entries})
+    return result
+
+
+def _normalize(name: str) -> str:
+    """배포판 이름 비교용 (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def top_level_distributions() -> Dict[str, List[str]]:
+    """{최상위 import 이름: [배포판 이름]} (importlib.metadata.packages_distributions 와 같은 역할)."""
+    from importlib import metadata
+
+    mapping: Dict[str, List[str]] = {}
+    for dist in metadata.distributions():
+        name = dist.metadata["Name"]
+        if not name:
+            continue
+        top_level = (dist.read_text("top_level.txt") or "").split()
+        if not top_level:
+            for file in dist.files or []:
+                first = file.parts[0]
+                if first.endswith(_METADATA_SUFFIXES) or first in ("..", "__pycache__"):
+                    continue
+                top_level.append(first.split(".")[0] if len(file.parts) == 1 else first)
+        for module in set(top_level):
+            mapping.setdefault(module, [])
+            if name not in mapping[module]:
+                mapping[module].append(name)
+    return mapping
+
+
+def _requirements(dist_name: str) -> List[str]:
+    """배포판이 실행 시 요구하는 배포판 이름 (extra 로만 요구하는 것은 제외)."""
+    from importlib import metadata
+
+    try:
+        requires = metadata.requires(dist_name) or []
+    except metadata.PackageNotFoundError:
+        return []
+    return [parse_package_name(req) for req in requires if not re.search(r"extra\s*==", req)]
+
+
+def _required_closure(dist_names: Iterable[str]) -> Set[str]:
+    """dist_names 와 그것들이 (전이적으로) 요구하는 배포판 이름 (정규화된 이름)."""
+    seen: Set[str] = set()
+    stack = list(dist_names)
+    while stack:
+        name = stack.pop()
+        normalized = _normalize(name)
+        if normalized in seen:
+            continue
+        seen.add(normalized)
+        stack.extend(_requirements(name))
+    return seen
+
+
+def _is_stdlib(top: str) -> bool:
+    names = getattr(sys, "stdlib_module_names", None)
+    if names is not None:
+        return top in names
+    if top in sys.builtin_module_names:
+        return True
+    # Python 3.9 이하: stdlib 폴더에 있고 site-packages 가 아니면 표준 라이브러리
+    import sysconfig
+
+    spec = PathFinder.find_spec(top)
+    origin = getattr(spec, "origin", None) or ""
+    stdlib = sysconfig.get_paths()["stdlib"]
+    return bool(origin) and origin.startswith(stdlib) and "site-packages" not in origin
+
+
+def _module_exists(name: str) -> bool:
+    """name 이 실제 모듈(패키지의 하위 모듈 포함) 인지. 모듈 코드는 실행하지 않는다."""
+    parts = name.split(".")
+    spec = PathFinder.find_spec(parts[0])
+    for index in range(1, len(parts)):
+        if spec is None or not spec.submodule_search_locations:
+            return False
+        locations = list(spec.submodule_search_locations)
+        spec = PathFinder.find_spec(".".join(parts[: index + 1]), locations)
+    return spec is not None
+
+
+def _local_names(src_path: Path, main_py: Optional[Path]) -> Set[str]:
+    """src / main.py 옆에 있는 최상위 모듈/패키지 이름 (외부 모듈이 아님)."""
+    names: Set[str] = set()
+    roots = [src_path] + ([main_py.parent] if main_py is not None else [])
+    for root in roots:
+        if not root.is_dir():
+            continue
+        for entry in os.scandir(root):
+            if entry.is_dir() and entry.name not in _SKIP_DIRS:
+                names.add(entry.name)
+            elif entry.name.endswith((".py", ".pyx", ".pyd", ".so")):
+                names.add(entry.name.split(".")[0])
+    return names
+
+
+class ImportProposal(NamedTuple):
+    """propose_imports 의 결과."""
+
+    hidden_imports: List[str]           # 제안하는 hidden_imports (src 가 쓰는 외부 모듈)
+    exclude_module: List[str]           # 제안하는 exclude_module (쓰지 않는 의존성의 최상위 모듈)
+    unresolved: List[str]               # 설치된 배포판을 찾지 못한 최상위 모듈 (분석 환경에 없음)
+    used_by: Dict[str, List[str]]       # {hidden import: [그 모듈을 import 하는 파일]}
+    added: Dict[str, List[str]]         # 현재 설정 대비 추가 {"hidden_imports": [...], ...}
+    removed: Dict[str, List[str]]       # 현재 설정 대비 제거 (added 와 같은 형식)
+
+
+def propose_imports(
+    src_path: str | Path,
+    main_py: str | Path | None = None,
+    dependencies: Iterable[str] = (),
+    current: Optional[dict] = None,
+    cache_path: str | Path | None = None,
+) -> ImportProposal:
+    """src_path 와 main_py 를 분석해서 hidden_imports / exclude_module 을 제안한다.
+
+    - dependencies: pyproject 의 [project].dependencies 배포판 이름 (exclude 후보)
+    - current: 현재 pyi_config (hidden_imports / exclude_module 와의 차이를 계산)
+    - cache_path: 파일별 분석 결과 캐시 파일
+    """
+    src_path = Path(src_path)
+    main_py = Path(main_py) if main_py is not None else None
+    cache_path = Path(cache_path) if cache_path is not None else None
+    base = src_path.parent
+
+    files = _source_files(src_path)
+    if main_py is not None and main_py.is_file():
+        files.append(main_py)
+    imports = scan_imports(files, base, cache_path)
+    main_key = Path(os.path.relpath(main_py, base)).as_posix() if main_py is not None else None
+
+    local = _local_names(src_path, main_py)
+    distributions = top_level_distributions()
+
+    hidden: Dict[str, List[str]] = {}
+    main_imports: Set[str] = set()
+    used_tops: Set[str] = set()
+    for key, names in imports.items():
+        for name in names:
+            top = name.split(".")[0]
+            if top in local or top == "__future__" or _is_stdlib(top):
+                continue
+            used_tops.add(top)
+            if key == main_key:
+                main_imports.add(name)
+            else:
+                hidden.setdefault(name, []).append(key)
+
+    # from a import b 의 b 가 함수/클래스면 모듈이 아니므로 뺀다
+    # main.py 가 직접 import 하는 것은 PyInstaller 가 분석한다
+    hidden = {
+        name: sorted(users) for name, users in hidden.items()
+        if name not in main_imports and (name.split(".")[0] == name or _module_exists(name))
+    }
+    unresolved = sorted(top for top in used_tops if top not in distributions)
+
+    used_dists = {dist for top in used_tops for dist in distributions.get(top, [])}
+    needed = _required_closure(used_dists)
+    exclude = set()
+    for dependency in dependencies:
+        if _normalize(dependency) in needed:
+            continue
+        normalized = _normalize(dependency)
+        tops = [
+            top for top, dists in distributions.items()
+            if any(_normalize(d) == normalized for d in dists)
+        ]
+        # 설치되지 않은 배포판은 판단할 수 없으므로 제안하지 않는다
+        exclude.update(top for top in tops if not top.startswith("_") and top not in used_tops)
+
+    current = current or {}
+    proposal = {"hidden_imports": sorted(hidden), "exclude_module": sorted(exclude)}
+    added = {}
+    removed = {}
+    for key, values in proposal.items():
+        existing = list(current.get(key) or [])
+        added[key] = [v for v in values if v not in existing]
+        # exclude_module 은 사용자가 직접 넣은 것일 수 있으므로, 실제로 쓰는 모듈만 제거 대상으로 본다
+        if key == "exclude_module":
+            removed[key] = [v for v in existing if v.split(".")[0] in used_tops]
+        else:
+            removed[key] = [v for v in existing if v not in values]
+
+    return ImportProposal(
+        hidden_imports=proposal["hidden_imports"],
+        exclude_module=proposal["exclude_module"],
+        unresolved=unresolved,
+        used_by=hidden,
+        added=added,
+        removed=removed,
+    )
+
+
+def print_import_proposal(proposal: ImportProposal) -> None:
+    print("=" * 30)
+    for key in ("hidden_imports", "exclude_module"):
+        print(f"{key} : {len(getattr(proposal, key))} 개 제안")
+        for value in proposal.added[key]:
+            users = proposal.used_by.get(value)
+            if users:
+                more = " ..." if len(users) > 3 else ""
+                print(f"  + {value}  ({', '.join(users[:3])}{more})")
+            else:
+                print(f"  + {value}")
+        for value in proposal.removed[key]:
+            print(f"  - {value}")
+    if proposal.unresolved:
+        print(f"⚠ 설치된 배포판을 찾지 못한 모듈 (이 환경에 설치 후 다시 분석): {', '.join(proposal.unresolved)}")
+    print("=" * 30)
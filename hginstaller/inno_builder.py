@@ -1,8 +1,11 @@
 import subprocess
 import os
 import shutil
+import sys
 from pathlib import Path
+from .fingerprint import hash_file, hash_obj, load_stage_state, save_stage_state
 from .hg_settings import LocalSettings
+from .trace import span
 
 # 패키지 내부의 template.iss 파일 경로 가져오기
 try:
@@ -91,7 +94,8 @@ def update_iss(iss_file_path: Path):
     iss_config = LocalSettings.load("iss_config")
     
     # 기존 .iss 파일 읽기
-    lines = iss_file_path.read_text(encoding='utf-8').splitlines()
+    original = iss_file_path.read_text(encoding='utf-8')
+    lines = original.splitlines()
 
     
     # 설정 값 추출
@@ -122,8 +126,13 @@ def update_iss(iss_file_path: Path):
             # 다른 줄은 그대로 유지
             updated_lines.append(line)
     
-    # 업데이트된 내용 저장
+    # 내용이 바뀐 경우에만 저장 (mtime 유지 → ISCC 생략 판단에 유리)
     content = '\n'.join(updated_lines)
+    if original.endswith('\n'):
+        content += '\n'
+    if content == original:
+        print(f"✅ Inno Setup 스크립트 변경 없음: {iss_file_path}")
+        return str(iss_file_path)
     iss_file_path.write_text(content, encoding='utf-8')
     print(f"✅ Inno Setup 스크립트 업데이트 완료: {iss_file_path}")
     
@@ -131,12 +140,14 @@ def update_iss(iss_file_path: Path):
     
 
 
-def run_inno():
+def run_inno(force: bool = False):
     """Inno Setup 스크립트를 생성하고 컴파일한다.
     
     - .iss 파일이 없으면 init_iss()로 생성
     - .iss 파일이 있으면 update_iss()로 build_config와 iss_config 반영 (app_id는 유지)
     - Inno Setup 컴파일러로 .iss 파일을 컴파일하여 설치 파일 생성
+    - dist 트리와 .iss 가 마지막 컴파일 때와 같고 설치 파일이 있으면 컴파일 생략 (force=True 면 항상 실행)
+    - 반환값: 실제로 ISCC 를 실행했으면 True
     """
     build_config = LocalSettings.load("build_config")
     
@@ -162,13 +173,78 @@ def run_inno():
     iscc_path = global_iss_config["iss_path"]
     if not os.path.exists(iscc_path):
         raise FileNotFoundError(f"Inno Setup 컴파일러를 찾을 수 없습니다: {iscc_path}")
-    
+
+    # dist 결과물과 .iss 가 지난번과 같으면 설치 파일도 같으므로 컴파일 생략
+    fingerprint = inno_fingerprint(build_config, iss_file_path, iscc_path)
+    last = load_stage_state(build_src_path, "inno")
+    if (
+        not force
+        and last.get("fingerprint") == fingerprint["fingerprint"]
+        and installer_output_path(build_config).exists()
+    ):
+        print(f"Inno Setup up to date - dist 와 .iss 변경 없음: {installer_output_path(build_config)}")
+        save_stage_state(build_src_path, "inno", {**last, "files": fingerprint["files"]})
+        return False
+
     # Inno Setup 컴파일 실행
     print(f"### Inno Setup 컴파일 시작 ###")
     print(f"스크립트: {iss_file_path}")
-    subprocess.run([iscc_path, str(iss_file_path)], check=True)
+    with span("ISCC", "tool"):
+        subprocess.run(_iscc_command(iscc_path, iss_file_path), check=True)
     print(f"~~~ Inno Setup 컴파일 완료 ~~~")
-        
+    save_stage_state(build_src_path, "inno", fingerprint)
+    return True
+
+
+def _iscc_command(iscc_path: str, iss_file_path: Path) -> list:
+    """ISCC 실행 명령어. 테스트용 대역(.py 스크립트)도 ISCC 경로로 쓸 수 있다."""
+    if iscc_path.lower().endswith(".py"):
+        return [sys.executable, iscc_path, str(iss_file_path)]
+    return [iscc_path, str(iss_file_path)]
+
+
+def installer_output_path(build_config: dict) -> Path:
+    """template.iss 의 OutputDir / OutputBaseFilename 기준 설치 파일 경로."""
+    name = build_config["program_name"]
+    version = build_config["program_version"]
+    return Path(build_config["project_path"]) / "Output" / f"{name}_{version}_Setup.exe"
+
+
+def inno_fingerprint(build_config: dict, iss_file_path: Path, iscc_path: str) -> dict:
+    """dist 트리 + .iss + ISCC 경로의 fingerprint.
+
+    - dist 는 PyInstaller 가 매번 다시 쓰므로 mtime 이 아닌 내용 해시를 쓴다.
+    - 크기/수정시간이 지난번과 같은 파일은 이전 해시를 재사용한다.
+    반환값: {"fingerprint": 전체 해시, "files": {상대경로: [size, mtime_ns, 해시]}}
+    """
+    from .pyi_builder import dist_root
+
+    build_src_path = Path(build_config["build_src_path"])
+    dist_dir = dist_root(build_config) / build_config["program_name"]
+    previous = load_stage_state(build_src_path, "inno").get("files", {})
+
+    files = {}
+    for root, _, names in os.walk(dist_dir):
+        for name in names:
+            path = Path(root) / name
+            key = path.relative_to(dist_dir).as_posix()
+            st = path.stat()
+            old = previous.get(key)
+            if old and old[0] == st.st_size and old[1] == st.st_mtime_ns:
+                digest = old[2]
+            else:
+                digest = hash_file(path)
+            files[key] = [st.st_size, st.st_mtime_ns, digest]
+
+    return {
+        "fingerprint": hash_obj({
+            "iss": hash_file(iss_file_path),
+            "iscc": str(iscc_path),
+            "dist": {key: value[2] for key, value in files.items()},
+        }),
+        "files": files,
+    }
+
 
 def gen_appid():
     import uuid
@@ -1,82 +1,614 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Literal, Optional, Tuple
+from typing import Dict, List, Literal, NamedTuple, Optional, Tuple
 import os
 import shutil
+import sys
+import sysconfig
+import time
 from setuptools import Extension, setup
 
+from .build_profiles import BuildProfiles
+from .cython_deps import (
+    SOURCE_SUFFIXES,
+    DependencyGraph,
+    build_dependency_graph,
+    relative_key,
+    transitive_dependencies,
+)
+from .ext_cache import ExtensionCache
+from .fingerprint import hash_file, hash_obj, load_state, save_state
+from .trace import get_tracer, span
+from .unity import UnitySpec, link_unity_extensions, unity_groups, write_unity_loader
+
 
 Status = Literal[
-    "py_missing",     # input .py 가 없음
+    "py_missing",     # input .py 가 없음 (산출물만 남은 모듈, prune_artifacts 에서 사용)
     "pyd_missing",    # output 에 대응되는 .pyd 가 전혀 없음
     "py_newer",       # .py 가 가장 최신 .pyd 보다 더 최신
     "pyd_newer",      # 가장 최신 .pyd 가 .py 보다 더 최신
     "same_mtime",     # 둘의 수정 시간이 동일 (초 단위)
+    "hash_changed",   # manifest 에 기록된 소스 해시와 현재 내용이 다름
+    "dep_changed",    # cimport / include / .pxd 로 참조하는 파일이 바뀜
+    "env_changed",    # Cython 버전 / ABI / Extension 옵션이 바뀜
+    "up_to_date",     # manifest 기준 소스 해시와 빌드 환경이 모두 동일
 ]
 
+# 실제로 빌드가 필요한 상태들
+BUILD_STATUSES = ("pyd_missing", "py_newer", "hash_changed", "dep_changed", "env_changed")
 
-def find_pyd_target(
-    input_root: str | Path,
-    output_root: str | Path,
-) -> list[Tuple[Path, Optional[Path], Status]]:
+# output_root 에 저장되는 빌드 manifest 파일 이름
+MANIFEST_NAME = ".py2pyd_manifest.json"
+MANIFEST_VERSION = 2
+
+
+def build_environment(ext_options: dict | None = None) -> dict:
+    """.pyd 결과물에 영향을 주는 소스 외 입력값들을 모은다.
+
+    - Cython 버전, 인터프리터 ABI(EXT_SUFFIX), 플랫폼, Extension 옵션
     """
-    ### CLEAR ###
-    input_root 아래 모든 .py 와 output_root 아래 대응 .pyd 의 관계를 조사한다.
+    try:
+        import Cython
+        cython_version = Cython.__version__
+    except ImportError:
+        cython_version = None
 
-    - __init__.py 는 pyd 대상으로 만들지 않으므로 스킵한다.
-    - 결과에는 실제로 빌드 대상이 되는 것들만 포함한다.
-      (pyd 가 없거나(pyd_missing) py 가 더 최신(py_newer) 인 경우)
+    return {
+        "cython": cython_version,
+        "python": sys.implementation.cache_tag,
+        "abi": sysconfig.get_config_var("EXT_SUFFIX"),
+        "platform": sysconfig.get_platform(),
+        "ext_options": ext_options or {},
+    }
+
+
+def load_manifest(output_root: str | Path) -> dict:
+    """output_root 의 manifest 를 읽는다. 버전이 다르면 빈 manifest 로 취급."""
+    data = load_state(Path(output_root) / MANIFEST_NAME)
+    if data.get("version") != MANIFEST_VERSION or not isinstance(data.get("modules"), dict):
+        return {"version": MANIFEST_VERSION, "modules": {}}
+    return data
+
+
+def save_manifest(output_root: str | Path, manifest: dict) -> None:
+    manifest["version"] = MANIFEST_VERSION
+    save_state(Path(output_root) / MANIFEST_NAME, manifest)
+
+
+def _manifest_key(py_path: Path, input_root: Path) -> str:
+    """manifest 키는 OS 에 무관하게 input_root 기준 posix 상대경로로 쓴다."""
+    return relative_key(py_path, input_root)
+
+
+def _module_env_hash(
+    env_hash: str,
+    profiles: BuildProfiles | None,
+    key: str,
+    bundle: str | None = None,
+) -> str:
+    """모듈에 프로필 옵션 / unity 묶음이 있으면 빌드 환경 해시에 포함한다 (없으면 공통 해시 그대로)."""
+    options = profiles.options_for(key) if profiles is not None else {}
+    extra = {}
+    if options:
+        extra["profile"] = options
+    if bundle is not None:
+        extra["unity"] = bundle
+    return hash_obj({"env": env_hash, **extra}) if extra else env_hash
+
+
+def module_keys(sources: Dict[Path, os.stat_result], input_root: Path) -> list[str]:
+    """pyd 대상 모듈(__init__.py 제외 .py) 의 manifest 키 목록."""
+    return [
+        _manifest_key(py_path, input_root)
+        for py_path in sources
+        if py_path.suffix == ".py" and py_path.name != "__init__.py"
+    ]
+
+
+# 빌드 결과물로 인정하는 확장 모듈 접미사 (Windows: .pyd, Linux/macOS: .so)
+ARTIFACT_SUFFIXES = (".pyd", ".so")
+
+# (input_root 기준 상대 폴더 parts, 모듈 stem) -> [(산출물 경로, stat), ...]
+ArtifactIndex = Dict[Tuple[Tuple[str, ...], str], List[Tuple[Path, os.stat_result]]]
+
+
+def _walk_files(root: Path):
+    """os.scandir 로 root 아래 파일을 한 번씩만 돌면서 (경로, 상대 parts, DirEntry) 를 돌려준다."""
+    stack: list[Tuple[Path, Tuple[str, ...]]] = [(root, ())]
+    while stack:
+        directory, rel_parts = stack.pop()
+        try:
+            it = os.scandir(directory)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        with it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        stack.append((Path(entry.path), rel_parts + (entry.name,)))
+                    elif entry.is_file():
+                        yield Path(entry.path), rel_parts, entry
+                except OSError:
+                    continue
+
+
+def scan_sources(input_root: str | Path) -> Dict[Path, os.stat_result]:
+    """input_root 를 한 번 돌아서 Cython 관련 소스(.py/.pyx/.pxd/.pxi) 의 stat 을 모은다.
+
+    - Windows 에서는 DirEntry.stat() 이 디렉토리 목록 조회 결과를 재사용하므로 추가 시스템 콜이 없다.
     """
+    sources: Dict[Path, os.stat_result] = {}
+    for path, _, entry in _walk_files(Path(input_root)):
+        if os.path.splitext(entry.name)[1] in SOURCE_SUFFIXES:
+            sources[path] = entry.stat()
+    return sources
 
-    input_root = Path(input_root)
-    output_root = Path(output_root)
 
-    results: list[Tuple[Path, Optional[Path], Status]] = []
+def split_artifact_name(name: str) -> Optional[Tuple[str, str]]:
+    """"a.cp311-win_amd64.pyd" -> ("a", "cp311-win_amd64"). 확장 모듈이 아니면 None."""
+    for suffix in ARTIFACT_SUFFIXES:
+        if name.endswith(suffix):
+            stem, sep, tag = name[: -len(suffix)].partition(".")
+            if sep and tag and stem:
+                return stem, tag
+    return None
+
+
+def scan_artifacts(output_root: str | Path) -> ArtifactIndex:
+    """output_root 를 한 번 돌아서 모듈별 확장 모듈 산출물 인덱스를 만든다."""
+    index: ArtifactIndex = {}
+    for path, rel_parts, entry in _walk_files(Path(output_root)):
+        parsed = split_artifact_name(entry.name)
+        if parsed is None:
+            continue
+        index.setdefault((rel_parts, parsed[0]), []).append((path, entry.stat()))
+    return index
+
+
+class ModuleState(NamedTuple):
+    """_collect_status 가 모듈마다 만드는 판단 결과."""
+
+    py_path: Path
+    pyd_path: Optional[Path]
+    status: Status
+    digest: Optional[str]           # 소스 해시
+    deps: Dict[str, str]            # 전이적 의존 파일 {input_root 기준 상대경로: 해시}
+    reason: str                     # explain 출력용 설명
+
+
+def _collect_status(
+    input_root: Path,
+    output_root: Path,
+    ext_options: dict | None = None,
+    graph: DependencyGraph | None = None,
+    sources: Dict[Path, os.stat_result] | None = None,
+    manifest: dict | None = None,
+    profiles: BuildProfiles | None = None,
+    unity_map: Dict[str, str] | None = None,
+) -> list[ModuleState]:
+    """input_root 의 모든 모듈에 대해 빌드 필요 여부를 판단한다.
+
+    - input_root / output_root 는 각각 한 번씩만 스캔한다 (scan_sources / scan_artifacts).
+    - manifest 에 기록이 있으면 소스 해시 + 의존 파일 해시 + 빌드 환경 해시로 판단한다.
+      크기/수정시간이 기록과 같으면 파일을 다시 읽지 않고 기록된 해시를 쓴다.
+    - 기록이 없으면(이전 버전으로 빌드된 결과물) 기존처럼 mtime 으로 판단한다.
+    - unity_map: {모듈 key: 묶음 모듈명}. 묶음에 든 모듈은 묶음 산출물을 기준으로 판단한다.
+    """
+    unity_map = unity_map or {}
+    if manifest is None:
+        manifest = load_manifest(output_root)
+    if sources is None:
+        sources = scan_sources(input_root)
+    file_cache = manifest.setdefault("files", {})
+    if graph is None:
+        graph = build_dependency_graph(input_root, sources, file_cache)
+    recorded = manifest["modules"]
+    env_hash = hash_obj(build_environment(ext_options))
+    artifacts = scan_artifacts(output_root)
+
+    def _hash(path: Path) -> str:
+        key = _manifest_key(path, input_root)
+        st = sources.get(path) or path.stat()
+        entry = file_cache.get(key)
+        if (
+            entry is None
+            or entry.get("size") != st.st_size
+            or entry.get("mtime_ns") != st.st_mtime_ns
+        ):
+            entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+            file_cache[key] = entry
+        if "hash" not in entry:
+            entry["hash"] = hash_file(path)
+        return entry["hash"]
 
-    for py_path in input_root.rglob("*.py"):
-        if not py_path.is_file():
+    results: list[ModuleState] = []
+
+    for py_path, py_stat in sources.items():
+        if py_path.suffix != ".py":
             continue
 
         # init 은 pyd 안 만들기로 함
         if py_path.name == "__init__.py":
             continue
 
-        relative_py = py_path.relative_to(input_root)
+        py_key = _manifest_key(py_path, input_root)
+
+        chains = transitive_dependencies(graph, py_path)
+        deps = {_manifest_key(dep, input_root): _hash(dep) for dep in chains}
 
-        pyd_dir = output_root / relative_py.parent
-        file_stem = py_path.stem
+        digest = _hash(py_path)
 
-        candidates = list(pyd_dir.glob(f"{file_stem}.*.pyd"))
+        bundle = unity_map.get(py_key)
+        if bundle is not None:
+            bundle_parts = tuple(bundle.split("."))
+            candidates = artifacts.get((bundle_parts[:-1], bundle_parts[-1]))
+        else:
+            candidates = artifacts.get((tuple(py_key.split("/")[:-1]), py_path.stem))
         latest_pyd: Optional[Path]
         if not candidates:
             # pyd 가 아예 없으면 빌드 대상
-            results.append((py_path, None, "pyd_missing"))
+            results.append(ModuleState(py_path, None, "pyd_missing", digest, deps, "pyd 없음"))
             continue
 
-        latest_pyd = max(candidates, key=lambda p: p.stat().st_mtime)
+        latest_pyd, latest_stat = max(candidates, key=lambda c: c[1].st_mtime)
+
+        entry = recorded.get(py_key)
+        if entry is not None:
+            old_deps = entry.get("deps", {})
+            dep_keys = {dep: _manifest_key(dep, input_root) for dep in chains}
+            changed = sorted(
+                dep for dep, key in dep_keys.items() if old_deps.get(key) != deps[key]
+            )
+            removed = sorted(set(old_deps) - set(deps))
+            if entry.get("hash") != digest:
+                status: Status = "hash_changed"
+                reason = "소스 내용 변경"
+            elif changed or removed:
+                status = "dep_changed"
+                lines = [
+                    " -> ".join(_manifest_key(p, input_root) for p in chains[dep])
+                    for dep in changed
+                ]
+                lines += [f"{dep} (의존성 제거됨)" for dep in removed]
+                reason = "의존 파일 변경: " + "; ".join(lines)
+            elif entry.get("env") != _module_env_hash(env_hash, profiles, py_key, bundle):
+                status = "env_changed"
+                reason = "빌드 환경(Cython/ABI/Extension 옵션/빌드 프로필/unity 묶음) 변경"
+            else:
+                status = "up_to_date"
+                reason = "최신"
+            results.append(ModuleState(py_path, latest_pyd, status, digest, deps, reason))
+            continue
 
-        py_mtime = py_path.stat().st_mtime
-        pyd_mtime = latest_pyd.stat().st_mtime
+        py_mtime = py_stat.st_mtime
+        pyd_mtime = latest_stat.st_mtime
+        newer_deps = [
+            dep for dep in chains
+            if (sources.get(dep) or dep.stat()).st_mtime > pyd_mtime
+        ]
 
         if py_mtime > pyd_mtime:
-            status: Status = "py_newer"
+            status = "py_newer"
+            reason = ".py 가 .pyd 보다 최신"
+        elif newer_deps:
+            status = "dep_changed"
+            reason = "의존 파일이 .pyd 보다 최신: " + "; ".join(
+                " -> ".join(_manifest_key(p, input_root) for p in chains[dep])
+                for dep in sorted(newer_deps)
+            )
         elif py_mtime < pyd_mtime:
             status = "pyd_newer"
+            reason = ".pyd 가 .py 보다 최신"
         else:
             status = "same_mtime"
+            reason = "수정 시간 동일"
+
+        results.append(ModuleState(py_path, latest_pyd, status, digest, deps, reason))
 
-        # 실제 빌드 대상만 리스트에 추가
-        if status in ("py_newer", "pyd_missing"):
-            results.append((py_path, latest_pyd, status))
-            
     return results
 
+
+def find_pyd_target(
+    input_root: str | Path,
+    output_root: str | Path,
+    ext_options: dict | None = None,
+    profiles: BuildProfiles | None = None,
+    unity: UnitySpec | None = None,
+) -> list[Tuple[Path, Optional[Path], Status]]:
+    """
+    ### CLEAR ###
+    input_root 아래 모든 .py 와 output_root 아래 대응 .pyd 의 관계를 조사한다.
+
+    - __init__.py 는 pyd 대상으로 만들지 않으므로 스킵한다.
+    - output_root 의 manifest 에 기록된 소스 해시 / 의존 파일(.pxd, .pxi) 해시 /
+      빌드 환경과 비교해서 실제 입력이 바뀐 모듈만 빌드 대상으로 고른다.
+    - 결과에는 실제로 빌드 대상이 되는 것들만 포함한다.
+      (pyd_missing, py_newer, hash_changed, dep_changed, env_changed)
+    - unity: 묶음 안의 모듈이 하나라도 빌드 대상이면 그 묶음의 모듈을 모두 포함한다.
+    """
+    input_root = Path(input_root)
+    sources = scan_sources(input_root)
+    unity_map = unity_groups(module_keys(sources, input_root), unity)
+    statuses = _collect_status(
+        input_root,
+        Path(output_root),
+        ext_options,
+        sources=sources,
+        profiles=profiles,
+        unity_map=unity_map,
+    )
+    return [
+        (state.py_path, state.pyd_path, state.status)
+        for state in build_states(statuses, input_root, unity_map)
+    ]
+
+
+def build_states(
+    statuses: list[ModuleState],
+    input_root: Path,
+    unity_map: Dict[str, str] | None = None,
+) -> list[ModuleState]:
+    """빌드할 모듈. unity 묶음은 멤버 하나만 바뀌어도 묶음 전체를 다시 링크해야 하므로 함께 고른다."""
+    unity_map = unity_map or {}
+    rebuild = {
+        unity_map.get(_manifest_key(state.py_path, input_root))
+        for state in statuses
+        if state.status in BUILD_STATUSES
+    }
+    return [
+        state for state in statuses
+        if state.status in BUILD_STATUSES
+        or unity_map.get(_manifest_key(state.py_path, input_root), False) in rebuild
+    ]
+
+
+def explain_targets(
+    statuses: list[ModuleState],
+    input_root: str | Path,
+    graph: DependencyGraph,
+    unity_map: Dict[str, str] | None = None,
+) -> None:
+    """각 모듈의 빌드 여부와 이유, 직접 의존성을 출력한다.
+
+    - unity 묶음이 다시 링크되면, 그 자체는 바뀌지 않은 멤버도 BUILD 로 표시하고 묶음을 이유로 든다.
+    """
+    input_root = Path(input_root)
+    unity_map = unity_map or {}
+    rebuilt = {state.py_path for state in build_states(statuses, input_root, unity_map)}
+    print("=" * 30)
+    print("py2pyd explain")
+    for state in sorted(statuses, key=lambda s: s.py_path):
+        key = _manifest_key(state.py_path, input_root)
+        mark = "BUILD" if state.py_path in rebuilt else "skip "
+        reason = f"{state.status} - {state.reason}"
+        bundle = unity_map.get(key)
+        if bundle is not None and state.py_path in rebuilt and state.status not in BUILD_STATUSES:
+            reason = f"unity 묶음 {bundle} 다시 링크 ({reason})"
+        elif bundle is not None:
+            reason = f"{reason} [unity 묶음 {bundle}]"
+        print(f"[{mark}] {key} : {reason}")
+        for dep in sorted(graph.get(state.py_path, ())):
+            print(f"          depends on {_manifest_key(dep, input_root)}")
+    print("=" * 30)
+
+
+class StaleArtifact(NamedTuple):
+    """prune_artifacts 가 지울 대상으로 고른 산출물."""
+
+    path: Path
+    module: str                     # a.b 형식 모듈명
+    status: Literal["py_missing", "old_abi", "c_orphan", "obj_orphan", "unity_member"]
+    size: int
+
+
+# build_ext 가 build_temp 에 남기는 컴파일 중간 산출물 (gcc/clang: .o, MSVC: .obj / .lib / .exp)
+OBJECT_SUFFIXES = (".o", ".obj", ".lib", ".exp")
+
+
+def _object_module(
+    rel_parts: Tuple[str, ...], name: str, build_temp: Path
+) -> Optional[Tuple[Tuple[str, ...], str]]:
+    """build_temp 기준 object 파일 위치에서 (패키지 parts, 모듈 stem) 을 구한다. 모르는 파일이면 None.
+
+    - build_ext 는 C 경로(build_temp/c/a/b.c) 에서 드라이브/맨 앞 구분자만 떼고 build_temp 아래에
+      그대로 object 를 만든다 (build_temp/.../<build_temp 이름>/c/a/b.o). 빌드 때의 cwd 에 따라 앞부분이
+      달라지므로 마지막 <build_temp 이름>/c 뒤를 패키지 구조로 본다.
+    """
+    if os.path.splitext(name)[1] not in OBJECT_SUFFIXES:
+        return None
+    for i in range(len(rel_parts) - 2, -1, -1):
+        if rel_parts[i:i + 2] == (build_temp.name, "c"):
+            return rel_parts[i + 2:], name.split(".", 1)[0]
+    return None
+
+
+def find_stale_artifacts(
+    input_root: str | Path,
+    output_root: str | Path,
+    sources: Dict[Path, os.stat_result] | None = None,
+    build_temp: str | Path | None = None,
+) -> list[StaleArtifact]:
+    """output_root (와 build_temp/c) 에서 더 이상 필요 없는 산출물을 찾는다.
+
+    - py_missing: 대응하는 .py 가 없는 확장 모듈 (지워지거나 이름이 바뀐 모듈)
+    - old_abi: 현재 ABI 산출물이 있는 모듈의 다른 ABI 태그 산출물 (예: 3.10 으로 빌드했던 .pyd)
+    - c_orphan: build_temp/c 에 남은, 소스가 없는 모듈의 생성 C (와 annotate HTML)
+    - obj_orphan: build_temp 에 남은, 소스가 없는 모듈의 object 파일
+      (ABI 가 달라도 C / object 경로는 같으므로 old_abi 모듈의 중간 산출물은 따로 없다)
+    - unity_member: unity 묶음에 들어간 모듈이 따로 빌드되어 남아 있는 산출물
+    - input_root / output_root 는 각각 한 번씩만 스캔한다.
+    - unity 묶음은 마지막 py2pyd 가 manifest 에 기록한 것을 기준으로 한다.
+    """
+    input_root = Path(input_root)
+    output_root = Path(output_root)
+    if sources is None:
+        sources = scan_sources(input_root)
+    modules = set()
+    for py_path in sources:
+        if py_path.suffix == ".py":
+            parts = tuple(_manifest_key(py_path, input_root).split("/"))
+            modules.add((parts[:-1], py_path.stem))
+    unity_map = load_manifest(output_root).get("unity", {})
+    members = set()
+    for key, bundle in unity_map.items():
+        parts = tuple(key.split("/"))
+        if (parts[:-1], parts[-1][:-3]) in modules:
+            members.add((parts[:-1], parts[-1][:-3]))
+            bundle_parts = tuple(bundle.split("."))
+            modules.add((bundle_parts[:-1], bundle_parts[-1]))
+
+    current_tag = split_artifact_name("x" + (sysconfig.get_config_var("EXT_SUFFIX") or ""))
+    current_tag = current_tag[1] if current_tag else None
+
+    stale: list[StaleArtifact] = []
+    for (rel_parts, stem), candidates in scan_artifacts(output_root).items():
+        module = ".".join(rel_parts + (stem,))
+        if (rel_parts, stem) not in modules:
+            for path, st in candidates:
+                stale.append(StaleArtifact(path, module, "py_missing", st.st_size))
+            continue
+        if (rel_parts, stem) in members:
+            for path, st in candidates:
+                stale.append(StaleArtifact(path, module, "unity_member", st.st_size))
+            continue
+        tags = {path: split_artifact_name(path.name)[1] for path, _ in candidates}
+        if current_tag in tags.values():
+            for path, st in candidates:
+                if tags[path] != current_tag:
+                    stale.append(StaleArtifact(path, module, "old_abi", st.st_size))
+
+    build_temp = Path(build_temp if build_temp is not None else default_build_temp(output_root))
+    for path, rel_parts, entry in _walk_files(build_temp):
+        if rel_parts[:1] == ("c",):
+            stem, ext = os.path.splitext(entry.name)
+            # annotate HTML 도 C 와 함께 정리한다
+            if ext in (".c", ".html") and (rel_parts[1:], stem) not in modules:
+                module = ".".join(rel_parts[1:] + (stem,))
+                stale.append(StaleArtifact(path, module, "c_orphan", entry.stat().st_size))
+            continue
+        owner = _object_module(rel_parts, entry.name, build_temp)
+        if owner is not None and owner not in modules:
+            module = ".".join(owner[0] + (owner[1],))
+            stale.append(StaleArtifact(path, module, "obj_orphan", entry.stat().st_size))
+
+    return sorted(stale, key=lambda a: (a.module, a.path))
+
+
+def _remove_empty_dirs(root: Path, start: Path) -> None:
+    """start 부터 root 바로 아래까지 비어 있는 폴더를 지운다 (root 자체는 남김)."""
+    directory = start
+    while directory != root and root in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
+
+
+def prune_artifacts(
+    input_root: str | Path,
+    output_root: str | Path,
+    dry_run: bool = True,
+    sources: Dict[Path, os.stat_result] | None = None,
+    build_temp: str | Path | None = None,
+) -> list[StaleArtifact]:
+    """소스가 없는 산출물과 이전 ABI 중복 산출물을 output_root 에서 지운다.
+
+    - add_data 로 output_root 전체가 앱에 묶이므로, 죽은 모듈이 남아 있으면 설치 파일이 커진다.
+    - 지운 모듈의 생성 C / object 파일도 build_temp 에서 함께 지운다.
+    - dry_run=True 면 지우지 않고 목록만 출력한다.
+    - 반환값: 대상 산출물 목록
+    """
+    output_root = Path(output_root)
+    build_temp = Path(build_temp) if build_temp is not None else default_build_temp(output_root)
+    stale = find_stale_artifacts(input_root, output_root, sources, build_temp)
+    if not stale:
+        return stale
+
+    mark = "DRY-RUN" if dry_run else "REMOVE"
+    for artifact in stale:
+        print(
+            f"[{mark}] {artifact.module} : {artifact.status} - {artifact.path.name}"
+            f" ({artifact.size / 1024:.1f} KB)"
+        )
+    total = sum(a.size for a in stale)
+    suffix = " (dry-run)" if dry_run else ""
+    print(f"prune : {len(stale)} 파일, {total / (1024 * 1024):.2f} MB{suffix}")
+    if dry_run:
+        return stale
+
+    c_state_path = build_temp / "c" / CGEN_MANIFEST_NAME
+    c_state = load_state(c_state_path)
+    for artifact in stale:
+        try:
+            artifact.path.unlink()
+        except FileNotFoundError:
+            pass
+        in_output = artifact.status in ("py_missing", "old_abi", "unity_member")
+        root = output_root if in_output else build_temp
+        _remove_empty_dirs(root, artifact.path.parent)
+        if artifact.status == "c_orphan":
+            c_state.pop(artifact.module, None)
+    if c_state_path.is_file():
+        save_state(c_state_path, c_state)
+    return stale
+
+
+def update_manifest(
+    statuses: list[ModuleState],
+    input_root: str | Path,
+    output_root: str | Path,
+    ext_options: dict | None = None,
+    file_cache: Dict[str, dict] | None = None,
+    profiles: BuildProfiles | None = None,
+    unity_map: Dict[str, str] | None = None,
+) -> None:
+    """빌드가 끝난 뒤 현재 소스/의존 파일 해시와 빌드 환경을 manifest 에 기록한다.
+
+    - 이번에 빌드된 모듈과 이미 최신인 모듈을 모두 기록한다.
+    - 사라진 소스의 기록은 제거된다.
+    - file_cache: 스캔 중 모은 파일별 {size, mtime_ns, hash, deps} (다음 스캔의 재사용용)
+    - unity_map: {모듈 key: 묶음 모듈명} (prune 에서 묶음 산출물을 알아보는 데 쓴다)
+    """
+    unity_map = unity_map or {}
+    input_root = Path(input_root)
+    env_hash = hash_obj(build_environment(ext_options))
+
+    modules = {}
+    for state in statuses:
+        digest = state.digest if state.digest is not None else hash_file(state.py_path)
+        key = _manifest_key(state.py_path, input_root)
+        modules[key] = {
+            "hash": digest,
+            "deps": state.deps,
+            "env": _module_env_hash(env_hash, profiles, key, unity_map.get(key)),
+        }
+
+    manifest = {"env": build_environment(ext_options), "modules": modules}
+    if unity_map:
+        manifest["unity"] = dict(unity_map)
+    if file_cache is not None:
+        manifest["files"] = file_cache
+    save_manifest(output_root, manifest)
+
+
 def set_extentions(
     targets: list[Tuple[Path, Optional[Path], Status]],
     input_root: str | Path,
+    ext_options: dict | None = None,
+    profiles: BuildProfiles | None = None,
+    unity_map: Dict[str, str] | None = None,
 ) -> list[Extension]:
-    """Extension name 을 패키지 경로 기준으로 a.b 형식으로 만든다."""
+    """Extension name 을 패키지 경로 기준으로 a.b 형식으로 만든다.
+
+    - ext_options: Extension 에 그대로 넘길 추가 옵션 (manifest 의 빌드 환경에도 기록됨)
+    - profiles: 모듈별 최적화 프로필. 프로필 플래그 뒤에 ext_options 의 플래그가 붙으므로
+      ext_options 쪽이 우선한다.
+    - unity_map: {모듈 key: 묶음 모듈명}. 지정된 모듈은 ext.unity_bundle 에 묶음 이름을 기록하고,
+      run_setup / Py2PydBuilder 가 cythonize 뒤에 묶음 Extension 하나로 링크한다 (unity 참고).
+    """
+    unity_map = unity_map or {}
 
     input_root = Path(input_root)
     extensions: list[Extension] = []
@@ -86,20 +618,268 @@ def set_extentions(
         relative = py_path.relative_to(input_root).with_suffix("")
         module_name = ".".join(relative.parts)
 
-        extensions.append(Extension(module_name, [str(py_path)]))
+        options = dict(ext_options or {})
+        directives = {}
+        if profiles is not None:
+            profile = profiles.options_for(relative.with_suffix(".py").as_posix())
+            for flag in ("extra_compile_args", "extra_link_args"):
+                if profile.get(flag):
+                    options[flag] = profile[flag] + list(options.get(flag) or [])
+            directives = profile.get("cython_directives", {})
+
+        ext = Extension(module_name, [str(py_path)], **options)
+        # _cythonize_one 에서 Cython 컴파일러 지시어로 사용
+        ext.cython_directives = directives
+        ext.unity_bundle = unity_map.get(relative.with_suffix(".py").as_posix())
+        extensions.append(ext)
 
     return extensions
 
 
+def _traced_build_ext():
+    """확장 모듈 하나의 C 컴파일/링크마다 trace span 을 남기는 build_ext."""
+    from setuptools.command.build_ext import build_ext
+
+    class TracedBuildExt(build_ext):
+        def build_extension(self, ext):
+            with span(f"compile {ext.name}", "compile"):
+                return super().build_extension(ext)
+
+    return TracedBuildExt
+
+
+def ext_output_path(ext: Extension, output_root: str | Path) -> Path:
+    """build_ext --build-lib 기준으로 확장 모듈이 떨어지는 경로 (a.b -> a/b<EXT_SUFFIX>)."""
+    parts = ext.name.split(".")
+    ext_suffix = sysconfig.get_config_var("EXT_SUFFIX")
+    return Path(output_root).joinpath(*parts[:-1]) / (parts[-1] + ext_suffix)
+
+
+def _init_cython_worker() -> None:
+    """worker 시작 시 Cython 컴파일러를 미리 로드해서 모듈별 시간에서 제외한다."""
+    import Cython.Build  # noqa: F401
+    import Cython.Compiler.Main  # noqa: F401
+    import Cython.Compiler.ParseTreeTransforms  # noqa: F401
+    import Cython.Compiler.Pipeline  # noqa: F401
+    from Cython.Compiler.Lexicon import make_lexicon
+    from Cython.Compiler import Scanning
+
+    # 첫 모듈 변환 때 만들어지는 lexicon 을 미리 만들어 둔다
+    if getattr(Scanning, "lexicon", None) is None:
+        Scanning.lexicon = make_lexicon()
+
+
+def _cythonize_one(
+    ext: Extension,
+    c_path: str | None = None,
+    include_dir: str | None = None,
+    annotate: bool = False,
+) -> Tuple[Extension, float, float, int]:
+    """프로세스 풀 worker: Extension 하나를 .py -> .c 로 변환한다.
+
+    - c_path: 생성할 C 파일 경로 (None 이면 소스 옆)
+    - include_dir: cimport 할 .pxd 를 찾을 기준 폴더 (보통 input_root)
+    - annotate: True 면 C 옆에 annotate HTML(<모듈>.html) 도 만든다
+    반환값: (sources 가 .c 로 바뀐 Extension, 걸린 시간, 시작 시각(epoch), worker pid)
+    """
+    from Cython.Build.Dependencies import cythonize_one
+    from Cython.Compiler.Main import CompilationOptions, default_options
+
+    wall_start = time.time()
+    start = time.perf_counter()
+    source = ext.sources[0]
+    if c_path is None:
+        c_path = os.path.splitext(source)[0] + ".c"
+    os.makedirs(os.path.dirname(c_path), exist_ok=True)
+    options = CompilationOptions(
+        default_options,
+        include_path=[include_dir] if include_dir else ["."],
+        compiler_directives=dict(getattr(ext, "cython_directives", None) or {}),
+        annotate=annotate,
+    )
+    # Cython 3.0.x 는 fingerprint 가 기본값 없는 인자이므로 명시적으로 넘긴다
+    cythonize_one(
+        source, c_path, fingerprint=None, quiet=True, options=options, full_module_name=ext.name
+    )
+    ext.sources = [c_path] + list(ext.sources[1:])
+    return ext, time.perf_counter() - start, wall_start, os.getpid()
+
+
+# c_root 에 모듈별로 마지막에 C 를 생성할 때의 입력 키를 기록하는 파일
+CGEN_MANIFEST_NAME = ".cgen_manifest.json"
+# py2pyd(annotate=True) 의 노란 줄 요약 (build_temp 기준)
+ANNOTATE_SUMMARY_NAME = "annotate_summary.json"
+
+# Extension 옵션 중 C 컴파일/링크에만 쓰이고 Cython 이 만드는 C 코드에는 영향이 없는 것들
+_COMPILE_ONLY_OPTIONS = (
+    "extra_compile_args",
+    "extra_link_args",
+    "define_macros",
+    "undef_macros",
+    "include_dirs",
+    "library_dirs",
+    "libraries",
+    "runtime_library_dirs",
+    "extra_objects",
+)
+
+
+def default_build_temp(output_root: str | Path) -> Path:
+    """output_root 옆의 빌드 임시 폴더 (build_src/src_pyd -> build_src/src_pyd_build).
+
+    - 생성된 C 와 object 파일을 여기에 두고 빌드 사이에 유지한다.
+    - output_root 안에 두지 않는 것은 add_data(build_src/src_pyd/*) 로 앱에 같이 묶이지 않게 하기 위함.
+    """
+    output_root = Path(output_root)
+    return output_root.with_name(output_root.name + "_build")
+
+
+def c_source_path(ext: Extension, c_root: str | Path) -> Path:
+    """a.b -> c_root/a/b.c (패키지 구조를 그대로 따른다)."""
+    parts = ext.name.split(".")
+    return Path(c_root).joinpath(*parts[:-1]) / (parts[-1] + ".c")
+
+
+def c_source_key(
+    state: ModuleState,
+    ext_options: dict | None = None,
+    directives: dict | None = None,
+) -> str:
+    """생성되는 C 코드를 결정하는 입력(소스/의존 파일 해시, Cython 버전, Cython 관련 옵션/지시어) 의 해시."""
+    options = {k: v for k, v in (ext_options or {}).items() if k not in _COMPILE_ONLY_OPTIONS}
+    if directives:
+        options["cython_directives"] = directives
+    return hash_obj({
+        "source": state.digest if state.digest is not None else hash_file(state.py_path),
+        "deps": state.deps,
+        "cython": build_environment()["cython"],
+        "options": options,
+    })
+
+
+def cythonize_extensions(
+    extensions: list[Extension],
+    workers: int | None = None,
+    report_top: int = 10,
+    c_root: str | Path | None = None,
+    c_keys: Dict[str, str] | None = None,
+    include_dir: str | Path | None = None,
+    pool=None,
+    annotate: bool = False,
+) -> Tuple[list[Extension], Dict[str, float]]:
+    """Cython 의 .py -> .c 변환을 프로세스 풀에서 병렬로 수행한다.
+
+    - build_ext --parallel 은 C 컴파일만 병렬화하므로, 변환 단계는 여기서 따로 돌린다.
+    - c_root: C 를 생성할 폴더 (패키지 구조를 따름). None 이면 소스 옆에 생성한다.
+    - c_keys: {모듈명: c_source_key}. c_root 에 같은 키로 생성된 C 가 남아 있으면 다시 만들지 않는다.
+    - pool: 지정하면 새 프로세스 풀 대신 이 executor 를 쓴다 (Py2PydBuilder).
+    - annotate: annotate HTML 도 만든다. HTML 이 없으면 키가 같아도 다시 변환한다.
+    - 반환값: (sources 가 .c 로 바뀐 Extension 목록, {모듈명: 변환 시간(초)})
+    - Windows 에서는 프로세스를 spawn 하므로 빌드 스크립트에
+      if __name__ == "__main__": 가드가 필요하다.
+    """
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 1) - 1)
+    c_keys = c_keys or {}
+    include = str(include_dir) if include_dir is not None else None
+
+    state_path = Path(c_root) / CGEN_MANIFEST_NAME if c_root is not None else None
+    state = load_state(state_path) if state_path is not None else {}
+    todo: list[Extension] = []
+    c_paths: list[str | None] = []
+    for ext in extensions:
+        c_path = c_source_path(ext, c_root) if c_root is not None else None
+        key = c_keys.get(ext.name)
+        if (
+            c_path is not None
+            and key is not None
+            and state.get(ext.name) == key
+            and c_path.is_file()
+            and (not annotate or c_path.with_suffix(".html").is_file())
+        ):
+            # 입력이 같으므로 지난번에 만든 C 를 그대로 쓴다
+            ext.sources = [str(c_path)] + list(ext.sources[1:])
+            continue
+        todo.append(ext)
+        c_paths.append(str(c_path) if c_path is not None else None)
+
+    results: list[Tuple[Extension, float, float, int]]
+    includes = [include] * len(todo)
+    annotates = [annotate] * len(todo)
+    if pool is not None:
+        results = list(pool.map(_cythonize_one, todo, c_paths, includes, annotates))
+    elif workers <= 1 or len(todo) <= 1:
+        _init_cython_worker()
+        results = [_cythonize_one(*job) for job in zip(todo, c_paths, includes, annotates)]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(todo)),
+            initializer=_init_cython_worker,
+        ) as pool:
+            results = list(pool.map(_cythonize_one, todo, c_paths, includes, annotates))
+
+    timings = _report_cythonize(results, workers, report_top)
+    reused = len(extensions) - len(results)
+    if reused:
+        print(f"cythonize : {reused} 모듈은 이전에 생성한 C 재사용")
+
+    # 다른 프로세스에서 변환된 Extension 으로 교체 (순서 유지)
+    converted = {c_ext.name: c_ext for c_ext, _, _, _ in results}
+    extensions = [converted.get(ext.name, ext) for ext in extensions]
+
+    if state_path is not None and results:
+        for c_ext, _, _, _ in results:
+            if c_ext.name in c_keys:
+                state[c_ext.name] = c_keys[c_ext.name]
+            else:
+                state.pop(c_ext.name, None)
+        save_state(state_path, state)
+    return extensions, timings
+
+
+def _report_cythonize(
+    results: list[Tuple[Extension, float, float, int]],
+    workers: int,
+    report_top: int = 10,
+) -> Dict[str, float]:
+    """모듈별 변환 시간을 trace 에 남기고 느린 순으로 출력한다."""
+    tracer = get_tracer()
+    for c_ext, seconds, wall_start, pid in results:
+        tracer.add(f"cythonize {c_ext.name}", "cythonize", wall_start, seconds, tid=pid)
+
+    timings = {c_ext.name: seconds for c_ext, seconds, _, _ in results}
+    if timings:
+        total = sum(timings.values())
+        print(f"cythonize : {len(timings)} 모듈, 합계 {total:.2f}s (workers={workers})")
+        slowest = sorted(timings.items(), key=lambda kv: kv[1], reverse=True)[:report_top]
+        for name, seconds in slowest:
+            print(f"  {seconds:7.2f}s  {name}")
+    return timings
+
+
 def run_setup(
     extensions: list[Extension],
     output_root: str | Path,
     workers: int | None = None,
+    cache: ExtensionCache | None = None,
+    build_temp: str | Path | None = None,
+    c_keys: Dict[str, str] | None = None,
+    include_dir: str | Path | None = None,
 ) -> None:
     """setuptools.setup 을 호출해서 .pyd 를 빌드한다.
 
     - output_root: 빌드된 .pyd 가 떨어질 폴더
     - workers: build_ext --parallel 에 넘길 worker 개수 (None 이면 옵션 생략)
+    - cache: 지정하면 같은 C 소스/플래그로 빌드된 결과가 캐시에 있을 때
+      컴파일러를 부르지 않고 복사해 온다.
+    - build_temp: C 와 object 파일을 둘 폴더 (build_temp/c 에 패키지 구조대로 C 생성).
+      None 이면 예전처럼 C 는 소스 옆, object 는 output_root 에 생긴다.
+    - c_keys / include_dir: cythonize_extensions 참고
+    - C 소스 생성(cythonize)은 setup 전에 cythonize_extensions 로 병렬 수행한다.
+    - unity_bundle 이 지정된 Extension(set_extentions 의 unity_map) 은 cythonize 뒤에
+      묶음 Extension 하나로 합쳐서 링크한다.
     """
 
     output_root = Path(output_root)
@@ -111,11 +891,26 @@ def run_setup(
         # 너무 과한 값은 피하고, 최소 1개는 보장
         workers = max(1, cpu_count - 1)
 
+    # setup 안에서 직렬로 일어나던 .py -> .c 변환을 먼저 병렬로 끝낸다
+    c_root = Path(build_temp) / "c" if build_temp is not None else None
+    with span("cythonize", "py2pyd", modules=len(extensions)):
+        extensions, _ = cythonize_extensions(
+            extensions, workers, c_root=c_root, c_keys=c_keys, include_dir=include_dir
+        )
+    extensions = link_unity_extensions(extensions, c_root if c_root is not None else output_root)
+
+    extensions, cache_keys = _fetch_from_cache(extensions, output_root, cache, c_keys)
+    if not extensions:
+        return
+
+    # C 를 다시 만들지 않은 모듈도 (빌드 옵션 변경 등) 다시 컴파일해야 하므로
+    # .pyd 가 .c 보다 최신이어도 건너뛰지 않도록 --force
     script_args: list[str] = [
         "build_ext",
         f"--build-lib={output_root}",
+        "--force",
     ]
-    script_args.append(f"--build-temp={output_root}")
+    script_args.append(f"--build-temp={build_temp if build_temp is not None else output_root}")
     
     if workers is not None and workers > 0:
         script_args.append(f"--parallel={workers}")
@@ -123,28 +918,384 @@ def run_setup(
     setup(
         script_args=script_args,
         ext_modules=extensions,
+        cmdclass={"build_ext": _traced_build_ext()},
     )
 
-def remove_temp_files(input_root: str | Path, output_root: str | Path,):
+    _store_to_cache(extensions, output_root, cache, cache_keys)
+
+
+def _fetch_from_cache(
+    extensions: list[Extension],
+    output_root: Path,
+    cache: ExtensionCache | None,
+    c_keys: Dict[str, str] | None = None,
+) -> Tuple[list[Extension], Dict[str, str]]:
+    """캐시에 있는 모듈은 output_root 로 복사하고, (컴파일이 필요한 Extension, {모듈명: 캐시 키}) 를 돌려준다.
+
+    - c_keys: {모듈명: c_source_key}. 있으면 생성된 C 대신 이 키로 찾는다 (소스 위치와 무관).
+      unity 묶음은 멤버 모두의 키가 있을 때만 그 조합을 쓴다.
+    """
+    cache_keys: Dict[str, str] = {}
+    if cache is None:
+        return extensions, cache_keys
+    c_keys = c_keys or {}
+    misses: list[Extension] = []
+    for ext in extensions:
+        members = getattr(ext, "unity_members", None) or [ext.name]
+        source_key = None
+        if all(name in c_keys for name in members):
+            source_key = c_keys[ext.name] if members == [ext.name] else hash_obj(
+                {name: c_keys[name] for name in members}
+            )
+        key = ExtensionCache.make_key(ext.sources[0], ext, source_key)
+        if cache.fetch(key, ext_output_path(ext, output_root)):
+            continue
+        cache_keys[ext.name] = key
+        misses.append(ext)
+    return misses, cache_keys
+
+
+def _store_to_cache(
+    extensions: list[Extension],
+    output_root: Path,
+    cache: ExtensionCache | None,
+    cache_keys: Dict[str, str],
+) -> None:
+    """새로 빌드한 모듈을 캐시에 넣고, 빌드마다 한 번만 크기 제한을 정리한다."""
+    if cache is None:
+        return
+    stored = False
+    for ext in extensions:
+        built = ext_output_path(ext, output_root)
+        if built.is_file():
+            cache.store(cache_keys[ext.name], built)
+            stored = True
+    if stored:
+        cache.evict()
+
+
+# worker 프로세스마다 처음 빌드할 때 만든 컴파일러 객체 (다음 빌드부터 재사용)
+_WORKER_COMPILER = None
+
+
+def _init_builder_worker() -> None:
+    """Py2PydBuilder worker 시작 시 Cython 과 setuptools 빌드 명령을 미리 로드한다."""
+    _init_cython_worker()
+    from setuptools.command.build_ext import build_ext  # noqa: F401
+    from setuptools.dist import Distribution  # noqa: F401
+
+
+def _ensure_build_dirs(ext: Extension, output_root: str, build_temp: str) -> None:
+    """object 파일과 확장 모듈이 들어갈 폴더를 미리 만든다.
+
+    - distutils 의 mkpath 는 한 번 만든 폴더를 기억하고 다시 확인하지 않으므로, 빌드 사이에
+      build_temp 나 output_root 가 지워지면 오래 사는 worker 의 컴파일/링크가 실패한다.
+    - object 는 build_temp 아래에 C 경로에서 드라이브/맨 앞 구분자만 뗀 위치에 만들어진다.
+    """
+    Path(output_root, *ext.name.split(".")[:-1]).mkdir(parents=True, exist_ok=True)
+    for source in ext.sources:
+        parent = os.path.splitdrive(os.path.dirname(source))[1].lstrip("\\/")
+        Path(build_temp, parent).mkdir(parents=True, exist_ok=True)
+
+
+def _compile_one(
+    ext: Extension, output_root: str, build_temp: str
+) -> Tuple[str, float, float, int]:
+    """Py2PydBuilder worker: .c 로 변환된 Extension 하나를 컴파일/링크한다.
+
+    - 처음 한 번은 build_ext.run() 으로 컴파일러를 찾고 설정하며, 그 뒤로는 같은 컴파일러를 재사용한다.
+    반환값: (모듈명, 걸린 시간, 시작 시각(epoch), worker pid)
+    """
+    global _WORKER_COMPILER
+    from setuptools.command.build_ext import build_ext
+    from setuptools.dist import Distribution
+
+    wall_start = time.time()
+    start = time.perf_counter()
+    _ensure_build_dirs(ext, output_root, build_temp)
+
+    dist = Distribution({"ext_modules": [ext]})
+    cmd = build_ext(dist)
+    cmd.build_lib = output_root
+    cmd.build_temp = build_temp
+    # run_setup 의 --force 와 같음
+    cmd.force = True
+    cmd.ensure_finalized()
+    if _WORKER_COMPILER is None:
+        cmd.run()
+        _WORKER_COMPILER = cmd.compiler
+    else:
+        cmd.compiler = _WORKER_COMPILER
+        cmd.build_extensions()
+    return ext.name, time.perf_counter() - start, wall_start, os.getpid()
+
+
+class Py2PydBuilder:
+    """Cython 과 컴파일러 설정이 끝난 worker 프로세스 풀을 유지하면서 반복해서 빌드한다.
+
+    - py2pyd() 는 호출마다 setuptools.setup() 으로 빌드 명령과 컴파일러 탐지를 새로 하지만,
+      이 빌더는 worker 를 살려 두므로 두 번째 빌드부터 그 비용이 없다 (watch 모드, 여러 프로젝트 빌드 등).
+    - 사용이 끝나면 close() 하거나 with 문으로 쓴다.
+
+    예)
+        with Py2PydBuilder(workers=4) as builder:
+            builder.build(src_a, pyd_a)
+            builder.build(src_b, pyd_b)
+    """
+
+    def __init__(self, workers: int | None = None, use_cache: bool | None = None):
+        self.workers = workers or max(1, (os.cpu_count() or 1) - 1)
+        self.use_cache = use_cache
+        self._pool = None
+
+    def _get_pool(self):
+        if self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_builder_worker
+            )
+        return self._pool
+
+    def build(
+        self,
+        input_root: str | Path,
+        output_root: str | Path,
+        ext_options: dict | None = None,
+        explain: bool = False,
+        build_temp: str | Path | None = None,
+        prune: bool | str = False,
+        profile: str | dict | None = None,
+        profile_overrides: dict | None = None,
+        annotate: bool = False,
+        unity: UnitySpec | None = None,
+    ) -> DependencyGraph:
+        """py2pyd() 와 같은 증분 빌드를 이 빌더의 worker 로 실행한다."""
+        return py2pyd(
+            input_root, output_root, self.workers, ext_options, explain, self.use_cache,
+            builder=self, build_temp=build_temp, prune=prune,
+            profile=profile, profile_overrides=profile_overrides, annotate=annotate, unity=unity,
+        )
+
+    def build_extensions(
+        self,
+        extensions: list[Extension],
+        output_root: str | Path,
+        cache: ExtensionCache | None = None,
+        build_temp: str | Path | None = None,
+        c_keys: Dict[str, str] | None = None,
+        include_dir: str | Path | None = None,
+    ) -> None:
+        """Extension 묶음을 .py -> .c 변환한 뒤 컴파일해서 output_root 에 둔다.
+
+        - build_temp / c_keys / include_dir: run_setup 과 같음
+        """
+        from concurrent.futures.process import BrokenProcessPool
+
+        output_root = Path(output_root)
+        if build_temp is None:
+            build_temp = default_build_temp(output_root)
+        pool = self._get_pool()
+        try:
+            with span("cythonize", "py2pyd", modules=len(extensions)):
+                extensions, _ = cythonize_extensions(
+                    extensions, self.workers, c_root=Path(build_temp) / "c", c_keys=c_keys,
+                    include_dir=include_dir, pool=pool,
+                )
+            extensions = link_unity_extensions(extensions, Path(build_temp) / "c")
+            extensions, cache_keys = _fetch_from_cache(extensions, output_root, cache, c_keys)
+            if extensions:
+                tracer = get_tracer()
+                count = len(extensions)
+                for name, seconds, wall_start, pid in pool.map(
+                    _compile_one, extensions, [str(output_root)] * count, [str(build_temp)] * count
+                ):
+                    tracer.add(f"compile {name}", "compile", wall_start, seconds, tid=pid)
+            _store_to_cache(extensions, output_root, cache, cache_keys)
+        except BrokenProcessPool:
+            # worker 가 죽었으면 다음 빌드 때 풀을 새로 만든다
+            self.close()
+            raise
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> "Py2PydBuilder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def remove_temp_files(output_root: str | Path):
+    """output_root 에 남은 MSVC 임시 폴더(Release) 를 지운다.
+
+    - 생성된 C 와 object 파일은 build_temp 에 두고 다음 빌드에 재사용하므로 지우지 않는다.
+    - 소스 폴더는 건드리지 않는다 (직접 작성한 .c 파일 보호).
+    """
     output_root = Path(output_root)
-    # remove dir 
+    # 예전 버전에서 build-temp 를 output_root 로 쓰던 때 남은 폴더
     temp_dir = output_root / "Release"
     if temp_dir.exists():
         shutil.rmtree(temp_dir) # 디렉토리 삭제
 
+
+
+def _c_keys(
+    statuses: list[ModuleState],
+    extensions: list[Extension],
+    input_root: Path,
+    ext_options: dict | None,
+) -> Dict[str, str]:
+    """extensions 에 해당하는 모듈의 {모듈명: c_source_key}."""
+    directives = {ext.name: ext.cython_directives for ext in extensions}
+    c_keys = {}
+    for state in statuses:
+        name = ".".join(Path(_manifest_key(state.py_path, input_root)).with_suffix("").parts)
+        if name in directives:
+            c_keys[name] = c_source_key(state, ext_options, directives[name])
+    return c_keys
+
+
+def annotate_modules(
+    statuses: list[ModuleState],
+    input_root: Path,
+    ext_options: dict | None,
+    profiles: BuildProfiles | None,
+    build_temp: Path,
+    workers: int | None = None,
+    builder: Py2PydBuilder | None = None,
+) -> dict:
+    """모든 모듈의 annotate HTML 을 만들고 노란 줄 요약을 저장/출력한다.
+
+    - HTML 은 C 와 같은 폴더에 생긴다. 입력이 같고 HTML 이 남아 있는 모듈은 다시 변환하지 않는다.
+    - 반환값: annotate.summarize_annotations 의 요약 dict
+    """
+    from .annotate import print_annotation_summary, summarize_annotations
+
+    targets = [(state.py_path, state.pyd_path, state.status) for state in statuses]
+    extensions = set_extentions(targets, input_root, ext_options, profiles)
+    c_root = build_temp / "c"
+    # cythonize 가 ext.sources 를 .c 로 바꾸므로 소스 경로를 먼저 기록
+    modules = [
+        (ext.name, Path(ext.sources[0]), c_source_path(ext, c_root).with_suffix(".html"))
+        for ext in extensions
+    ]
+    pool = builder._get_pool() if builder is not None else None
+    cythonize_extensions(
+        extensions, workers if builder is None else builder.workers, c_root=c_root,
+        c_keys=_c_keys(statuses, extensions, input_root, ext_options),
+        include_dir=input_root, pool=pool, annotate=True,
+    )
+    summary = summarize_annotations(modules, build_temp / ANNOTATE_SUMMARY_NAME)
+    print_annotation_summary(summary)
+    print(f"annotate : {build_temp / ANNOTATE_SUMMARY_NAME}")
+    return summary
+
+
+def py2pyd(
+    input_root: str | Path,
+    output_root: str | Path,
+    workers: int | None = None,
+    ext_options: dict | None = None,
+    explain: bool = False,
+    use_cache: bool | None = None,
+    builder: Py2PydBuilder | None = None,
+    build_temp: str | Path | None = None,
+    prune: bool | str = False,
+    profile: str | dict | None = None,
+    profile_overrides: dict | None = None,
+    annotate: bool = False,
+    unity: UnitySpec | None = None,
+) -> DependencyGraph:
+    """input_root 의 .py 중 입력이 바뀐 모듈만 .pyd 로 빌드한다.
+
+    - explain: True 면 모듈별 빌드 이유와 의존성 그래프를 출력한다.
+    - use_cache: 컴파일 결과 캐시 사용 여부. None 이면 GlobalSettings 의 ext_cache 설정을 따른다.
+    - builder: 지정하면 setuptools.setup 대신 그 빌더의 worker 풀로 빌드한다.
+    - build_temp: 생성된 C / object 파일을 두는 폴더 (기본: default_build_temp(output_root)).
+      빌드 사이에 유지되며, 입력이 바뀌지 않은 모듈의 C 는 다시 만들지 않는다.
+    - prune: True 면 빌드 후 소스가 없는 산출물 / 이전 ABI 산출물과 그 C / object 파일을 지운다
+      (prune_artifacts). "dry-run" 이면 지울 목록만 출력한다.
+    - profile: 최적화 프로필 이름(debug / release / max) 또는 dict (build_profiles 참고).
+      None 이면 프로필 없이 기본 플래그로 빌드한다.
+    - profile_overrides: {src 기준 상대경로 glob: 프로필} 모듈별 덮어쓰기
+    - 프로필이 바뀐 모듈은 env_changed 로 다시 빌드된다.
+    - annotate: True 면 빌드 대상이 아닌 모듈까지 모두 Cython annotate HTML 을 만들고
+      (build_temp/c/<패키지>/<모듈>.html), 모듈/함수별 노란 줄 요약을
+      build_temp/ANNOTATE_SUMMARY_NAME(JSON) 에 저장한다.
+    - unity: True 면 패키지마다, {glob: 그룹 이름} 이면 지정한 모듈끼리 확장 모듈 하나로 링크한다.
+      output_root 에 로더(unity.UNITY_LOADER_NAME) 가 생기며, 실행 시 다른 import 보다 먼저
+      import 해야 한다 (PyInstaller 빌드에서는 runtime hook 으로 자동 등록).
+    - 반환값: input_root 의 의존성 그래프 {파일: {직접 의존 파일}}
+    """
+    if prune not in (True, False, "dry-run"):
+        raise ValueError(f"Invalid prune : {prune!r} / Allowed : True, False, 'dry-run'")
     input_root = Path(input_root)
-    # remove .c files
-    for c_path in input_root.rglob("*.c"):
-        if c_path.is_file():
-            c_path.unlink()  # .c 파일 삭제
+    output_root = Path(output_root)
+    build_temp = Path(build_temp) if build_temp is not None else default_build_temp(output_root)
+    profiles = None
+    if profile is not None or profile_overrides:
+        profiles = BuildProfiles(profile, profile_overrides)
+
+    with span("py2pyd scan", "py2pyd"):
+        manifest = load_manifest(output_root)
+        sources = scan_sources(input_root)
+        file_cache = manifest.setdefault("files", {})
+        graph = build_dependency_graph(input_root, sources, file_cache)
+        unity_map = unity_groups(module_keys(sources, input_root), unity)
+        statuses = _collect_status(
+            input_root, output_root, ext_options, graph, sources, manifest, profiles, unity_map
+        )
+    targets = [
+        (state.py_path, state.pyd_path, state.status)
+        for state in build_states(statuses, input_root, unity_map)
+    ]
+    print(f"py2pyd : {len(targets)} / {len(statuses)} 모듈 빌드 대상")
+    if unity_map:
+        print(f"py2pyd : unity 묶음 {len(set(unity_map.values()))} 개 ({len(unity_map)} 모듈)")
+    if explain:
+        explain_targets(statuses, input_root, graph, unity_map)
 
+    if annotate:
+        # 빌드 대상과 같은 키로 C 를 만들어 두므로, 아래 빌드 단계는 그 C 를 재사용한다
+        with span("py2pyd annotate", "py2pyd", modules=len(statuses)):
+            annotate_modules(
+                statuses, input_root, ext_options, profiles, build_temp, workers, builder
+            )
 
+    if targets:
+        cache = ExtensionCache.from_settings(use_cache)
+        extensions = set_extentions(targets, input_root, ext_options, profiles, unity_map)
+        c_keys = _c_keys(statuses, extensions, input_root, ext_options)
+        with span("py2pyd build", "py2pyd", modules=len(extensions)):
+            if builder is not None:
+                builder.build_extensions(
+                    extensions, output_root, cache, build_temp, c_keys, input_root
+                )
+            else:
+                run_setup(extensions, output_root, workers, cache, build_temp, c_keys, input_root)
+        remove_temp_files(output_root)
 
-def py2pyd(input_root: str | Path, output_root: str | Path, workers: int | None = None):
-    targets = find_pyd_target(input_root, output_root)
-    extensions = set_extentions(targets, input_root)
-    run_setup(extensions, output_root, workers)
-    remove_temp_files(input_root, output_root)
+    # 빌드가 성공한 경우에만 manifest 갱신 (실패 시 setup 에서 예외 발생)
+    # (빌드로 소스가 바뀌지는 않으므로 스캔 때의 stat/해시 캐시를 그대로 기록)
+    file_cache = {key: file_cache[key] for key in file_cache if input_root / key in sources}
+    update_manifest(statuses, input_root, output_root, ext_options, file_cache, profiles, unity_map)
+    write_unity_loader(output_root, {
+        ".".join(Path(key).with_suffix("").parts): bundle for key, bundle in unity_map.items()
+    } if unity else None)
+    if prune:
+        with span("py2pyd prune", "py2pyd"):
+            prune_artifacts(
+                input_root,
+                output_root,
+                dry_run=prune == "dry-run",
+                sources=sources,
+                build_temp=build_temp,
+            )
+    return graph
 
 
 if __name__ == "__main__":
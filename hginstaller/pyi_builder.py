@@ -1,9 +1,17 @@
 import subprocess
 import sys
 import os
+import glob
 from pathlib import Path
 
-def pyi_maker(build_config: dict ,  pyi_config:dict):
+from .fingerprint import hash_file, hash_obj, load_stage_state, save_stage_state
+from .trace import span
+from .startup_profile import STARTUP_HOOK_NAME, write_startup_hook
+from .unity import UNITY_LOADER_NAME
+
+
+def build_makespec_cmd(build_config: dict, pyi_config: dict) -> list:
+    """build_config / pyi_config 로 pyi-makespec 명령어 리스트를 만든다."""
     program_name = build_config["program_name"]
     project_path = Path(build_config["project_path"])
 
@@ -91,14 +99,208 @@ def pyi_maker(build_config: dict ,  pyi_config:dict):
     for data in exclude_module:
         cmd += ["--exclude-module", data]   
 
+    # - unity build 로더: 묶음 .pyd 안의 모듈을 원래 이름으로 import 할 수 있게 먼저 실행
+    if build_config.get("unity_build"):
+        cmd += ["--runtime-hook", str(Path(build_config["pyd_path"]) / UNITY_LOADER_NAME)]
+
+    # - 시작 시 import 프로파일러 (환경 변수로 켤 때만 동작). 다른 hook 의 finder 보다 앞에 오도록 마지막에 둔다
+    if build_config.get("startup_profiling"):
+        cmd += ["--runtime-hook", str(spec_path / STARTUP_HOOK_NAME)]
 
-    # pyi-makespec 실행
     cmd += [main_py]
+    return cmd
+
+
+def expand_add_data(build_config: dict, pyi_config: dict) -> dict:
+    """add_data 항목별로 glob 이 실제로 가리키는 경로 목록을 구한다."""
+    project_path = Path(build_config["project_path"])
+    add_data_files = {}
+    for data in pyi_config.get("add_data", []):
+        src_path = data.split(":", 1)[0] if ":" in data else data
+        if not Path(src_path).is_absolute():
+            src_path = str(project_path / src_path)
+        add_data_files[data] = sorted(glob.glob(src_path))
+    return add_data_files
+
+
+def _pyinstaller_version():
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        return None
+    try:
+        return version("pyinstaller")
+    except PackageNotFoundError:
+        return None
+
+
+def makespec_fingerprint(cmd: list, build_config: dict, pyi_config: dict) -> str:
+    """spec 내용을 결정하는 입력들의 fingerprint.
+
+    - 최종 명령어 (모든 경로가 절대 경로로 풀린 상태, add_data 는 glob 패턴 그대로)
+    - PyInstaller 버전 (spec 템플릿이 버전마다 다름)
+    - add_data 의 glob 은 spec 에 패턴 그대로 들어가고 pyinstaller 실행 때 풀리므로,
+      풀린 파일 목록은 spec 이 아니라 pyinstaller_fingerprint 에 넣는다.
+      (spec 생성은 py2pyd 와 동시에 돌기 때문에, 쓰는 중인 pyd_path 를 glob 하면 결과가 매번 달라진다)
+    """
+    project_path = Path(build_config["project_path"])
+    return hash_obj({
+        "cmd": cmd,
+        "cwd": str(project_path),
+        "pyinstaller": _pyinstaller_version(),
+    })
+
+
+def _hash_tree(path: Path) -> dict:
+    """파일이면 {경로: 해시}, 폴더면 하위 모든 파일의 {경로: 해시}."""
+    if path.is_file():
+        return {str(path): hash_file(path)}
+    hashes = {}
+    for root, _, files in os.walk(path):
+        for name in files:
+            file_path = Path(root) / name
+            hashes[str(file_path)] = hash_file(file_path)
+    return hashes
+
+
+def _module_versions(modules: list) -> dict:
+    """hidden_imports 모듈 이름을 설치된 배포판 버전으로 바꾼다 (못 찾으면 None)."""
+    try:
+        from importlib import metadata
+    except ImportError:
+        return {}
+
+    try:
+        mapping = metadata.packages_distributions()
+    except AttributeError:
+        # Python 3.9 이하
+        mapping = {}
+
+    versions = {}
+    for module in modules:
+        top = module.split(".")[0]
+        dists = mapping.get(top) or [top]
+        found = {}
+        for dist in dists:
+            try:
+                found[dist] = metadata.version(dist)
+            except metadata.PackageNotFoundError:
+                found[dist] = None
+        versions[module] = found
+    return versions
+
+
+def dist_root(build_config: dict) -> Path:
+    """pyinstaller distpath. 기본은 프로젝트/dist, variant 빌드는 build_config["dist_path"]."""
+    dist_path = build_config.get("dist_path")
+    return Path(dist_path) if dist_path else Path(build_config["project_path"]) / "dist"
+
+
+def _dist_output_exists(build_config: dict) -> bool:
+    """distpath 에 결과물이 남아 있는지 확인한다."""
+    root = dist_root(build_config)
+    name = build_config["program_name"]
+    return any(p.exists() for p in (root / name, root / f"{name}.exe"))
+
+
+def pyinstaller_fingerprint(build_config: dict, pyi_config: dict) -> dict:
+    """PyInstaller 결과물을 결정하는 입력들을 구성요소별 해시로 만든다.
+
+    - spec, main_py, pyd_path 의 확장 모듈, add_data 로 풀리는 파일들,
+      hidden_imports 로 지정된 패키지의 설치 버전, Python / PyInstaller 버전
+    """
+    project_path = Path(build_config["project_path"])
+    spec_file = Path(build_config["build_src_path"]) / f"{build_config['program_name']}.spec"
+    main_py = Path(pyi_config["main_py"])
+    if not main_py.is_absolute():
+        main_py = project_path / main_py
+
+    pyd_path = Path(build_config["pyd_path"])
+    pyd_files = _hash_tree(pyd_path) if pyd_path.exists() else {}
+    # py2pyd 의 manifest 등 빌드 결과에 포함되지 않는 파일은 제외
+    pyd_files = {k: v for k, v in pyd_files.items() if not Path(k).name.startswith(".")}
+
+    add_data = {}
+    for pattern, paths in expand_add_data(build_config, pyi_config).items():
+        for path in paths:
+            add_data.update(_hash_tree(Path(path)))
+
+    return {
+        "spec": hash_file(spec_file) if spec_file.is_file() else None,
+        "main_py": hash_file(main_py) if main_py.is_file() else None,
+        "pyd": hash_obj(pyd_files),
+        "add_data": hash_obj(add_data),
+        "hidden_imports": hash_obj(_module_versions(pyi_config.get("hidden_imports", []))),
+        "toolchain": hash_obj({"python": sys.version, "pyinstaller": _pyinstaller_version()}),
+    }
+
+
+def run_pyinstaller(build_config: dict, pyi_config: dict, force: bool = False) -> bool:
+    """spec 으로 pyinstaller 를 실행한다.
+
+    - 입력 fingerprint 가 마지막 성공 빌드와 같고 dist 결과물이 남아 있으면 실행하지 않는다.
+    - 반환값: 실제로 pyinstaller 를 실행했으면 True, 최신이라 생략했으면 False
+    """
+    build_src_path = Path(build_config["build_src_path"])
+    spec_file = build_src_path / f"{build_config['program_name']}.spec"
+
+    fingerprint = pyinstaller_fingerprint(build_config, pyi_config)
+    last = load_stage_state(build_src_path, "pyinstaller").get("fingerprint", {})
+    changed = sorted(key for key in fingerprint if last.get(key) != fingerprint[key])
+
+    if not force and not changed:
+        if _dist_output_exists(build_config):
+            print("PyInstaller up to date - spec / main_py / pyd / add_data / hidden_imports 변경 없음")
+            return False
+        reason = "dist 결과물 없음"
+    elif force:
+        reason = "force"
+    else:
+        reason = "변경됨: " + ", ".join(changed)
+
+    cmd = ["pyinstaller", "--noconfirm"]
+    # variant 빌드는 서로 결과물/작업 폴더를 덮어쓰지 않도록 각자의 distpath / workpath 를 쓴다
+    if build_config.get("dist_path"):
+        cmd += ["--distpath", str(build_config["dist_path"])]
+    if build_config.get("work_path"):
+        cmd += ["--workpath", str(build_config["work_path"])]
+    cmd.append(str(spec_file))
+
+    print(f"PyInstaller 실행 ({reason})")
+    with span("pyinstaller", "tool"):
+        subprocess.run(cmd, check=True, cwd=build_config["project_path"])
+    save_stage_state(build_src_path, "pyinstaller", {"fingerprint": fingerprint})
+    return True
+
+
+def pyi_maker(build_config: dict ,  pyi_config:dict, force: bool = False):
+    """pyi-makespec 으로 spec 파일을 만든다.
+
+    - 명령어/입력 fingerprint 가 지난번과 같고 spec 파일이 있으면 실행하지 않는다.
+      (spec 의 mtime 이 바뀌지 않아 이후 단계의 증분 판단이 유지됨)
+    - force=True 면 항상 다시 만든다.
+    """
+    project_path = Path(build_config["project_path"])
+    spec_dir = Path(build_config["build_src_path"])
+    spec_file = spec_dir / f"{build_config['program_name']}.spec"
+
+    if build_config.get("startup_profiling"):
+        write_startup_hook(spec_dir)
+    cmd = build_makespec_cmd(build_config, pyi_config)
+    fingerprint = makespec_fingerprint(cmd, build_config, pyi_config)
+    last = load_stage_state(spec_dir, "pyi_spec")
+    if not force and spec_file.is_file() and last.get("fingerprint") == fingerprint:
+        print(f"spec 최신 - pyi-makespec 생략: {spec_file}")
+        return True
+
+    # pyi-makespec 실행
     print('='*30)
     print("실행할 명령어:", " ".join(cmd))
     try:
-        subprocess.run(cmd, check=True, cwd=str(project_path))
+        with span("pyi-makespec", "tool"):
+            subprocess.run(cmd, check=True, cwd=str(project_path))
         print('='*30)
+        save_stage_state(spec_dir, "pyi_spec", {"fingerprint": fingerprint})
         return True
     except subprocess.CalledProcessError as e:
         print(f"Error: {e}")
@@ -0,0 +1,227 @@
+"""빌드 단계(stage) 를 의존성 DAG 로 실행하는 간단한 스케줄러
+
+각 stage 는 입력/출력 산출물 이름을 선언하고,
+어떤 stage 의 입력이 다른 stage 의 출력이면 그 stage 가 끝난 뒤에 실행된다.
+서로 의존하지 않는 stage 는 스레드 풀에서 동시에 실행된다.
+동시에 실행될 때 stage 안에서 print 한 줄에는 [stage 이름] 이 앞에 붙는다.
+trace 가 켜져 있으면 stage 마다 "stage" span 이 기록된다.
+"""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence
+
+from .trace import span
+
+
+class Stage:
+    """빌드 단계 하나.
+
+    - name: 단계 이름
+    - func: 인자 없이 호출되는 실행 함수
+    - inputs / outputs: 산출물 이름 (예: "pyd", "spec", "dist")
+    """
+
+    def __init__(
+        self,
+        name: str,
+        func: Callable[[], object],
+        inputs: Sequence[str] = (),
+        outputs: Sequence[str] = (),
+    ):
+        self.name = name
+        self.func = func
+        self.inputs = list(inputs)
+        self.outputs = list(outputs)
+        self.deps: List[str] = []
+        self.start: Optional[float] = None
+        self.end: Optional[float] = None
+
+    @property
+    def duration(self) -> float:
+        if self.start is None or self.end is None:
+            return 0.0
+        return self.end - self.start
+
+    def __repr__(self) -> str:
+        return f"Stage({self.name!r}, inputs={self.inputs}, outputs={self.outputs})"
+
+
+class _StagePrefixStdout:
+    """stage 를 실행 중인 스레드의 출력 줄 앞에 [stage 이름] 을 붙이는 sys.stdout 대체 객체.
+
+    - 줄 단위로 모아서 쓰므로 동시에 실행되는 stage 의 출력이 한 줄 안에서 섞이지 않는다.
+    - stage 밖(메인 스레드) 의 출력은 그대로 쓴다.
+    - subprocess 가 직접 쓰는 출력(pyinstaller 등) 은 sys.stdout 을 거치지 않으므로 붙지 않는다.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def begin(self, name: str) -> None:
+        self._local.name = name
+        self._local.buffer = ""
+
+    def end(self) -> None:
+        if getattr(self._local, "buffer", ""):
+            self.write("\n")
+        self._local.name = None
+
+    def write(self, text: str) -> int:
+        name = getattr(self._local, "name", None)
+        if name is None:
+            return self._stream.write(text)
+        *lines, self._local.buffer = (self._local.buffer + text).split("\n")
+        if lines:
+            with self._lock:
+                self._stream.write("".join(f"[{name}] {line}\n" for line in lines))
+        return len(text)
+
+    def flush(self) -> None:
+        self._stream.flush()
+
+    def __getattr__(self, attr):
+        return getattr(self._stream, attr)
+
+
+def resolve_dependencies(stages: Sequence[Stage]) -> Dict[str, Stage]:
+    """입력/출력 선언으로 stage 간 의존성을 채우고 {이름: Stage} 를 반환한다.
+
+    - 이번 실행에 포함되지 않은 stage 가 만드는 산출물은 이미 존재한다고 보고 무시한다.
+    - 순환 의존이 있으면 ValueError.
+    """
+    by_name = {stage.name: stage for stage in stages}
+    producers: Dict[str, str] = {}
+    for stage in stages:
+        for output in stage.outputs:
+            if output in producers:
+                raise ValueError(
+                    f"산출물 {output!r} 을 여러 stage 가 만듭니다: {producers[output]}, {stage.name}"
+                )
+            producers[output] = stage.name
+
+    for stage in stages:
+        stage.deps = sorted({
+            producers[item] for item in stage.inputs
+            if item in producers and producers[item] != stage.name
+        })
+
+    # 순환 검사 (위상 정렬)
+    remaining = {name: set(stage.deps) for name, stage in by_name.items()}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps]
+        if not ready:
+            raise ValueError(f"stage 의존성에 순환이 있습니다: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+        for deps in remaining.values():
+            deps.difference_update(ready)
+
+    return by_name
+
+
+def run_stages(stages: Sequence[Stage], max_workers: Optional[int] = None) -> Dict[str, Stage]:
+    """의존성이 풀린 stage 부터 동시에 실행한다.
+
+    - 어떤 stage 가 실패하면 그에 의존하는 stage 는 실행하지 않고, 진행 중인 stage 가
+      끝난 뒤 첫 번째 예외를 다시 발생시킨다.
+    - 두 개 이상 동시에 실행될 수 있으면 stage 의 출력 줄 앞에 [stage 이름] 을 붙인다.
+    """
+    by_name = resolve_dependencies(stages)
+    pending = dict(by_name)
+    done: set = set()
+    failed: Dict[str, BaseException] = {}
+    skipped: set = set()
+    origin = time.perf_counter()
+    workers = max_workers or max(1, len(by_name))
+    prefixed = _StagePrefixStdout(sys.stdout) if workers > 1 and len(by_name) > 1 else None
+
+    def _run(stage: Stage):
+        stage.start = time.perf_counter() - origin
+        if prefixed is not None:
+            prefixed.begin(stage.name)
+        try:
+            with span(stage.name, "stage"):
+                return stage.func()
+        finally:
+            if prefixed is not None:
+                prefixed.end()
+            stage.end = time.perf_counter() - origin
+
+    if prefixed is not None:
+        sys.stdout = prefixed
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            running = {}
+            while pending or running:
+                for name in list(pending):
+                    stage = pending[name]
+                    if any(dep in failed or dep in skipped for dep in stage.deps):
+                        skipped.add(name)
+                        del pending[name]
+                    elif all(dep in done for dep in stage.deps):
+                        running[pool.submit(_run, stage)] = name
+                        del pending[name]
+
+                if not running:
+                    break
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    exc = future.exception()
+                    if exc is not None:
+                        failed[name] = exc
+                    else:
+                        done.add(name)
+    finally:
+        if prefixed is not None:
+            sys.stdout = prefixed._stream
+
+    if skipped:
+        print(f"실행하지 않은 stage (선행 stage 실패): {', '.join(sorted(skipped))}")
+    if failed:
+        name, exc = next(iter(failed.items()))
+        raise exc
+    return by_name
+
+
+def critical_path(by_name: Dict[str, Stage]) -> List[Stage]:
+    """가장 늦게 끝난 stage 에서 거꾸로, 가장 늦게 끝난 선행 stage 를 따라간 경로."""
+    finished = [stage for stage in by_name.values() if stage.end is not None]
+    if not finished:
+        return []
+    node = max(finished, key=lambda s: s.end)
+    path = [node]
+    while node.deps:
+        preds = [by_name[dep] for dep in node.deps if by_name[dep].end is not None]
+        if not preds:
+            break
+        node = max(preds, key=lambda s: s.end)
+        path.append(node)
+    return list(reversed(path))
+
+
+def print_summary(by_name: Dict[str, Stage]) -> None:
+    """stage 별 시작/종료 시각과 critical path 를 출력한다."""
+    print("-" * 50)
+    print(f"{'stage':<16}{'start':>9}{'end':>9}{'time':>9}  depends on")
+    for stage in sorted(by_name.values(), key=lambda s: (s.start is None, s.start or 0.0)):
+        if stage.start is None:
+            print(f"{stage.name:<16}{'-':>9}{'-':>9}{'-':>9}  {', '.join(stage.deps)}")
+            continue
+        print(
+            f"{stage.name:<16}{stage.start:>8.1f}s{stage.end:>8.1f}s{stage.duration:>8.1f}s"
+            f"  {', '.join(stage.deps)}"
+        )
+    path = critical_path(by_name)
+    if path:
+        total = path[-1].end - path[0].start
+        print(f"critical path ({total:.1f}s): " + " -> ".join(
+            f"{stage.name}({stage.duration:.1f}s)" for stage in path
+        ))
+    print("-" * 50)
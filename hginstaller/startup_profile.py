@@ -0,0 +1,304 @@
+"""빌드된 실행 파일의 시작 시 import 비용 측정
+
+- PyInstaller bootloader 는 PYTHON* 환경 변수를 무시하므로, 빌드에 runtime hook(STARTUP_HOOK_NAME) 을
+  넣어 두고 실행할 때 환경 변수(PROFILE_ENV) 로 켠다. 환경 변수가 없으면 hook 은 아무 일도 하지 않는다.
+- hook 은 `python -X importtime` 과 같은 형식으로 모듈별 self / cumulative 시간을 기록하고,
+  모듈이 어디서 로드됐는지(origin) 도 함께 적는다. 두 형식 모두 parse_importtime 으로 읽는다.
+
+    hg.add_config(startup_profiling=True)   # hook 포함해서 빌드
+    hg.run()
+    hg.profile_startup()
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from importlib.machinery import EXTENSION_SUFFIXES
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set
+
+# build_src 에 만드는 runtime hook 파일 이름
+STARTUP_HOOK_NAME = "hg_import_profiler.py"
+# hook 을 켜는 환경 변수 (값: 기록할 파일 경로)
+PROFILE_ENV = "HG_IMPORT_PROFILE"
+# build_src 에 저장하는 결과
+STARTUP_PROFILE_NAME = "startup_profile.json"
+
+_HOOK_SOURCE = '''"""HGInstaller 시작 시 import 프로파일러 (runtime hook, 생성 파일)
+
+환경 변수 {env} 가 있을 때만 동작한다. 모듈마다 로드 시간을 `-X importtime` 형식으로 기록한다.
+"""
+import os
+
+if os.environ.get("{env}"):
+    import sys
+    import time
+
+    _out = open(os.environ["{env}"], "w", encoding="utf-8", buffering=1)
+    _out.write("import start: %d\\n" % int(time.time() * 1e6))
+    # 로드 중인 모듈마다 [자식 모듈 누적 시간 합]
+    _stack = []
+    # create_module 에서 잰 시간 {{모듈명: (self, cumulative)}}
+    _created = {{}}
+
+    def _timed(name, func, *args):
+        _stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return func(*args)
+        finally:
+            total = time.perf_counter() - start
+            children = _stack.pop()
+            if _stack:
+                _stack[-1] += total
+            prev_self, prev_total = _created.pop(name, (0.0, 0.0))
+            measured = (total - children + prev_self, total + prev_total)
+            if func.__name__ == "create_module":
+                _created[name] = measured
+            else:
+                _out.write("import time: %9d | %10d | %s%s\\n" % (
+                    measured[0] * 1e6, measured[1] * 1e6, "  " * len(_stack), name,
+                ))
+
+    class _TimedLoader:
+        def __init__(self, loader, origin):
+            self._loader = loader
+            self._origin = origin
+
+        def __getattr__(self, name):
+            return getattr(self._loader, name)
+
+        def create_module(self, spec):
+            create = getattr(self._loader, "create_module", None)
+            if create is None:
+                return None
+            return _timed(spec.name, create, spec)
+
+        def exec_module(self, module):
+            name = module.__name__
+            _out.write("import origin: %s | %s\\n" % (name, self._origin))
+            try:
+                return _timed(name, self._loader.exec_module, module)
+            finally:
+                # 다른 코드가 loader 종류를 확인할 수 있도록 원래 loader 로 되돌린다
+                module.__loader__ = self._loader
+                if getattr(module, "__spec__", None) is not None:
+                    module.__spec__.loader = self._loader
+
+    class _ProfilingFinder:
+        @classmethod
+        def find_spec(cls, fullname, path=None, target=None):
+            for finder in sys.meta_path:
+                if finder is cls:
+                    continue
+                find_spec = getattr(finder, "find_spec", None)
+                if find_spec is None:
+                    continue
+                spec = find_spec(fullname, path, target)
+                if spec is None:
+                    continue
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, spec.origin)
+                return spec
+            return None
+
+    sys.meta_path.insert(0, _ProfilingFinder)
+'''.format(env=PROFILE_ENV)
+
+_TIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+_ORIGIN_LINE = re.compile(r"^import origin: (\S+) \| (.*)$")
+
+
+def write_startup_hook(build_src_path: str | Path) -> Path:
+    """build_src_path 에 runtime hook 을 만든다 (내용이 같으면 건드리지 않음)."""
+    path = Path(build_src_path) / STARTUP_HOOK_NAME
+    if not path.is_file() or path.read_text(encoding="utf-8") != _HOOK_SOURCE:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(_HOOK_SOURCE, encoding="utf-8")
+    return path
+
+
+class ImportRecord(NamedTuple):
+    name: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    compiled: bool          # 확장 모듈(.pyd/.so) 에서 로드됐는지
+
+
+def _is_extension(path: str) -> bool:
+    return path.endswith(tuple(EXTENSION_SUFFIXES) + (".pyd", ".so"))
+
+
+def parse_importtime(
+    lines: List[str], extension_modules: Optional[Set[str]] = None
+) -> List[ImportRecord]:
+    """`-X importtime` / hook 출력에서 모듈별 import 시간을 읽는다.
+
+    - origin 기록이 있으면 그것으로, 없으면 extension_modules(실행 파일 폴더에서 찾은 확장 모듈 이름) 로
+      확장 모듈 여부를 판단한다.
+    - 같은 모듈이 여러 번 나오면 (재시도 등) 처음 것만 쓴다.
+    """
+    extension_modules = extension_modules or set()
+    origins: Dict[str, str] = {}
+    raw = []
+    for line in lines:
+        match = _TIME_LINE.match(line)
+        if match:
+            depth = len(match.group(3)) // 2
+            raw.append((match.group(4), int(match.group(1)), int(match.group(2)), depth))
+            continue
+        match = _ORIGIN_LINE.match(line)
+        if match:
+            origins[match.group(1)] = match.group(2)
+
+    records: List[ImportRecord] = []
+    seen = set()
+    for name, self_us, cumulative_us, depth in raw:
+        if name in seen:
+            continue
+        seen.add(name)
+        origin = origins.get(name)
+        compiled = _is_extension(origin) if origin else name in extension_modules
+        records.append(ImportRecord(name, self_us, cumulative_us, depth, compiled))
+    return records
+
+
+def find_executable(build_config: dict) -> Path:
+    """PyInstaller 결과 실행 파일 (onedir: dist/<이름>/<이름>, onefile: dist/<이름>)."""
+    from .pyi_builder import dist_root
+
+    name = build_config["program_name"]
+    root = dist_root(build_config)
+    exe = ".exe" if sys.platform == "win32" else ""
+    for candidate in (root / name / f"{name}{exe}", root / f"{name}{exe}"):
+        if candidate.is_file():
+            return candidate
+    raise FileNotFoundError(f"실행 파일이 없습니다. 먼저 run() 으로 빌드하세요: {root / name}")
+
+
+def extension_modules_in(dist_dir: Path) -> Set[str]:
+    """onedir 결과물 안의 확장 모듈 이름 (a.b 형식). PyInstaller 6 의 _internal 폴더도 기준으로 삼는다."""
+    names: Set[str] = set()
+    roots = [dist_dir] + ([dist_dir / "_internal"] if (dist_dir / "_internal").is_dir() else [])
+    for root in roots:
+        for directory, _, files in os.walk(root):
+            for file in files:
+                if not _is_extension(file):
+                    continue
+                rel = Path(directory, file).relative_to(root)
+                names.add(".".join(rel.parts[:-1] + (file.split(".")[0],)))
+    return names
+
+
+class StartupProfile(NamedTuple):
+    """profile_startup 의 결과."""
+
+    executable: str
+    wall_seconds: float             # 실행부터 종료(또는 timeout) 까지
+    exited: bool                    # timeout 전에 스스로 종료했는지
+    total_import_us: int            # 모든 모듈 self 시간 합
+    compiled_us: int                # 그중 확장 모듈(.pyd/.so) 의 self 시간
+    slowest: List[ImportRecord]     # self 시간이 큰 순
+    packages: List[dict]            # 최상위 패키지별 {"package", "self_us", "modules"} 큰 순
+
+
+def summarize_imports(records: List[ImportRecord], top: int = 20) -> dict:
+    packages: Dict[str, dict] = {}
+    for record in records:
+        package = record.name.split(".")[0]
+        entry = packages.setdefault(package, {"package": package, "self_us": 0, "modules": 0})
+        entry["self_us"] += record.self_us
+        entry["modules"] += 1
+    return {
+        "total_import_us": sum(r.self_us for r in records),
+        "compiled_us": sum(r.self_us for r in records if r.compiled),
+        "slowest": sorted(records, key=lambda r: -r.self_us)[:top],
+        "packages": sorted(packages.values(), key=lambda p: -p["self_us"])[:top],
+    }
+
+
+def profile_executable(
+    executable: str | Path,
+    timeout: float = 30.0,
+    args: Optional[List[str]] = None,
+    top: int = 20,
+) -> StartupProfile:
+    """실행 파일을 import 추적을 켜고 실행해서 시작 시 import 비용을 모은다.
+
+    - GUI 앱처럼 스스로 끝나지 않으면 timeout 초 뒤에 종료시킨다 (그 전까지의 import 만 집계).
+    - hook 이 없는 빌드라도 PYTHONPROFILEIMPORTTIME 이 통하는 실행 파일이면 stderr 를 읽는다.
+    """
+    executable = Path(executable).resolve()
+    with tempfile.TemporaryDirectory(prefix="hg_startup_") as tmp:
+        hook_out = Path(tmp) / "imports.txt"
+        stderr_out = Path(tmp) / "stderr.txt"
+        env = dict(os.environ, PYTHONPROFILEIMPORTTIME="1", **{PROFILE_ENV: str(hook_out)})
+        start = time.perf_counter()
+        with open(stderr_out, "wb") as stderr:
+            process = subprocess.Popen(
+                [str(executable)] + list(args or []),
+                cwd=str(executable.parent),
+                env=env,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr,
+            )
+            try:
+                process.wait(timeout=timeout)
+                exited = True
+            except subprocess.TimeoutExpired:
+                process.terminate()
+                try:
+                    process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                exited = False
+        wall = time.perf_counter() - start
+
+        lines = []
+        if hook_out.is_file():
+            lines = hook_out.read_text(encoding="utf-8", errors="replace").splitlines()
+        if not lines:
+            lines = stderr_out.read_text(encoding="utf-8", errors="replace").splitlines()
+
+    records = parse_importtime(lines, extension_modules_in(executable.parent))
+    if not records:
+        raise RuntimeError(
+            "import 기록이 없습니다. add_config(startup_profiling=True) 로 hook 을 넣어 다시 빌드하세요."
+        )
+    summary = summarize_imports(records, top)
+    return StartupProfile(str(executable), wall, exited, **summary)
+
+
+def save_startup_profile(profile: StartupProfile, path: str | Path) -> None:
+    data = profile._asdict()
+    data["slowest"] = [record._asdict() for record in profile.slowest]
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    Path(path).write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def print_startup_profile(profile: StartupProfile, top: int = 15) -> None:
+    total = profile.total_import_us or 1
+    print("=" * 30)
+    state = "종료" if profile.exited else "timeout 으로 중단"
+    print(f"실행 : {profile.executable} ({profile.wall_seconds:.2f}s, {state})")
+    compiled = profile.compiled_us / total
+    print(f"import 합계 : {profile.total_import_us / 1e6:.2f}s "
+          f"(확장 모듈 {compiled:.0%} / 순수 Python {1 - compiled:.0%})")
+    print("-" * 30)
+    print(f"{'self(ms)':>9} {'cum(ms)':>9}  module")
+    for record in profile.slowest[:top]:
+        kind = " [ext]" if record.compiled else ""
+        times = f"{record.self_us / 1000:>9.1f} {record.cumulative_us / 1000:>9.1f}"
+        print(f"{times}  {record.name}{kind}")
+    print("-" * 30)
+    print(f"{'self(ms)':>9} {'modules':>8}  package")
+    for package in profile.packages[:top]:
+        print(f"{package['self_us'] / 1000:>9.1f} {package['modules']:>8}  {package['package']}")
+    print("=" * 30)
@@ -0,0 +1,180 @@
+"""빌드 단계별 시간/자원 사용량 기록 (Chrome / Perfetto trace.json 출력)
+
+- HgInstaller.run(trace=True) 또는 환경변수 HGINSTALLER_TRACE=1 로 켠다.
+- 꺼져 있으면 span() 은 아무것도 하지 않는다.
+- 결과는 chrome://tracing 또는 https://ui.perfetto.dev 에서 열 수 있다.
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+try:
+    import resource
+except ImportError:
+    # Windows
+    resource = None
+
+ENV_VAR = "HGINSTALLER_TRACE"
+
+
+def _cpu_seconds() -> float:
+    """현재 프로세스 + 끝난 자식 프로세스의 CPU 시간 합 (초)."""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """현재 프로세스와 자식 프로세스 중 최대 RSS (MB). 측정할 수 없으면 None."""
+    if resource is None:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # Linux 는 KB, macOS 는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class Tracer:
+    """span 들을 모아서 Chrome trace 이벤트로 내보낸다."""
+
+    def __init__(self):
+        self.enabled = False
+        self.events: list = []
+        self._lock = threading.Lock()
+
+    def enable(self) -> None:
+        self.enabled = True
+        self.events = []
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    @contextmanager
+    def session(self, enabled: bool = True):
+        """with 블록 동안만 새 이벤트 목록으로 기록하고, 끝나면 이전 상태(켜짐 여부/이벤트) 로 되돌린다.
+
+        - enabled=False 여도 이미 켜져 있으면 (HGINSTALLER_TRACE=1) 기록한다.
+        - 한 프로세스에서 여러 번 빌드해도 이전 빌드의 이벤트가 섞이지 않는다.
+        """
+        with self._lock:
+            saved = (self.enabled, self.events)
+            self.enabled = enabled or saved[0]
+            self.events = []
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self.enabled, self.events = saved
+
+    @contextmanager
+    def span(self, name: str, cat: str = "build", **args):
+        """with 블록의 wall time / CPU time / peak RSS 를 기록한다.
+
+        - CPU time 은 프로세스 전체(+ 끝난 자식 프로세스) 기준이라, 동시에 실행된
+          span 끼리는 서로의 사용량이 섞일 수 있다.
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.time()
+        cpu_start = _cpu_seconds()
+        try:
+            yield
+        finally:
+            end = time.time()
+            self.add(
+                name,
+                cat,
+                start,
+                end - start,
+                cpu=round(_cpu_seconds() - cpu_start, 3),
+                peak_rss_mb=_peak_rss_mb(),
+                **args,
+            )
+
+    def add(
+        self,
+        name: str,
+        cat: str,
+        start: float,
+        duration: float,
+        tid: Optional[int] = None,
+        **args,
+    ) -> None:
+        """이미 측정된 구간을 직접 추가한다 (예: 다른 프로세스에서 잰 시간)."""
+        if not self.enabled:
+            return
+        event = {
+            "name": name,
+            "cat": cat,
+            "ph": "X",
+            "ts": int(start * 1_000_000),
+            "dur": int(duration * 1_000_000),
+            "pid": os.getpid(),
+            "tid": tid if tid is not None else threading.get_ident(),
+            "args": {k: v for k, v in args.items() if v is not None},
+        }
+        with self._lock:
+            self.events.append(event)
+
+    def write_chrome_trace(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            events = sorted(self.events, key=lambda e: e["ts"])
+        payload = {"traceEvents": events, "displayTimeUnit": "ms"}
+        path.write_text(json.dumps(payload, indent=1), encoding="utf-8")
+        return path
+
+    def summary(self) -> str:
+        """span 이름별 합계 표 (wall 시간 큰 순)."""
+        rows = {}
+        with self._lock:
+            for event in self.events:
+                row = rows.setdefault((event["cat"], event["name"]), [0, 0.0, 0.0, None])
+                row[0] += 1
+                row[1] += event["dur"] / 1_000_000
+                row[2] += event["args"].get("cpu", 0.0)
+                rss = event["args"].get("peak_rss_mb")
+                if rss is not None:
+                    row[3] = rss if row[3] is None else max(row[3], rss)
+
+        header = (
+            f"{'category':<10}{'name':<40}{'count':>6}"
+            f"{'wall(s)':>10}{'cpu(s)':>10}{'rss(MB)':>10}"
+        )
+        lines = [header, "-" * len(header)]
+        ordered = sorted(rows.items(), key=lambda kv: kv[1][1], reverse=True)
+        for (cat, name), (count, wall, cpu, rss) in ordered:
+            rss_text = f"{rss:>10.1f}" if rss is not None else f"{'-':>10}"
+            lines.append(f"{cat:<10}{name[:39]:<40}{count:>6}{wall:>10.2f}{cpu:>10.2f}{rss_text}")
+        return "\n".join(lines)
+
+    def write_summary(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.summary() + "\n", encoding="utf-8")
+        return path
+
+
+# 프로세스 전체에서 하나만 사용
+_TRACER = Tracer()
+if os.environ.get(ENV_VAR, "").strip().lower() in ("1", "true", "yes", "on"):
+    _TRACER.enable()
+
+
+def get_tracer() -> Tracer:
+    return _TRACER
+
+
+def span(name: str, cat: str = "build", **args):
+    """get_tracer().span 단축 함수."""
+    return _TRACER.span(name, cat, **args)
@@ -1,26 +1,126 @@
 import subprocess
 import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, NamedTuple, Optional
+
+from .fingerprint import hash_file, load_stage_state, save_stage_state
+from .trace import span
+
+# build_src 의 stage 상태 파일에서 쓰는 이름: {변환 폴더 절대경로: {.ui 상대경로: {size, mtime_ns, hash}}}
+UI_STATE_STAGE = "ui2py"
+
+
+class UiConvertResult(NamedTuple):
+    """convert_all_ui_files_in_directory 의 결과."""
+
+    converted: List[str]            # 변환한 .ui 파일
+    skipped: List[str]              # 이미 최신이라 건너뛴 .ui 파일
+    failed: Dict[str, str]          # {.ui 파일: stderr / 오류 메시지}
+
 
 def convert_ui_to_py(ui_file, output_file):
     """pyside6-uic 으로 .ui → .py 변환"""
     command = ['pyside6-uic', ui_file, '-o', output_file]
     try:
-        subprocess.run(command, check=True)
+        with span(f"uic {os.path.basename(ui_file)}", "ui"):
+            subprocess.run(command, check=True)
         print(f"✅ {ui_file} → {output_file}")
     except subprocess.CalledProcessError as e:
         print(f"❌ 변환 실패: {ui_file}, 오류: {e}")
 
-def convert_all_ui_files_in_directory(directory_path):
-    """폴더 내부의 모든 .ui 파일을 _ui.py 로 변환"""
+
+def _run_uic(ui_file: str, output_file: str) -> Optional[str]:
+    """pyside6-uic 실행. 성공하면 None, 실패하면 오류 메시지."""
+    command = ['pyside6-uic', ui_file, '-o', output_file]
+    try:
+        with span(f"uic {os.path.basename(ui_file)}", "ui"):
+            completed = subprocess.run(command, capture_output=True, text=True)
+    except OSError as e:
+        return str(e)
+    if completed.returncode != 0:
+        return completed.stderr.strip() or f"exit code {completed.returncode}"
+    return None
+
+
+def _is_up_to_date(ui_file: str, output_file: str, ui_hash: Optional[str], recorded: dict) -> bool:
+    """_ui.py 가 .ui 보다 최신이거나, .ui 내용이 마지막 변환 때와 같으면 최신."""
+    if not os.path.isfile(output_file):
+        return False
+    if os.path.getmtime(output_file) >= os.path.getmtime(ui_file):
+        return True
+    return ui_hash is not None and recorded.get("hash") == ui_hash
+
+
+def convert_all_ui_files_in_directory(
+    directory_path, max_workers=None, force=False, state_dir=None
+) -> UiConvertResult:
+    """폴더 내부의 모든 .ui 파일을 _ui.py 로 변환
+
+    - 이미 최신인 폼(_ui.py 가 더 최신이거나 .ui 내용 해시가 기록과 같음)은 건너뛴다.
+    - 변환은 스레드 풀에서 최대 max_workers 개씩 동시에 실행한다 (None 이면 CPU 수).
+    - force=True 면 모두 다시 변환한다.
+    - state_dir: .ui 해시 기록을 둘 폴더 (보통 build_src_path). 변환 폴더(src) 에는 아무것도 만들지 않는다.
+      None 이면 기록 없이 mtime 으로만 판단한다.
+    - 크기/수정시간이 기록과 같은 .ui 는 다시 읽지 않고 기록된 해시를 쓴다.
+    """
+    directory_key = os.path.abspath(directory_path)
+    states = load_stage_state(state_dir, UI_STATE_STAGE) if state_dir is not None else {}
+    manifest = states.get(directory_key, {})
+
+    jobs = []
+    skipped = []
+    entries = {}
     for root, dirs, files in os.walk(directory_path):
         for file in files:
             if file.endswith('.ui'):
                 ui_file = os.path.join(root, file)
                 output_file = os.path.splitext(ui_file)[0] + '_ui.py'
-                convert_ui_to_py(ui_file, output_file)
+                key = os.path.relpath(ui_file, directory_path).replace(os.sep, '/')
+                recorded = manifest.get(key, {})
+                if state_dir is not None:
+                    st = os.stat(ui_file)
+                    entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+                    if (
+                        recorded.get("size") == st.st_size
+                        and recorded.get("mtime_ns") == st.st_mtime_ns
+                    ):
+                        entry["hash"] = recorded.get("hash")
+                    if entry.get("hash") is None:
+                        entry["hash"] = hash_file(ui_file)
+                    entries[key] = entry
+                ui_hash = entries[key]["hash"] if key in entries else None
+                if not force and _is_up_to_date(ui_file, output_file, ui_hash, recorded):
+                    skipped.append(ui_file)
+                else:
+                    jobs.append((key, ui_file, output_file))
+
+    converted = []
+    failed = {}
+    if jobs:
+        workers = max_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            errors = list(pool.map(lambda job: _run_uic(job[1], job[2]), jobs))
+        for (key, ui_file, _), error in zip(jobs, errors):
+            if error is None:
+                converted.append(ui_file)
+            else:
+                failed[ui_file] = error
+                entries.pop(key, None)
+
+    # 성공했거나 이미 최신인 폼만 기록 (사라진 .ui 기록은 제거)
+    if state_dir is not None and entries != manifest:
+        states[directory_key] = entries
+        save_stage_state(state_dir, UI_STATE_STAGE, states)
+    return UiConvertResult(converted, skipped, failed)
 
 if __name__ == "__main__":
     # 변환할 디렉토리 경로 지정
     directory_path = 'src/ui'   # 필요에 맞게 경로 변경
-    convert_all_ui_files_in_directory(directory_path)
+    result = convert_all_ui_files_in_directory(directory_path)
+    print(
+        f"converted {len(result.converted)} / skipped {len(result.skipped)}"
+        f" / failed {len(result.failed)}"
+    )
+    for ui_file, error in result.failed.items():
+        print(f"❌ {ui_file}: {error}")
     print("__Convert UI Complete__")
@@ -0,0 +1,197 @@
+"""py2pyd unity build: 한 패키지(또는 지정한 그룹) 의 모듈들을 확장 모듈 하나로 링크한다.
+
+- 모듈마다 .py -> .c 변환은 그대로 하고 (C 재사용/캐시 동일), 링크만 묶음 확장 모듈 하나로 한다.
+  컴파일러/링커 호출과 실행 시 DLL 로드가 모듈 수만큼이 아니라 묶음 수만큼만 일어난다.
+- 묶음 이름은 <패키지>.__unity__ (그룹 이름이 있으면 <패키지>.__unity_<그룹>__).
+  Cython 모듈은 각자 PyInit_<모듈> 을 내보내므로, 묶음 안의 모듈은 multi-phase init 으로
+  원래 이름(a.b.c) 그대로 만들어진다.
+- 실행 시 원래 이름으로 찾을 수 있도록 output_root 에 로더(UNITY_LOADER_NAME) 를 만든다.
+  PyInstaller 에서는 runtime hook 으로 등록되고, 그 외에는 다른 import 보다 먼저 import 한다.
+
+    py2pyd(src, pyd, unity=True)                               # 패키지마다 하나
+    py2pyd(src, pyd, unity={"widgets/*.py": "widgets"})        # 지정한 모듈만 그룹으로
+"""
+from __future__ import annotations
+
+import copy
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Dict, Iterable, List, Union
+
+# output_root 에 생성하는 로더 모듈 파일 이름
+UNITY_LOADER_NAME = "hg_unity_loader.py"
+
+UnitySpec = Union[bool, Dict[str, str]]
+
+# 묶음 확장 모듈의 빌드 옵션은 모든 멤버가 같아야 한다 (C 컴파일/링크는 한 번에 하므로)
+_SHARED_OPTIONS = (
+    "extra_compile_args",
+    "extra_link_args",
+    "define_macros",
+    "undef_macros",
+    "include_dirs",
+    "library_dirs",
+    "libraries",
+    "language",
+)
+
+
+def bundle_name(package: str, group: str = "") -> str:
+    name = f"__unity_{group}__" if group else "__unity__"
+    return f"{package}.{name}" if package else name
+
+
+def unity_groups(module_keys: Iterable[str], unity: UnitySpec | None) -> Dict[str, str]:
+    """{모듈 key(src 기준 posix 상대경로): 묶음 모듈명}.
+
+    - unity=True: 패키지(폴더) 마다 하나로 묶는다.
+    - unity={glob: 그룹 이름}: glob 에 맞는 모듈만, 처음 맞는 그룹으로 묶는다.
+      한 그룹이 여러 패키지에 걸치면 패키지마다 따로 묶는다.
+    - 멤버가 하나뿐인 묶음은 만들지 않는다 (따로 빌드하는 것과 차이가 없다).
+    """
+    if not unity:
+        return {}
+    patterns = {"*": ""} if unity is True else dict(unity)
+    for group in patterns.values():
+        if group and not group.isidentifier():
+            raise ValueError(f"unity 그룹 이름은 식별자여야 합니다: {group!r}")
+
+    bundles: Dict[str, List[str]] = {}
+    for key in sorted(module_keys):
+        for pattern, group in patterns.items():
+            if fnmatchcase(key, pattern):
+                package = ".".join(key.split("/")[:-1])
+                bundles.setdefault(bundle_name(package, group), []).append(key)
+                break
+    return {
+        key: bundle
+        for bundle, keys in bundles.items()
+        if len(keys) > 1
+        for key in keys
+    }
+
+
+def bundle_source(bundle: str, members: List[str]) -> str:
+    """묶음 확장 모듈 자체의 C 소스 (비어 있는 multi-phase 모듈)."""
+    short = bundle.rsplit(".", 1)[-1]
+    doc = "py2pyd unity build: " + ", ".join(members)
+    return (
+        f"/* {bundle} : py2pyd unity build 가 생성 (직접 수정하지 않는다) */\n"
+        "#include <Python.h>\n"
+        "\n"
+        "static PyModuleDef_Slot unity_slots[] = {{0, NULL}};\n"
+        "\n"
+        "static struct PyModuleDef unity_def = {\n"
+        f'    PyModuleDef_HEAD_INIT, "{bundle}", "{doc}", 0, NULL, unity_slots,\n'
+        "};\n"
+        "\n"
+        f"PyMODINIT_FUNC PyInit_{short}(void)\n"
+        "{\n"
+        "    return PyModuleDef_Init(&unity_def);\n"
+        "}\n"
+    )
+
+
+def link_unity_extensions(extensions: list, c_root: str | Path) -> list:
+    """cythonize 가 끝난 Extension 중 unity_bundle 이 지정된 것들을 묶음 Extension 하나로 합친다.
+
+    - 묶음 C 소스는 c_root 아래 패키지 폴더에 만든다.
+    - 묶음에 넣지 않는 Extension 은 그대로 둔다 (순서 유지).
+    """
+    from setuptools import Extension
+
+    grouped: Dict[str, list] = {}
+    result = []
+    for ext in extensions:
+        bundle = getattr(ext, "unity_bundle", None)
+        if bundle is None:
+            result.append(ext)
+            continue
+        if bundle not in grouped:
+            grouped[bundle] = []
+            result.append(bundle)
+        grouped[bundle].append(ext)
+
+    for index, item in enumerate(result):
+        if isinstance(item, Extension):
+            continue
+        members = grouped[item]
+        first = members[0]
+        for ext in members[1:]:
+            for option in _SHARED_OPTIONS:
+                if getattr(ext, option, None) != getattr(first, option, None):
+                    raise ValueError(
+                        f"unity 묶음 {item} 안에서 {option} 이 다릅니다: {first.name}, {ext.name} "
+                        "(profile_overrides 에 맞춰 unity 그룹을 나누세요)"
+                    )
+        parts = item.split(".")
+        c_path = Path(c_root).joinpath(*parts[:-1]) / (parts[-1] + ".c")
+        c_path.parent.mkdir(parents=True, exist_ok=True)
+        text = bundle_source(item, [ext.name for ext in members])
+        if not c_path.is_file() or c_path.read_text(encoding="utf-8") != text:
+            c_path.write_text(text, encoding="utf-8")
+
+        bundle_ext = copy.copy(first)
+        bundle_ext.name = item
+        bundle_ext.sources = [str(c_path)] + [source for ext in members for source in ext.sources]
+        bundle_ext.unity_bundle = None
+        bundle_ext.unity_members = [ext.name for ext in members]
+        result[index] = bundle_ext
+    return result
+
+
+_LOADER_TEMPLATE = '''"""py2pyd unity build 로더 (py2pyd 가 생성, 직접 수정하지 않는다)
+
+묶음 확장 모듈 안의 모듈을 원래 이름으로 import 할 수 있도록 sys.meta_path 에 finder 를 등록한다.
+PyInstaller 에서는 runtime hook 으로 실행되고, 그 외에는 다른 import 보다 먼저 import 한다.
+"""
+import sys
+from importlib.machinery import ExtensionFileLoader, PathFinder
+from importlib.util import spec_from_loader
+
+# {{모듈명: 묶음 모듈명}}
+MEMBERS = {members!r}
+
+
+class UnityFinder:
+    members = {{}}
+
+    @classmethod
+    def find_spec(cls, fullname, path=None, target=None):
+        bundle = cls.members.get(fullname)
+        if bundle is None:
+            return None
+        # 묶음은 멤버와 같은 패키지에 있으므로 부모 패키지의 __path__ 에서 찾는다
+        spec = PathFinder.find_spec(bundle, path)
+        if spec is None or spec.origin is None:
+            return None
+        return spec_from_loader(fullname, ExtensionFileLoader(fullname, spec.origin))
+
+
+for _finder in sys.meta_path:
+    if getattr(_finder, "__name__", None) == "UnityFinder" and hasattr(_finder, "members"):
+        _finder.members.update(MEMBERS)
+        break
+else:
+    UnityFinder.members.update(MEMBERS)
+    sys.meta_path.insert(0, UnityFinder)
+'''
+
+
+def write_unity_loader(output_root: str | Path, members: Dict[str, str] | None) -> Path | None:
+    """output_root 에 로더를 만든다. members 가 None 이면 (unity 를 끈 경우) 남아 있는 로더를 지운다.
+
+    - members: {모듈명(a.b): 묶음 모듈명}. unity 를 켰는데 묶을 모듈이 없어도 로더는 만든다
+      (PyInstaller runtime hook 으로 항상 등록되므로).
+    - 반환값: 로더 경로 (지웠으면 None)
+    """
+    path = Path(output_root) / UNITY_LOADER_NAME
+    if members is None:
+        if path.is_file():
+            path.unlink()
+        return None
+    text = _LOADER_TEMPLATE.format(members=dict(sorted(members.items())))
+    if not path.is_file() or path.read_text(encoding="utf-8") != text:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text, encoding="utf-8")
+    return path
@@ -0,0 +1,127 @@
+"""한 번의 py2pyd 결과로 여러 PyInstaller 변형(variant) 을 동시에 빌드한다.
+
+- variant 는 pyi_config 위에 덮어쓰는 값들이다 (예: {"output_type": "onefile"}).
+  리스트 값도 합치지 않고 통째로 바꾼다.
+- variant 마다 spec / 증분 기록은 build_src/VARIANT_DIR/<이름>, workpath 는 그 아래 work,
+  distpath 는 프로젝트/dist/<이름> 으로 따로 두므로 동시에 실행해도 서로 덮어쓰지 않는다.
+- pyd_path(py2pyd 결과) 는 모든 variant 가 같이 읽기만 한다.
+
+    hg.add_config(variants={
+        "portable": {"output_type": "onefile", "console_mode": False},
+        "debug": {"console_mode": True},
+    })
+    hg.run_variants()
+"""
+from __future__ import annotations
+
+import copy
+import re
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+# build_src 아래 variant 별 spec / 작업 폴더
+VARIANT_DIR = "variants"
+
+# variant 로 덮어쓸 수 있는 pyi_config 키
+OVERLAY_KEYS = (
+    "output_type",
+    "console_mode",
+    "icon_path",
+    "add_data",
+    "hidden_imports",
+    "collect_data",
+    "collect_binary",
+    "collect_submodules",
+    "collect_all",
+    "exclude_module",
+    "main_py",
+)
+
+_NAME = re.compile(r"[A-Za-z0-9_.-]+")
+
+
+def validate_variants(variants: Dict[str, Optional[dict]]) -> None:
+    """variant 이름 (폴더 이름으로 쓴다) 과 덮어쓰는 키를 확인한다. 잘못되면 ValueError.
+
+    - 값이 None 인 variant 는 삭제 요청이므로 이름만 확인한다.
+    """
+    for name, overlay in variants.items():
+        if not isinstance(name, str) or not _NAME.fullmatch(name) or name in (".", ".."):
+            raise ValueError(f"variant 이름은 영문/숫자/_.- 만 쓸 수 있습니다: {name!r}")
+        if overlay is None:
+            continue
+        unknown = sorted(set(overlay) - set(OVERLAY_KEYS))
+        if unknown:
+            raise ValueError(f"variant {name!r} 에 알 수 없는 pyi_config 키: {', '.join(unknown)} "
+                             f"/ Allowed : {', '.join(OVERLAY_KEYS)}")
+        if overlay.get("output_type", "onedir") not in ("onefile", "onedir"):
+            raise ValueError(
+                f"Invalid output type : {overlay['output_type']} / Allowed : onefile, onedir"
+            )
+        if overlay.get("console_mode", True) not in (True, False):
+            raise ValueError(
+                f"Invalid console mode : {overlay['console_mode']} / Allowed : True, False"
+            )
+
+
+def variant_configs(build_config: dict, pyi_config: dict, name: str, overlay: dict) -> tuple:
+    """variant 하나의 (build_config, pyi_config) 사본.
+
+    - build_src_path 를 variant 폴더로 바꿔서 spec, 증분 기록(.hg_state), 크기 기록이 variant 마다 따로 쌓인다.
+    - dist_path / work_path 는 pyi_builder.run_pyinstaller 가 --distpath / --workpath 로 넘긴다.
+    """
+    variant_build = dict(build_config)
+    variant_dir = Path(build_config["build_src_path"]) / VARIANT_DIR / name
+    variant_build["build_src_path"] = variant_dir
+    variant_build["work_path"] = variant_dir / "work"
+    variant_build["dist_path"] = Path(build_config["project_path"]) / "dist" / name
+    variant_build["variant"] = name
+
+    variant_pyi = copy.deepcopy(pyi_config)
+    variant_pyi.update(copy.deepcopy(overlay))
+    return variant_build, variant_pyi
+
+
+class VariantResult(NamedTuple):
+    name: str
+    output_type: str
+    console_mode: bool
+    dist: str                       # dist 결과물 경로 (onedir 폴더 / onefile 실행 파일)
+    status: str                     # built / up to date / failed / skipped
+    spec_seconds: float
+    pyinstaller_seconds: float
+    size: Optional[int]             # dist 크기 (bytes), 결과물이 없으면 None
+    size_delta: Optional[int]       # 이전 빌드 대비 (기록이 없으면 None)
+
+
+def _mb(size: int) -> str:
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def print_variant_report(
+    results: List[VariantResult], wall_seconds: float, py2pyd_seconds: float = 0.0
+) -> None:
+    """variant 별 상태 / 시간 / 크기와, 순서대로 빌드했을 때 대비 걸린 시간을 출력한다."""
+    print("=" * 70)
+    print(
+        f"{'variant':<14}{'type':<8}{'console':<9}{'status':<12}"
+        f"{'spec':>7}{'build':>8}{'size':>11}  delta"
+    )
+    for result in results:
+        size = _mb(result.size) if result.size is not None else "-"
+        if result.size_delta is None:
+            delta = ""
+        else:
+            delta = f"{'+' if result.size_delta >= 0 else '-'}{_mb(abs(result.size_delta))}"
+        print(
+            f"{result.name:<14}{result.output_type:<8}{str(result.console_mode):<9}"
+            f"{result.status:<12}"
+            f"{result.spec_seconds:>6.1f}s{result.pyinstaller_seconds:>7.1f}s{size:>11}  {delta}"
+        )
+    serial = py2pyd_seconds + sum(r.spec_seconds + r.pyinstaller_seconds for r in results)
+    print("-" * 70)
+    print(f"전체 {wall_seconds:.1f}s (py2pyd {py2pyd_seconds:.1f}s) / 순서대로 빌드했다면 약 {serial:.1f}s")
+    for result in results:
+        if result.status == "built" or result.status == "up to date":
+            print(f"  {result.name:<14}{result.dist}")
+    print("=" * 70)
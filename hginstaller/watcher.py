@@ -0,0 +1,219 @@
+"""소스 / .ui 변경 감시 (HgInstaller.watch 에서 사용)
+
+- Linux 에서는 inotify (ctypes 로 libc 직접 호출), 그 외에는 주기적인 스캔(polling) 을 쓴다.
+- inotify 를 쓸 수 없으면 (watch 수 한도 초과 등) 자동으로 polling 으로 바뀐다.
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 변경을 감지할 파일 접미사
+WATCH_SUFFIXES = (".py", ".pyx", ".pxd", ".pxi", ".ui")
+# 감시하지 않을 폴더 이름
+IGNORE_DIRS = ("__pycache__", ".git")
+
+
+def _is_watched_file(name: str) -> bool:
+    return os.path.splitext(name)[1] in WATCH_SUFFIXES
+
+
+def _walk_dirs(root: Path):
+    """root 와 그 아래 감시 대상 폴더들을 돌려준다."""
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        yield directory
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir() and entry.name not in IGNORE_DIRS:
+                            stack.append(Path(entry.path))
+                    except OSError:
+                        continue
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            continue
+
+
+def snapshot(roots: Iterable[Path]) -> Dict[Path, Tuple[int, int]]:
+    """roots 아래 감시 대상 파일의 {경로: (mtime_ns, size)}."""
+    result: Dict[Path, Tuple[int, int]] = {}
+    for root in roots:
+        for directory in _walk_dirs(Path(root)):
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if not _is_watched_file(entry.name):
+                            continue
+                        try:
+                            if entry.is_file():
+                                st = entry.stat()
+                                result[Path(entry.path)] = (st.st_mtime_ns, st.st_size)
+                        except OSError:
+                            continue
+            except (FileNotFoundError, NotADirectoryError, PermissionError):
+                continue
+    return result
+
+
+class PollingBackend:
+    """interval 마다 스냅샷을 비교해서 바뀐 파일을 찾는다."""
+
+    name = "polling"
+
+    def __init__(self, roots: List[Path], interval: float = 1.0):
+        self.roots = roots
+        self.interval = interval
+        self._state = snapshot(roots)
+
+    def read(self, timeout: float) -> Set[Path]:
+        time.sleep(min(timeout, self.interval))
+        current = snapshot(self.roots)
+        changed = {p for p, v in current.items() if self._state.get(p) != v}
+        changed |= self._state.keys() - current.keys()
+        self._state = current
+        return changed
+
+    def close(self) -> None:
+        pass
+
+
+# <sys/inotify.h>
+_IN_MODIFY = 0x00000002
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+_WATCH_MASK = (
+    _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO
+    | _IN_CREATE | _IN_DELETE | _IN_DELETE_SELF
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class InotifyBackend:
+    """Linux inotify 로 폴더별 변경 이벤트를 받는다."""
+
+    name = "inotify"
+
+    def __init__(self, roots: List[Path]):
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        fd = self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 실패")
+        self._fd = fd
+        self._dirs: Dict[int, Path] = {}
+        self.roots = roots
+        try:
+            for root in roots:
+                self._add_tree(Path(root))
+        except OSError:
+            self.close()
+            raise
+
+    def _add_tree(self, root: Path) -> None:
+        for directory in _walk_dirs(root):
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(directory)), _WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                if not os.path.isdir(directory):
+                    continue
+                # ENOSPC: fs.inotify.max_user_watches 초과
+                raise OSError(errno, f"inotify_add_watch 실패: {directory}")
+            self._dirs[wd] = directory
+
+    def read(self, timeout: float) -> Set[Path]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        changed: Set[Path] = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                # 이벤트 유실 -> 감시 중인 파일 전체를 바뀐 것으로 취급
+                changed |= snapshot(self.roots).keys()
+                continue
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+            directory = self._dirs.get(wd)
+            if directory is None or not name:
+                continue
+            path = directory / os.fsdecode(name)
+            if mask & _IN_ISDIR:
+                if mask & (_IN_CREATE | _IN_MOVED_TO) and path.name not in IGNORE_DIRS:
+                    # 새 폴더: 감시를 추가하고, 감시 전에 이미 생긴 파일도 변경으로 취급
+                    try:
+                        self._add_tree(path)
+                    except OSError as e:
+                        print(f"⚠ 새 폴더를 감시하지 못했습니다: {e}")
+                    changed |= snapshot([path]).keys()
+                continue
+            if _is_watched_file(path.name):
+                changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def create_backend(
+    roots: List[Path], use_inotify: Optional[bool] = None, poll_interval: float = 1.0
+):
+    """Linux 면 inotify, 아니면(또는 실패하면) polling 백엔드를 만든다."""
+    if use_inotify is None:
+        use_inotify = sys.platform.startswith("linux")
+    if use_inotify:
+        try:
+            return InotifyBackend(roots)
+        except (OSError, AttributeError) as e:
+            print(f"inotify 를 사용할 수 없어 polling 으로 감시합니다: {e}")
+    return PollingBackend(roots, poll_interval)
+
+
+def wait_for_changes(backend, debounce: float = 0.3, timeout: Optional[float] = None) -> Set[Path]:
+    """변경이 생길 때까지 기다린 뒤, debounce 초 동안 조용해질 때까지 이벤트를 모아서 돌려준다.
+
+    - timeout 초 안에 변경이 없으면 빈 set.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    changed: Set[Path] = set()
+    while not changed:
+        wait = 1.0 if deadline is None else max(0.0, min(1.0, deadline - time.monotonic()))
+        changed = backend.read(wait)
+        if not changed and deadline is not None and time.monotonic() >= deadline:
+            return set()
+    while True:
+        more = backend.read(debounce)
+        if not more:
+            return changed
+        changed |= more
@@ -0,0 +1,67 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# benchmarks/synthetic.py 의 외부 도구 대역(pyinstaller / pyi-makespec / ISCC) 을 테스트에서도 쓴다
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "benchmarks"))
+
+
+@pytest.fixture
+def stub_tools(tmp_path: Path, monkeypatch):
+    """PATH 에 도구 대역을 넣고, GlobalSettings 가 실제 사용자 설정을 건드리지 않도록 격리한다."""
+    from synthetic import make_stub_tools
+
+    tools = make_stub_tools(tmp_path / "bin")
+    monkeypatch.setenv("PATH", str(tools["bin_dir"]), prepend=os.pathsep)
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    return tools
+
+
+@pytest.fixture
+def built(tmp_path: Path):
+    """mod.py (+ 같은 이름의 mod.pxd) 와 plain.py 를 한 번 빌드해 둔 (src, pyd)."""
+    pytest.importorskip("Cython")
+    from hginstaller.py2pyd import py2pyd
+
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "mod.py").write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    (src / "mod.pxd").write_text("# v1\n", encoding="utf-8")
+    (src / "plain.py").write_text("VALUE = 1\n", encoding="utf-8")
+    pyd = tmp_path / "pyd"
+    py2pyd(src, pyd, workers=1, use_cache=False)
+    return src, pyd
+
+
+@pytest.fixture
+def project(tmp_path: Path, stub_tools):
+    """도구 대역으로 빌드할 수 있는 최소 프로젝트의 (build_config, pyi_config)."""
+    from hginstaller.hg_settings import GlobalSettings, LocalSettings
+
+    root = tmp_path / "project"
+    build_src = root / "build_src"
+    build_src.mkdir(parents=True)
+    (build_src / "App.spec").write_text("# spec\n", encoding="utf-8")
+    (root / "main.py").write_text("print('hello')\n", encoding="utf-8")
+    (build_src / "src_pyd").mkdir()
+    build_config = {
+        "program_name": "App",
+        "program_version": "1.0.0",
+        "project_path": str(root),
+        "build_src_path": str(build_src),
+        "pyd_path": str(build_src / "src_pyd"),
+    }
+    pyi_config = {
+        "main_py": "main.py",
+        "output_type": "onedir",
+        "console_mode": True,
+        "hidden_imports": [],
+        "add_data": ["build_src/src_pyd/*:."],
+    }
+    LocalSettings.set_project_path(root)
+    LocalSettings.save("build_config", build_config)
+    LocalSettings.save("iss_config", {"app_publisher": "HG", "app_url": "https://example.com"})
+    GlobalSettings.save("iss", {"iss_path": str(stub_tools["iscc"])})
+    return build_config, pyi_config
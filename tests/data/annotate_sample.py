@@ -0,0 +1,13 @@
+import math
+
+
+def area(r):
+    return math.pi * r * r
+
+
+class Shape:
+    def scale(self, k):
+        total = 0
+        for i in range(k):
+            total += i
+        return total
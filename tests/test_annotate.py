@@ -0,0 +1,45 @@
+import json
+from pathlib import Path
+
+from hginstaller.annotate import (
+    MODULE_SCOPE,
+    parse_annotation_html,
+    summarize_annotations,
+    summarize_module,
+)
+
+DATA = Path(__file__).parent / "data"
+SOURCE = DATA / "annotate_sample.py"
+HTML = DATA / "annotate_sample.html"
+
+
+def test_parse_annotation_html():
+    scores = parse_annotation_html(HTML)
+    assert len(scores) == 13
+    assert {line: score for line, score in scores.items() if score} == {
+        1: 16, 4: 41, 5: 18, 8: 7, 9: 51, 10: 1, 11: 48, 12: 6, 13: 2,
+    }
+
+
+def test_summarize_module_groups_yellow_lines_by_function():
+    summary = summarize_module("pkg.sample", SOURCE, HTML)
+    assert (summary["yellow_lines"], summary["score"]) == (9, 190)
+    rows = [(f["name"], f["lineno"], f["yellow_lines"], f["score"]) for f in summary["functions"]]
+    assert rows == [
+        ("Shape.scale", 9, 5, 108),
+        ("area", 4, 2, 59),
+        (MODULE_SCOPE, 0, 1, 16),
+        ("Shape", 8, 1, 7),
+    ]
+
+
+def test_summarize_annotations_writes_json(tmp_path: Path):
+    output = tmp_path / "annotate_summary.json"
+    summary = summarize_annotations(
+        [("pkg.sample", SOURCE, HTML), ("pkg.missing", SOURCE, tmp_path / "missing.html")],
+        output,
+    )
+    # HTML 이 없는 모듈은 건너뛴다
+    assert [m["module"] for m in summary["modules"]] == ["pkg.sample"]
+    assert summary["functions"][0]["module"] == "pkg.sample"
+    assert json.loads(output.read_text(encoding="utf-8"))["total_score"] == 190
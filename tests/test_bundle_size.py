@@ -0,0 +1,81 @@
+from importlib.machinery import EXTENSION_SUFFIXES
+from pathlib import Path
+
+from hginstaller import bundle_size
+from hginstaller.bundle_size import (
+    MAX_SNAPSHOTS,
+    ROOT_PACKAGE,
+    analyze_bundle,
+    load_snapshots,
+    record_snapshot,
+    size_deltas,
+)
+
+
+def _write(path: Path, size: int, fill: bytes = b"x") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(fill * size)
+
+
+def _onedir(tmp_path: Path) -> Path:
+    """PyInstaller 6 onedir 구조: dist/App/App + dist/App/_internal/..."""
+    dist = tmp_path / "dist" / "App"
+    internal = dist / "_internal"
+    _write(dist / "App", 100)
+    _write(internal / "base_library.zip", 50)
+    _write(internal / "pkg" / "__init__.pyc", 10)
+    _write(internal / "pkg" / f"core{EXTENSION_SUFFIXES[0]}", 300)
+    _write(internal / "pkg" / "data.json", 5)
+    # 태그 없는 .so 는 일반 공유 라이브러리로 본다. 같은 내용이 두 곳에 들어간 경우
+    _write(internal / "pkg.libs" / "libfoo.so", 200, b"f")
+    _write(internal / "other" / "libfoo.so", 200, b"f")
+    # 크기만 같고 내용이 다른 파일은 중복이 아니다
+    _write(internal / "other" / "libbar.so", 200, b"b")
+    return dist
+
+
+def test_analyze_onedir_with_internal(tmp_path: Path):
+    dist = _onedir(tmp_path)
+    snapshot = analyze_bundle(dist, top_level={"pkg": ["pkg-dist"]})
+
+    assert snapshot["total"] == 100 + 50 + 10 + 300 + 5 + 200 * 3
+    assert snapshot["files"] == 8
+    assert snapshot["by_category"] == {
+        "executable": 100,
+        "python": 60,
+        "extension": 300,
+        "data": 5,
+        "binary": 600,
+    }
+    # _internal 아래가 기준이므로 패키지는 _internal 이 아니라 그 아래 폴더
+    assert snapshot["by_package"] == {ROOT_PACKAGE: 150, "pkg": 515, "other": 400}
+    assert snapshot["by_distribution"] == {ROOT_PACKAGE: 150, "pkg-dist": 515, "other": 400}
+    assert snapshot["duplicates"] == [
+        {
+            "size": 200,
+            "wasted": 200,
+            "paths": ["_internal/other/libfoo.so", "_internal/pkg.libs/libfoo.so"],
+        }
+    ]
+
+
+def test_size_deltas_sorted_by_change(tmp_path: Path):
+    previous = {"by_distribution": {"a": 100, "b": 50, "gone": 10}}
+    current = {"by_distribution": {"a": 100, "b": 80, "new": 200}}
+    assert size_deltas(previous, current) == [
+        ("new", 0, 200, 200),
+        ("b", 50, 80, 30),
+        ("gone", 10, 0, -10),
+    ]
+
+
+def test_record_snapshot_keeps_last_max(tmp_path: Path):
+    assert record_snapshot(tmp_path, {"total": 0}) is None
+    for total in range(1, MAX_SNAPSHOTS + 5):
+        previous = record_snapshot(tmp_path, {"total": total})
+        assert previous["total"] == total - 1
+
+    history = load_snapshots(tmp_path)
+    assert len(history) == MAX_SNAPSHOTS
+    assert [s["total"] for s in history] == list(range(5, MAX_SNAPSHOTS + 5))
+    assert (tmp_path / bundle_size.SNAPSHOT_NAME).is_file()
@@ -0,0 +1,45 @@
+from pathlib import Path
+
+import pytest
+
+from hginstaller.cython_deps import build_dependency_graph
+
+
+def _scan(root: Path, file_cache: dict) -> dict:
+    files = {path: path.stat() for path in root.rglob("*") if path.is_file()}
+    return build_dependency_graph(root, files, file_cache)
+
+
+def test_cached_scan_picks_up_new_pxd(tmp_path: Path):
+    (tmp_path / "pkg").mkdir()
+    mod = tmp_path / "pkg" / "mod.pyx"
+    mod.write_text(
+        "cimport helper\n"
+        "from . cimport sibling\n"
+        "include 'consts.pxi'\n"
+        "from libc.math cimport sin\n",
+        encoding="utf-8",
+    )
+    file_cache: dict = {}
+    assert _scan(tmp_path, file_cache)[mod] == set()
+
+    # mod.pyx 는 그대로라 캐시된 결과를 쓰지만, 찾지 못했던 cimport / include 는 다시 찾는다
+    created = [
+        tmp_path / "helper.pxd",
+        tmp_path / "pkg" / "sibling.pxd",
+        tmp_path / "pkg" / "consts.pxi",
+    ]
+    for path in created:
+        path.write_text("", encoding="utf-8")
+    assert _scan(tmp_path, file_cache)[mod] == set(created)
+
+
+def test_pxd_change_rebuilds_dependents(built):
+    pytest.importorskip("Cython")
+    from hginstaller.py2pyd import find_pyd_target, load_manifest
+
+    src, pyd = built
+    assert "mod.pxd" in load_manifest(pyd)["modules"]["mod.py"]["deps"]
+    (src / "mod.pxd").write_text("# v2\n", encoding="utf-8")
+    statuses = {py.name: status for py, _, status in find_pyd_target(src, pyd)}
+    assert statuses == {"mod.py": "dep_changed"}
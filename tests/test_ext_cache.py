@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("Cython")
+
+from hginstaller import ext_cache
+from hginstaller.ext_cache import ExtensionCache
+from hginstaller.py2pyd import py2pyd
+
+
+def test_cache_hits_across_source_trees(tmp_path: Path, monkeypatch):
+    cache = ExtensionCache(tmp_path / "cache")
+    monkeypatch.setattr(
+        ExtensionCache, "from_settings", classmethod(lambda cls, enabled=None: cache)
+    )
+    ext_cache.reset_cache_stats()
+
+    for name in ("src", "src2"):
+        src = tmp_path / name / "pkg"
+        src.mkdir(parents=True)
+        (src / "__init__.py").write_text("", encoding="utf-8")
+        (src / "mod.py").write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+
+    # 생성된 C 에는 소스 절대 경로가 들어가지만 키는 소스 입력 기준이므로 두 번째는 캐시에서 가져온다
+    py2pyd(tmp_path / "src", tmp_path / "pyd", workers=1)
+    py2pyd(tmp_path / "src2", tmp_path / "pyd2", workers=1)
+
+    stats = ext_cache.get_cache_stats()
+    assert (stats["miss"], stats["hit"], stats["store"]) == (1, 1, 1)
+    assert list((tmp_path / "pyd2" / "pkg").glob("mod.*"))
+
+
+def test_store_leaves_eviction_to_the_caller(tmp_path: Path):
+    cache = ExtensionCache(tmp_path / "cache", max_size_mb=0)
+    built = tmp_path / "mod.so"
+    built.write_bytes(b"x" * 10)
+    for key in ("aa1", "aa2", "bb1"):
+        cache.store(key, built)
+    # store 만으로는 지우지 않는다 (빌드 끝에 한 번 evict)
+    assert len(list(cache.root.glob("*/*"))) == 3
+    assert not list(cache.root.glob("*/*.tmp"))
+
+    cache.evict()
+    assert list(cache.root.glob("*/*")) == []
+
+
+def test_entry_removed_by_another_process(tmp_path: Path, monkeypatch):
+    cache = ExtensionCache(tmp_path / "cache")
+    built = tmp_path / "mod.so"
+    built.write_bytes(b"x")
+    cache.store("aa1", built)
+    entry = cache._entry_path("aa1")
+
+    # 다른 프로세스가 glob 과 unlink 사이에 지운 경우
+    original_unlink = Path.unlink
+
+    def _racing_unlink(self, *args, **kwargs):
+        original_unlink(self)
+        return original_unlink(self, *args, **kwargs)
+
+    cache.max_bytes = 0
+    monkeypatch.setattr(Path, "unlink", _racing_unlink)
+    cache.evict()
+    monkeypatch.undo()
+
+    assert not entry.exists()
+    assert cache.fetch("aa1", tmp_path / "out" / "mod.so") is False
@@ -0,0 +1,69 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from hginstaller.hg_settings import LocalSettings
+
+
+@pytest.fixture
+def settings(tmp_path: Path):
+    LocalSettings.set_project_path(tmp_path)
+    return LocalSettings
+
+
+def test_transaction_writes_once_on_commit(settings):
+    with settings.transaction():
+        settings.save("a", {"x": 1})
+        settings.save("b", {"y": 2})
+        assert not settings.get_path().exists()
+        assert settings.load("a") == {"x": 1}
+    assert settings.load("a") == {"x": 1}
+    assert settings.load("b") == {"y": 2}
+
+
+def test_inner_exception_rolls_back_only_inner_changes(settings):
+    with settings.transaction():
+        settings.save("outer", {"v": 1})
+        with pytest.raises(RuntimeError):
+            with settings.transaction():
+                settings.save("inner", {"v": 2})
+                settings.save("outer", {"v": 99})
+                raise RuntimeError
+        assert settings.load("outer") == {"v": 1}
+        assert settings.load("inner") == {}
+    assert settings.load("outer") == {"v": 1}
+    assert settings.load("inner") == {}
+
+
+def test_outer_exception_discards_everything(settings):
+    settings.save("a", {"x": 1})
+    with pytest.raises(RuntimeError):
+        with settings.transaction():
+            settings.save("a", {"x": 2})
+            raise RuntimeError
+    assert settings.load("a") == {"x": 1}
+
+
+def test_transaction_does_not_capture_other_threads(settings):
+    in_transaction = threading.Event()
+    written = threading.Event()
+
+    def _other_thread():
+        in_transaction.wait(timeout=5)
+        # 다른 스레드의 save 는 transaction 에 묶이지 않고 바로 파일에 쓴다
+        settings.save("other", {"z": 3})
+        written.set()
+
+    thread = threading.Thread(target=_other_thread)
+    thread.start()
+    with settings.transaction():
+        settings.save("mine", {"x": 1})
+        in_transaction.set()
+        assert written.wait(timeout=5)
+        assert settings.load("other") == {}
+    thread.join()
+
+    # 커밋은 이 transaction 에서 바뀐 섹션만 덮어쓰므로 다른 스레드의 기록도 남는다
+    assert settings.load("other") == {"z": 3}
+    assert settings.load("mine") == {"x": 1}
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# import 만으로는 불러오면 안 되는 무거운 모듈
+HEAVY_MODULES = ("setuptools", "Cython", "platformdirs", "PyInstaller", "hginstaller.py2pyd")
+
+
+@pytest.mark.parametrize("statement", ["import hginstaller", "from hginstaller import HgInstaller"])
+def test_import_does_not_load_heavy_modules(statement):
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, cwd=ROOT, check=True
+    )
+    assert completed.stdout.strip() == ""
+
+
+def test_import_time_within_budget():
+    from bench_import import BUDGET_MS, measure
+
+    # 한 번의 측정은 흔들리므로 최소값으로 판단한다
+    best = min(measure("import hginstaller")[0] for _ in range(3))
+    assert best > 0, "-X importtime 출력에서 hginstaller 를 찾지 못했습니다"
+    assert best / 1000 < BUDGET_MS
+
+
+def test_lazy_attribute_resolves_function_not_submodule():
+    import hginstaller
+
+    # 하위 모듈 hginstaller.py2pyd 가 같은 이름의 공개 함수를 가리면 안 된다
+    assert callable(hginstaller.py2pyd)
+    assert hginstaller.py2pyd.__module__ == "hginstaller.py2pyd"
@@ -0,0 +1,97 @@
+import ast
+from pathlib import Path
+
+from hginstaller.import_analysis import (
+    _imports_of,
+    propose_imports,
+    scan_imports,
+    top_level_distributions,
+)
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_imports_of_conditional_try_and_dynamic():
+    source = """
+import importlib
+from a.b import c
+from a.d import *
+if FLAG:
+    import cond_mod
+try:
+    import fast_json as json
+except ImportError:
+    import json
+def load():
+    importlib.import_module("plugins.csv")
+    __import__("legacy")
+    importlib.import_module(".relative", __package__)
+    importlib.import_module(name)
+from . import sibling
+from .pkg import thing
+"""
+    assert _imports_of(ast.parse(source)) == [
+        "a.b",
+        "a.b.c",
+        "a.d",
+        "cond_mod",
+        "fast_json",
+        "importlib",
+        "json",
+        "legacy",
+        "plugins.csv",
+    ]
+
+
+def test_scan_imports_uses_cache(tmp_path: Path):
+    src = tmp_path / "src"
+    mod = _write(src / "mod.py", "import requests\n")
+    cache = tmp_path / "cache.json"
+    assert scan_imports([mod], tmp_path, cache) == {"src/mod.py": ["requests"]}
+
+    # 캐시에 남은 import 목록을 쓰는지 확인하기 위해 기록을 바꿔 둔다
+    from hginstaller.fingerprint import load_state, save_state
+
+    state = load_state(cache)
+    state["files"]["src/mod.py"]["imports"] = ["cached"]
+    save_state(cache, state)
+    assert scan_imports([mod], tmp_path, cache) == {"src/mod.py": ["cached"]}
+
+    _write(src / "mod.py", "import httpx\n")
+    assert scan_imports([mod], tmp_path, cache) == {"src/mod.py": ["httpx"]}
+
+
+def test_top_level_maps_to_distribution():
+    mapping = top_level_distributions()
+    assert mapping["pytest"] == ["pytest"]
+    # 배포판 이름과 다른 최상위 모듈도 찾는다
+    assert mapping["_pytest"] == ["pytest"]
+
+
+def test_propose_imports(tmp_path: Path):
+    src = tmp_path / "src"
+    _write(src / "pkg" / "__init__.py", "from . import helpers\n")
+    _write(src / "pkg" / "helpers.py", "from .core import run\nimport pkg.core\n")
+    _write(src / "pkg" / "core.py", "import _pytest.fixtures\nimport not_installed_xyz\n")
+    main_py = _write(tmp_path / "main.py", "import pluggy\nimport pkg\n")
+
+    proposal = propose_imports(
+        src,
+        main_py,
+        dependencies=["pytest", "pluggy", "Cython"],
+        current={"hidden_imports": ["stale"], "exclude_module": []},
+    )
+
+    # 상대 import 와 src 안의 패키지는 외부 모듈이 아니다
+    # main.py 가 직접 import 하는 pluggy 는 PyInstaller 가 분석한다
+    assert proposal.hidden_imports == ["_pytest.fixtures", "not_installed_xyz"]
+    assert proposal.used_by["_pytest.fixtures"] == ["src/pkg/core.py"]
+    assert proposal.unresolved == ["not_installed_xyz"]
+    # pytest 는 _pytest 로, pluggy 는 pytest 의 요구사항으로 쓰이므로 Cython 만 제외 후보
+    cython_tops = [top for top, dists in top_level_distributions().items() if "Cython" in dists]
+    assert proposal.exclude_module == sorted(cython_tops)
+    assert proposal.removed["hidden_imports"] == ["stale"]
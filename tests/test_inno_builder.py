@@ -0,0 +1,49 @@
+from pathlib import Path
+
+from hginstaller.hg_settings import LocalSettings
+from hginstaller.inno_builder import inno_fingerprint, installer_output_path, run_inno
+from hginstaller.pyi_builder import run_pyinstaller
+
+
+def test_inno_skipped_when_dist_and_iss_unchanged(project):
+    build_config, pyi_config = project
+    run_pyinstaller(build_config, pyi_config)
+
+    assert run_inno() is True
+    installer = installer_output_path(build_config)
+    assert installer.is_file()
+    assert run_inno() is False
+
+    # PyInstaller 가 같은 내용으로 다시 써도 (mtime 만 바뀜) 생략한다
+    assert run_pyinstaller(build_config, pyi_config, force=True) is True
+    assert run_inno() is False
+
+    (Path(build_config["project_path"]) / "dist" / "App" / "App.exe").write_bytes(b"changed")
+    assert run_inno() is True
+
+
+def test_inno_reruns_when_iss_or_installer_changes(project):
+    build_config, pyi_config = project
+    run_pyinstaller(build_config, pyi_config)
+    run_inno()
+
+    LocalSettings.save("build_config", {**build_config, "program_version": "1.0.1"})
+    assert run_inno() is True
+    assert installer_output_path({**build_config, "program_version": "1.0.1"}).is_file()
+
+    installer_output_path({**build_config, "program_version": "1.0.1"}).unlink()
+    assert run_inno() is True
+    assert run_inno(force=True) is True
+
+
+def test_fingerprint_follows_dist_path(project, tmp_path: Path):
+    build_config, _ = project
+    iss = tmp_path / "setup.iss"
+    iss.write_text("; iss\n", encoding="utf-8")
+    dist = tmp_path / "variant_dist" / "App"
+    dist.mkdir(parents=True)
+    (dist / "App.exe").write_bytes(b"variant")
+
+    assert inno_fingerprint(build_config, iss, "iscc")["files"] == {}
+    variant_build = {**build_config, "dist_path": str(dist.parent)}
+    assert list(inno_fingerprint(variant_build, iss, "iscc")["files"]) == ["App.exe"]
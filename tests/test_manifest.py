@@ -0,0 +1,47 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("Cython")
+
+from hginstaller.py2pyd import find_pyd_target, load_manifest, py2pyd
+
+
+def _statuses(src: Path, pyd: Path, **kwargs) -> dict:
+    return {py.name: status for py, _, status in find_pyd_target(src, pyd, **kwargs)}
+
+
+def test_first_build_writes_manifest(built):
+    src, pyd = built
+    manifest = load_manifest(pyd)
+    assert set(manifest["modules"]) == {"mod.py", "plain.py"}
+    assert _statuses(src, pyd) == {}
+
+
+def test_touch_without_content_change_is_up_to_date(built):
+    src, pyd = built
+    future = time.time() + 10
+    os.utime(src / "plain.py", (future, future))
+    assert _statuses(src, pyd) == {}
+
+
+def test_content_change_rebuilds_only_that_module(built):
+    src, pyd = built
+    (src / "plain.py").write_text("VALUE = 2\n", encoding="utf-8")
+    assert _statuses(src, pyd) == {"plain.py": "hash_changed"}
+
+
+def test_env_change_rebuilds_everything(built):
+    src, pyd = built
+    ext_options = {"define_macros": [("HG_TEST", "1")]}
+    expected = {"mod.py": "env_changed", "plain.py": "env_changed"}
+    assert _statuses(src, pyd, ext_options=ext_options) == expected
+
+
+def test_incremental_rebuild_updates_manifest(built):
+    src, pyd = built
+    (src / "plain.py").write_text("VALUE = 2\n", encoding="utf-8")
+    py2pyd(src, pyd, workers=1, use_cache=False)
+    assert _statuses(src, pyd) == {}
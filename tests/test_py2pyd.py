@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("Cython")
+
+from hginstaller.py2pyd import _cythonize_one, py2pyd, set_extentions
+
+
+def test_cythonize_one_writes_c(tmp_path: Path):
+    # Cython 3.0.x 의 cythonize_one 은 fingerprint 기본값이 없다
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "mod.py").write_text("def add(a, b):\n    return a + b\n", encoding="utf-8")
+    (ext,) = set_extentions([(src / "mod.py", None, "pyd_missing")], src)
+
+    c_path = tmp_path / "c" / "mod.c"
+    ext, seconds, _, _ = _cythonize_one(ext, str(c_path), str(src))
+
+    assert c_path.is_file()
+    assert ext.sources == [str(c_path)]
+    assert seconds >= 0
+
+
+def test_prune_removes_orphaned_intermediates(tmp_path: Path, monkeypatch):
+    # build_ext 는 C 경로를 build_temp 아래에 그대로 따라 object 를 만들므로 상대경로 빌드로 확인한다
+    monkeypatch.chdir(tmp_path)
+    pkg = Path("src") / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "a.py").write_text("A = 1\n", encoding="utf-8")
+    (pkg / "b.py").write_text("B = 1\n", encoding="utf-8")
+    py2pyd("src", "pyd", workers=1, use_cache=False)
+
+    def _files(name):
+        matches = (p for p in tmp_path.rglob(f"{name}.*") if p.is_file())
+        return sorted(p.relative_to(tmp_path).as_posix() for p in matches)
+
+    built = _files("b")
+    assert len(built) == 4      # src 의 .py, .so/.pyd, .c, object
+    (pkg / "b.py").unlink()
+
+    py2pyd("src", "pyd", workers=1, use_cache=False, prune="dry-run")
+    assert _files("b") == [p for p in built if not p.startswith("src/")]
+
+    py2pyd("src", "pyd", workers=1, use_cache=False, prune=True)
+    assert _files("b") == []
+    assert len(_files("a")) == 4
+
+    with pytest.raises(ValueError):
+        py2pyd("src", "pyd", workers=1, use_cache=False, prune="yes")
+
+
+def test_explain_marks_rebuilt_unity_members(tmp_path: Path, capsys):
+    pkg = tmp_path / "src" / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "a.py").write_text("A = 1\n", encoding="utf-8")
+    (pkg / "b.py").write_text("B = 1\n", encoding="utf-8")
+    (pkg / "c.py").write_text("C = 1\n", encoding="utf-8")
+    src, pyd = tmp_path / "src", tmp_path / "pyd"
+    unity = {"pkg/a.py": "ab", "pkg/b.py": "ab"}
+    py2pyd(src, pyd, workers=1, use_cache=False, unity=unity)
+
+    (pkg / "a.py").write_text("A = 2\n", encoding="utf-8")
+    capsys.readouterr()
+    py2pyd(src, pyd, workers=1, use_cache=False, unity=unity, explain=True)
+    marks = {
+        line[8:].split()[0]: line[1:6]
+        for line in capsys.readouterr().out.splitlines()
+        if line.startswith(("[BUILD]", "[skip ]"))
+    }
+    assert marks == {"pkg/a.py": "BUILD", "pkg/b.py": "BUILD", "pkg/c.py": "skip "}
+
+
+def test_builder_recreates_deleted_build_dirs(tmp_path: Path):
+    import shutil
+
+    from hginstaller.py2pyd import Py2PydBuilder
+
+    pkg = tmp_path / "src" / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("", encoding="utf-8")
+    (pkg / "a.py").write_text("A = 1\n", encoding="utf-8")
+    src, pyd = tmp_path / "src", tmp_path / "pyd"
+
+    with Py2PydBuilder(workers=1, use_cache=False) as builder:
+        builder.build(src, pyd)
+        # 같은 worker 가 다시 빌드할 때 지워진 build_temp / 출력 폴더를 다시 만들어야 한다
+        shutil.rmtree(pyd)
+        shutil.rmtree(tmp_path / "pyd_build")
+        builder.build(src, pyd)
+    assert list((pyd / "pkg").glob("a.*"))
@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from hginstaller.pyi_builder import pyi_maker, run_pyinstaller
+
+
+def test_spec_does_not_depend_on_pyd_contents(project, capsys):
+    build_config, pyi_config = project
+    (Path(build_config["build_src_path"]) / "App.spec").unlink()
+    assert pyi_maker(build_config, pyi_config) is True
+    assert (Path(build_config["build_src_path"]) / "App.spec").is_file()
+
+    # py2pyd 가 동시에 pyd_path 를 쓰고 있어도 spec 을 다시 만들지 않는다
+    # (add_data 는 패턴 그대로 spec 에 들어감)
+    (Path(build_config["pyd_path"]) / "mod.pyd").write_bytes(b"module")
+    capsys.readouterr()
+    assert pyi_maker(build_config, pyi_config) is True
+    assert "pyi-makespec 생략" in capsys.readouterr().out
+
+    assert pyi_maker(build_config, {**pyi_config, "console_mode": False}) is True
+    assert "실행할 명령어" in capsys.readouterr().out
+
+
+def test_pyinstaller_skipped_when_inputs_unchanged(project):
+    build_config, pyi_config = project
+    assert run_pyinstaller(build_config, pyi_config) is True
+    assert (Path(build_config["project_path"]) / "dist" / "App" / "App.exe").is_file()
+
+    assert run_pyinstaller(build_config, pyi_config) is False
+    assert run_pyinstaller(build_config, pyi_config, force=True) is True
+
+
+def test_pyinstaller_reruns_when_input_changes(project):
+    build_config, pyi_config = project
+    run_pyinstaller(build_config, pyi_config)
+
+    (Path(build_config["pyd_path"]) / "mod.pyd").write_bytes(b"new module")
+    assert run_pyinstaller(build_config, pyi_config) is True
+    # manifest 처럼 '.' 으로 시작하는 파일은 결과물에 들어가지 않으므로 무시한다
+    manifest = Path(build_config["pyd_path"]) / ".py2pyd_manifest.json"
+    manifest.write_text("{}", encoding="utf-8")
+    assert run_pyinstaller(build_config, pyi_config) is False
+
+
+def test_pyinstaller_reruns_when_dist_missing(project):
+    build_config, pyi_config = project
+    run_pyinstaller(build_config, pyi_config)
+
+    for path in (Path(build_config["project_path"]) / "dist" / "App").iterdir():
+        path.unlink()
+    (Path(build_config["project_path"]) / "dist" / "App").rmdir()
+    assert run_pyinstaller(build_config, pyi_config) is True
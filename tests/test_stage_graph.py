@@ -0,0 +1,69 @@
+import threading
+
+import pytest
+
+from hginstaller.stage_graph import Stage, run_stages
+from hginstaller.trace import get_tracer
+
+
+def test_stages_run_after_their_inputs():
+    order = []
+    stages = [
+        Stage(
+            "pyinstaller",
+            lambda: order.append("pyinstaller"),
+            inputs=["spec", "pyd"],
+            outputs=["dist"],
+        ),
+        Stage("py2pyd", lambda: order.append("py2pyd"), inputs=["src"], outputs=["pyd"]),
+        Stage("pyi_spec", lambda: order.append("pyi_spec"), outputs=["spec"]),
+    ]
+    by_name = run_stages(stages)
+    assert order[-1] == "pyinstaller"
+    assert by_name["pyinstaller"].deps == ["py2pyd", "pyi_spec"]
+
+
+def test_failed_stage_skips_dependents():
+    def _fail():
+        raise RuntimeError("boom")
+
+    ran = []
+    stages = [
+        Stage("a", _fail, outputs=["x"]),
+        Stage("b", lambda: ran.append("b"), inputs=["x"]),
+    ]
+    with pytest.raises(RuntimeError):
+        run_stages(stages)
+    assert ran == []
+
+
+def test_concurrent_stage_output_is_prefixed(capsys):
+    # 두 stage 가 동시에 실행되도록 서로를 기다리게 한다
+    barrier = threading.Barrier(2)
+
+    def _stage(name):
+        def _run():
+            print(f"{name} start", end="")
+            barrier.wait(timeout=5)
+            print(" / done")
+        return _run
+
+    run_stages([Stage("a", _stage("a")), Stage("b", _stage("b"))])
+    lines = sorted(capsys.readouterr().out.splitlines())
+    assert lines == ["[a] a start / done", "[b] b start / done"]
+
+
+def test_serial_run_is_not_prefixed(capsys):
+    run_stages([Stage("a", lambda: print("hello")), Stage("b", lambda: None)], max_workers=1)
+    assert capsys.readouterr().out == "hello\n"
+
+
+def test_each_stage_records_one_span():
+    stages = [
+        Stage("a", lambda: None, outputs=["x"]),
+        Stage("b", lambda: None, inputs=["x"]),
+    ]
+    with get_tracer().session(True):
+        run_stages(stages)
+        events = [(e["cat"], e["name"]) for e in get_tracer().events]
+    assert sorted(events) == [("stage", "a"), ("stage", "b")]
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from hginstaller.startup_profile import parse_importtime, summarize_imports
+
+SAMPLE = Path(__file__).parent / "data" / "importtime.txt"
+
+
+def _records(extension_modules=None):
+    lines = SAMPLE.read_text(encoding="utf-8").splitlines()
+    return parse_importtime(lines, extension_modules)
+
+
+def test_parse_importtime_nested_entries():
+    records = {record.name: record for record in _records()}
+
+    assert len(records) == 11
+    # 들여쓰기 두 칸이 한 단계
+    assert records["_codecs"].depth == 2
+    assert records["app.core"].depth == 1
+    assert records["app"].depth == 0
+    assert (records["app.core"].self_us, records["app.core"].cumulative_us) == (150, 2319)
+    # 같은 모듈이 다시 나오면 처음 것만 쓴다
+    assert records["app.util"].self_us == 90
+
+
+def test_compiled_from_origin_or_extension_names():
+    compiled = {record.name for record in _records() if record.compiled}
+    assert compiled == {"app.fast"}
+
+    # origin 기록이 없는 모듈은 dist 에서 찾은 확장 모듈 이름으로 판단한다
+    compiled = {record.name for record in _records({"numpy", "app.core"}) if record.compiled}
+    assert compiled == {"app.fast", "numpy", "app.core"}
+
+
+def test_summarize_ranks_by_self_time():
+    summary = summarize_imports(_records(), top=3)
+
+    assert [record.name for record in summary["slowest"]] == ["app.fast", "numpy", "encodings"]
+    assert summary["total_import_us"] == 6184
+    assert summary["compiled_us"] == 2100
+    assert summary["packages"][0] == {"package": "app", "self_us": 2640, "modules": 4}
+    assert [p["package"] for p in summary["packages"]] == ["app", "encodings", "numpy"]
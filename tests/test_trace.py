@@ -0,0 +1,28 @@
+from hginstaller.trace import Tracer
+
+
+def test_session_does_not_leak_events_between_runs():
+    tracer = Tracer()
+    for _ in range(2):
+        with tracer.session(True):
+            with tracer.span("stage"):
+                pass
+            assert len(tracer.events) == 1
+    # 세션이 끝나면 들어오기 전 상태(꺼짐) 로 돌아간다
+    assert not tracer.enabled
+    assert tracer.events == []
+
+
+def test_session_restores_enabled_tracer():
+    tracer = Tracer()
+    tracer.enable()
+    with tracer.span("outer"):
+        pass
+    with tracer.session(False):
+        # 환경변수 등으로 이미 켜져 있으면 trace=False 여도 기록한다
+        assert tracer.enabled
+        with tracer.span("inner"):
+            pass
+        assert [e["name"] for e in tracer.events] == ["inner"]
+    assert tracer.enabled
+    assert [e["name"] for e in tracer.events] == ["outer"]
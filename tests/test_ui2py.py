@@ -0,0 +1,52 @@
+import os
+from pathlib import Path
+
+from hginstaller import ui2py
+from hginstaller.fingerprint import STATE_FILENAME
+from hginstaller.ui2py import convert_all_ui_files_in_directory
+
+
+def _set_mtime(path: Path, seconds: float) -> None:
+    os.utime(path, (seconds, seconds))
+
+
+def test_state_is_kept_out_of_source_tree(tmp_path: Path, stub_tools):
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "form.ui").write_text("<ui/>", encoding="utf-8")
+    build_src = tmp_path / "build_src"
+
+    result = convert_all_ui_files_in_directory(src, state_dir=build_src)
+
+    assert result.converted == [str(src / "form.ui")]
+    assert sorted(p.name for p in src.iterdir()) == ["form.ui", "form_ui.py"]
+    assert (build_src / STATE_FILENAME).is_file()
+
+
+def test_hash_only_when_stat_changes(tmp_path: Path, stub_tools, monkeypatch):
+    src = tmp_path / "src"
+    src.mkdir()
+    ui_file = src / "form.ui"
+    ui_file.write_text("<ui/>", encoding="utf-8")
+    build_src = tmp_path / "build_src"
+    convert_all_ui_files_in_directory(src, state_dir=build_src)
+
+    hashed = []
+    original = ui2py.hash_file
+    monkeypatch.setattr(ui2py, "hash_file", lambda path: hashed.append(path) or original(path))
+
+    # 변경 없음: 다시 읽지도 않는다
+    assert convert_all_ui_files_in_directory(src, state_dir=build_src).skipped == [str(ui_file)]
+    assert hashed == []
+
+    # _ui.py 보다 최신으로 touch 만 함: 해시는 다시 구하지만 내용이 같으므로 건너뛴다
+    _set_mtime(src / "form_ui.py", 1_000_000)
+    _set_mtime(ui_file, 2_000_000)
+    assert convert_all_ui_files_in_directory(src, state_dir=build_src).skipped == [str(ui_file)]
+    assert hashed == [str(ui_file)]
+
+    # 내용이 바뀌면 다시 변환한다
+    ui_file.write_text("<ui version='2'/>", encoding="utf-8")
+    _set_mtime(src / "form_ui.py", 1_000_000)
+    _set_mtime(ui_file, 3_000_000)
+    assert convert_all_ui_files_in_directory(src, state_dir=build_src).converted == [str(ui_file)]
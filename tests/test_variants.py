@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from hginstaller.variants import VARIANT_DIR, validate_variants
+
+
+def test_validate_variants_rejects_bad_names_and_keys():
+    validate_variants({"portable": {"output_type": "onefile"}, "old": None})
+    with pytest.raises(ValueError):
+        validate_variants({"../x": {}})
+    with pytest.raises(ValueError):
+        validate_variants({"portable": {"program_name": "Other"}})
+
+
+def test_run_variants_use_separate_spec_work_and_dist(tmp_path: Path, stub_tools, capsys):
+    from synthetic import make_project
+
+    from hginstaller import HgInstaller
+
+    project = make_project(tmp_path / "project", modules=2, depth=1)
+    HgInstaller.set_iss_path(str(stub_tools["iscc"]))
+    installer = HgInstaller("App", str(project), "init")
+    installer.add_config(
+        variants={"portable": {"output_type": "onefile"}, "debug": {"console_mode": False}}
+    )
+
+    results = installer.run_variants(py2pyd=False)
+    assert {r.name: r.status for r in results} == {"portable": "built", "debug": "built"}
+
+    build_src = project / "build_src"
+    specs = {}
+    for name in ("portable", "debug"):
+        variant_dir = build_src / VARIANT_DIR / name
+        specs[name] = (variant_dir / "App.spec").read_text(encoding="utf-8")
+        assert (variant_dir / "work" / "App").is_dir()
+        assert (project / "dist" / name / "App").is_dir()
+    assert "--onefile" in specs["portable"] and "--onefile" not in specs["debug"]
+    # 기본 빌드의 spec / dist 는 건드리지 않는다
+    assert not (build_src / "App.spec").exists()
+    assert not (project / "dist" / "App").exists()
+
+    results = installer.run_variants(py2pyd=False)
+    assert {r.status for r in results} == {"up to date"}
@@ -0,0 +1,29 @@
+import threading
+from pathlib import Path
+
+from hginstaller.watcher import PollingBackend, wait_for_changes
+
+
+def test_polling_batches_changes(tmp_path: Path):
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "keep.py").write_text("A = 1\n", encoding="utf-8")
+    backend = PollingBackend([tmp_path], interval=0.2)
+
+    (tmp_path / "keep.py").write_text("A = 2\n", encoding="utf-8")
+    (tmp_path / "notes.txt").write_text("not watched\n", encoding="utf-8")
+    # 첫 변경을 감지한 뒤 debounce 동안 생긴 변경도 같은 묶음으로 돌려준다
+    late = threading.Timer(
+        0.25, lambda: (tmp_path / "pkg" / "form.ui").write_text("<ui/>\n", encoding="utf-8")
+    )
+    late.start()
+    try:
+        changed = wait_for_changes(backend, debounce=0.2, timeout=5)
+    finally:
+        late.join()
+    assert changed == {tmp_path / "keep.py", tmp_path / "pkg" / "form.ui"}
+
+    # 변경이 없으면 timeout 뒤 빈 set
+    assert wait_for_changes(backend, debounce=0.2, timeout=0.3) == set()
+
+    (tmp_path / "keep.py").unlink()
+    assert wait_for_changes(backend, debounce=0.2, timeout=5) == {tmp_path / "keep.py"}